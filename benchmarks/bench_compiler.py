@@ -0,0 +1,58 @@
+"""
+Benchmark compiled expressions against zipping together
+the iterators of rolling objects.
+
+Usage:
+
+    python -m benchmarks.bench_compiler
+
+"""
+import random
+import timeit
+
+import rolling
+
+N = 200000
+
+
+def zscore_zipped(data):
+    for x, mean, std in zip(
+        data[19:], rolling.Mean(data, 20), rolling.Std(data, 20)
+    ):
+        yield (x - mean) / std
+
+
+def spread_zipped(data):
+    for high, low in zip(rolling.Max(data, 50), rolling.Min(data, 50)):
+        yield high - low
+
+
+BENCHMARKS = [
+    ("(x - mean(x, 20)) / std(x, 20)", zscore_zipped),
+    ("max(x, 50) - min(x, 50)", spread_zipped),
+]
+
+
+def bench(function, data):
+    def run():
+        for _ in function(data):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    data = [random.random() for _ in range(N)]
+    print("{:<34}{:>10}{:>10}".format("expression", "zipped", "compiled"))
+    for expression, zipped in BENCHMARKS:
+        compiled = rolling.compile(expression)
+        print(
+            "{:<34}{:>10.3f}{:>10.3f}".format(
+                expression, bench(zipped, data), bench(compiled, data)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
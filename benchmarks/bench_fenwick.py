@@ -0,0 +1,44 @@
+"""
+Benchmark Median over bounded integers using the Fenwick
+tree histogram (domain=...) against the sorted collections.
+
+Usage:
+
+    python -m benchmarks.bench_fenwick
+
+"""
+import random
+import timeit
+
+import rolling
+
+N = 100000
+DOMAIN = (0, 10000)
+WINDOW_SIZES = [50, 500, 5000, 50000]
+ENGINES = [
+    ("skiplist", {"algorithm": "skiplist"}),
+    ("sortedblocks", {"algorithm": "sortedblocks"}),
+    ("fenwick", {"domain": DOMAIN}),
+]
+
+
+def bench(data, window_size, kwargs):
+    def run():
+        for _ in rolling.Median(data, window_size, **kwargs):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    data = [random.randint(*DOMAIN) for _ in range(N)]
+    names = [name for name, _ in ENGINES]
+    print(("{:>8}" + "{:>14}" * len(names)).format("k", *names))
+    for window_size in WINDOW_SIZES:
+        seconds = [bench(data, window_size, kwargs) for _, kwargs in ENGINES]
+        print(("{:>8}" + "{:>14.3f}" * len(names)).format(window_size, *seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark Nunique, Mode and Entropy at high cardinality.
+
+The window values are drawn from a large set of distinct ids
+so that the frequency table holds tens of thousands of items.
+
+Usage:
+
+    python -m benchmarks.bench_frequency
+
+"""
+import random
+import timeit
+
+import rolling
+
+N = 200000
+WINDOW_SIZES = [1000, 50000]
+CARDINALITIES = [100, 50000]
+
+
+def bench(cls, data, window_size):
+    def run():
+        for _ in cls(data, window_size):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    print("{:<10} {:>8} {:>12} {:>12}".format("class", "k", "distinct", "seconds"))
+    for distinct in CARDINALITIES:
+        data = [random.randrange(distinct) for _ in range(N)]
+        for window_size in WINDOW_SIZES:
+            for cls in (rolling.Nunique, rolling.Mode, rolling.Entropy):
+                seconds = bench(cls, data, window_size)
+                print(
+                    "{:<10} {:>8} {:>12} {:>12.3f}".format(
+                        cls.__name__, window_size, distinct, seconds
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark the Median algorithms over a range of window sizes.
+
+Usage:
+
+    python -m benchmarks.bench_median
+
+"""
+import random
+import timeit
+
+import rolling
+
+N = 100000
+WINDOW_SIZES = [5, 50, 500, 5000, 50000]
+ALGORITHMS = ["skiplist", "heaps", "sortedblocks"]
+
+
+def bench(data, window_size, algorithm):
+    def run():
+        for _ in rolling.Median(data, window_size, algorithm=algorithm):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    data = [random.random() for _ in range(N)]
+    print(("{:>8}" + "{:>14}" * len(ALGORITHMS)).format("k", *ALGORITHMS))
+    for window_size in WINDOW_SIZES:
+        seconds = [bench(data, window_size, algorithm) for algorithm in ALGORITHMS]
+        print(("{:>8}" + "{:>14.3f}" * len(ALGORITHMS)).format(window_size, *seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark Apply with an expensive operation, serially and
+using a process pool with different batch sizes.
+
+Usage:
+
+    python -m benchmarks.bench_parallel
+
+"""
+import os
+import random
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+import rolling
+
+N = 20000
+WINDOW_SIZE = 200
+BATCHES = [1, 16, 128]
+
+
+def expensive(window):
+    "A deliberately slow function of the window"
+    values = sorted(window)
+    total = 0
+    for i, value in enumerate(values):
+        total += value * (2 * i - len(values) + 1)
+    return sum(v ** 0.5 for v in values) + total
+
+
+def bench(data, **kwargs):
+    def run():
+        for _ in rolling.Apply(data, WINDOW_SIZE, operation=expensive, **kwargs):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    data = [random.random() for _ in range(N)]
+    workers = os.cpu_count() or 1
+    print("{:>12}{:>12.3f}".format("serial", bench(data)))
+    with ProcessPoolExecutor(workers) as executor:
+        for batch in BATCHES:
+            seconds = bench(data, executor=executor, batch=batch, prefetch=batch * 64)
+            print("{:>12}{:>12.3f}".format("batch={}".format(batch), seconds))
+
+
+if __name__ == "__main__":
+    main()
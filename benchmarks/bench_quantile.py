@@ -0,0 +1,53 @@
+"""
+Benchmark the exact and approximate Quantile algorithms
+over a range of window sizes, reporting the time taken and
+the number of values held in memory.
+
+Usage:
+
+    python -m benchmarks.bench_quantile
+
+"""
+import random
+import timeit
+
+import rolling
+
+N = 300000
+WINDOW_SIZES = [1000, 10000, 100000]
+Q = [0.05, 0.5, 0.95]
+EPS = [0.01, 0.05]
+
+
+def bench(data, window_size, **kwargs):
+    def run():
+        for _ in rolling.Quantile(data, window_size, q=Q, **kwargs):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def stored(data, window_size, eps):
+    r = rolling.Quantile(data, window_size, q=Q, approximate=True, eps=eps)
+    for _ in r:
+        pass
+    sketch = r._sketch
+    return len(sketch._samples) + sum(len(level) for level in sketch._levels)
+
+
+def main():
+    random.seed(0)
+    data = [random.random() for _ in range(N)]
+    columns = ["exact"] + ["eps={}".format(eps) for eps in EPS]
+    print(("{:>8}" + "{:>20}" * len(columns)).format("k", *columns))
+    for window_size in WINDOW_SIZES:
+        cells = ["{:.3f}s {:>8}".format(bench(data, window_size), window_size)]
+        for eps in EPS:
+            seconds = bench(data, window_size, approximate=True, eps=eps)
+            values = stored(data, window_size, eps)
+            cells.append("{:.3f}s {:>8}".format(seconds, values))
+        print(("{:>8}" + "{:>20}" * len(columns)).format(window_size, *cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark building and sliding an IndexableSkiplist.
+
+Usage:
+
+    python -m benchmarks.bench_skiplist
+
+"""
+import random
+import timeit
+
+from rolling.structures.skiplist import IndexableSkiplist
+
+WINDOW_SIZES = [100, 10000, 100000]
+STEPS = 50000
+
+
+def bench_build_insert(values):
+    def run():
+        skiplist = IndexableSkiplist(len(values))
+        for value in values:
+            skiplist.insert(value)
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def bench_build_from_sorted(values):
+    def run():
+        IndexableSkiplist.from_sorted(sorted(values))
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def bench_slide(values, new_values):
+    def run():
+        skiplist = IndexableSkiplist.from_sorted(sorted(values))
+        window = list(values)
+        for i, new in enumerate(new_values):
+            skiplist.remove(window[i % len(window)])
+            skiplist.insert(new)
+            window[i % len(window)] = new
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    new_values = [random.random() for _ in range(STEPS)]
+    print(
+        "{:>8} {:>14} {:>14} {:>14}".format(
+            "k", "insert build", "from_sorted", "slide x{}".format(STEPS)
+        )
+    )
+    for window_size in WINDOW_SIZES:
+        values = [random.random() for _ in range(window_size)]
+        print(
+            "{:>8} {:>14.3f} {:>14.3f} {:>14.3f}".format(
+                window_size,
+                bench_build_insert(values),
+                bench_build_from_sorted(values),
+                bench_slide(values, new_values),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
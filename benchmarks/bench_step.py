@@ -0,0 +1,40 @@
+"""
+Benchmark Median and Std with a window of 1000 values,
+returning a value every step values.
+
+Usage:
+
+    python -m benchmarks.bench_step
+
+"""
+import random
+import timeit
+
+import rolling
+
+N = 200000
+WINDOW_SIZE = 1000
+STEPS = [1, 10, 100, 1000, 5000]
+CLASSES = [rolling.Median, rolling.Std]
+
+
+def bench(cls, data, step):
+    def run():
+        for _ in cls(data, WINDOW_SIZE, step=step):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main():
+    random.seed(0)
+    data = [random.random() for _ in range(N)]
+    names = [cls.__name__ for cls in CLASSES]
+    print(("{:>8}" + "{:>12}" * len(names)).format("step", *names))
+    for step in STEPS:
+        seconds = [bench(cls, data, step) for cls in CLASSES]
+        print(("{:>8}" + "{:>12.3f}" * len(names)).format(step, *seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import pytest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def pytest_collection_modifyitems(config, items):
+    # CorrMatrix requires NumPy, so skip its doctests without it
+    if numpy is not None:
+        return
+    skip = pytest.mark.skip(reason="NumPy is not installed")
+    for item in items:
+        if item.nodeid.startswith("rolling/matrix.py::"):
+            item.add_marker(skip)
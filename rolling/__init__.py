@@ -1,6 +1,29 @@
-from .apply import Apply
-from .arithmetic import Sum, Product, Nunique
+from .apply import Apply, Reduce, Incremental
+from .compiler import compile
+from .hashing import Hash
+from .arithmetic import Sum, Product, Nunique, WMA
 from .entropy import Entropy
+from .ewm import EWMean, EWVar, EWStd
 from .logical import All, Any
+from .matrix import CorrMatrix
 from .minmax import Min, Max, MinHeap
-from .stats import Mean, Var, Std, Median, Mode, Skew, Kurtosis
+from .stats import (
+    Mean,
+    WeightedMean,
+    VWAP,
+    Var,
+    Std,
+    Median,
+    Quantile,
+    Rank,
+    TrimmedMean,
+    WinsorizedMean,
+    MAD,
+    Mode,
+    Skew,
+    Kurtosis,
+    Cov,
+    Corr,
+    LinReg,
+)
+from .structures.lru import LRU
@@ -1,7 +1,38 @@
 from collections import deque
 from itertools import islice
+from operator import add
 
 from .base import RollingObject
+from .structures.mirrored import MirroredBuffer
+
+# Mersenne prime modulus and base for the rolling hash of windows
+_MOD = (1 << 61) - 1
+_BASE = 1000003
+
+_MISSING = object()
+
+
+class _WindowKey(object):
+    """
+    Key for caching the result of an operation on a window,
+    hashed by the rolling hash of the window and compared
+    by the values of the window
+    """
+
+    __slots__ = ("hash", "values")
+
+    def __init__(self, hash, values):
+        self.hash = hash
+        self.values = values
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        # only called when the hashes are equal, to rule out collisions
+        return len(self.values) == len(other.values) and all(
+            a == b for a, b in zip(self.values, other.values)
+        )
 
 
 class Apply(RollingObject):
@@ -18,6 +49,20 @@ class Apply(RollingObject):
     operation : callable, default sum
         a function, or class implementing a __call__
         method, to be applied to each window
+    cache : LRU, optional
+        if given, results of the operation are stored in
+        the cache and reused for windows with the same values
+        (see Notes)
+    view : str, optional
+        an array typecode (e.g. 'd' for floats or 'q' for
+        integers). If given, the window is passed to the
+        operation as a contiguous memoryview of an array
+        with this typecode instead of a deque (see Notes)
+    executor : concurrent.futures.Executor, optional
+        if given, the operation is applied to the windows in
+        batches using the executor (e.g. a ProcessPoolExecutor),
+        see ParallelApply for details and the prefetch and
+        batch arguments (cannot be used with cache)
 
     Complexity
     ----------
@@ -27,6 +72,31 @@ class Apply(RollingObject):
 
     where k is the size of the rolling window
 
+    Notes
+    -----
+
+    If a cache is given, a polynomial rolling hash of the
+    window values (modulo 2**61 - 1) is updated in O(1) time
+    on each step and used as the cache key. Values in the
+    window must be hashable. When a key is found, the window
+    values are compared with those of the cached window, so
+    a hash collision cannot return a wrong result. The hits
+    and misses attributes of the cache count how often the
+    operation was avoided.
+
+    The operation should return the same result for windows
+    with equal values, and should not change the window.
+
+    If view is given, the values are stored twice in an array
+    of size 2k so that the window is always contiguous, and
+    the operation is passed a memoryview of the window without
+    copying any values. This suits operations that need a
+    buffer or a sequence supporting slicing, such as
+    numpy.frombuffer(), struct or bytes(). The memoryview is
+    read-only (on Python 3.8+) and is only valid until the
+    next step: to keep the values, the operation must copy
+    them (e.g. with tolist() or bytes()).
+
     Examples
     --------
 
@@ -48,28 +118,96 @@ class Apply(RollingObject):
      [6, 3, 1, 1],
      [5, 6, 3, 1]]
 
+    Cache the results of an expensive operation:
+
+    >>> cache = rolling.LRU(maxsize=100)
+    >>> r_sorted = rolling.Apply('abaabaab', 3, operation=sorted, cache=cache)
+    >>> list(r_sorted)[:3]
+    [['a', 'a', 'b'], ['a', 'a', 'b'], ['a', 'a', 'b']]
+    >>> cache.hits, cache.misses
+    (3, 3)
+
+    Pass a contiguous view of the window to the operation:
+
+    >>> r_list = rolling.Apply([1.5, 2.0, 3.5, 4.0], 2, operation=list, view='d')
+    >>> list(r_list)
+    [[1.5, 2.0], [2.0, 3.5], [3.5, 4.0]]
+
     """
 
-    def _init_fixed(self, iterable, window_size, operation=sum, **kwargs):
-        head = islice(self._iterator, window_size - 1)
-        self._buffer = deque(head, maxlen=window_size)
+    def __new__(
+        cls, iterable, window_size=None, window_type="fixed", executor=None, **kwargs
+    ):
+        if executor is not None:
+            if kwargs.get("cache") is not None:
+                raise ValueError("cache and executor cannot be used together")
+            return ParallelApply(
+                iterable,
+                window_size,
+                window_type=window_type,
+                executor=executor,
+                **kwargs
+            )
+        return super().__new__(cls, iterable, window_size, window_type, **kwargs)
+
+    def _init_fixed(
+        self, iterable, window_size, operation=sum, cache=None, view=None, **kwargs
+    ):
+        self._init_buffer(window_size, view)
         self._operation = operation
+        self._init_cache(window_size, cache)
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
 
-    def _init_variable(self, iterable, window_size, operation=sum, **kwargs):
-        self._buffer = deque(maxlen=window_size)
+    def _init_variable(
+        self, iterable, window_size, operation=sum, cache=None, view=None, **kwargs
+    ):
+        self._init_buffer(window_size, view)
         self._operation = operation
+        self._init_cache(window_size, cache)
+
+    def _init_buffer(self, window_size, view):
+        self._view = view
+        if view is None:
+            self._buffer = deque(maxlen=window_size)
+        else:
+            self._buffer = MirroredBuffer(view, window_size)
+
+    def _init_cache(self, window_size, cache):
+        self._cache = cache
+        self._hash = 0
+        # the factor of the oldest value in the hash of a full window
+        self._power = pow(_BASE, window_size - 1, _MOD)
 
     @property
     def current_value(self):
-        return self._operation(self._buffer)
+        window = self._buffer if self._view is None else self._buffer.view()
+        if self._cache is None:
+            return self._operation(window)
+
+        value = self._cache.get(_WindowKey(self._hash, window), _MISSING)
+        if value is _MISSING:
+            value = self._operation(window)
+            self._cache.put(_WindowKey(self._hash, tuple(self._buffer)), value)
+        return value
 
     def _add_new(self, new):
         self._buffer.append(new)
+        if self._cache is not None:
+            self._hash = (self._hash * _BASE + hash(new)) % _MOD
 
     def _remove_old(self):
-        self._buffer.popleft()
+        old = self._buffer.popleft()
+        if self._cache is not None:
+            power = pow(_BASE, len(self._buffer), _MOD)
+            self._hash = (self._hash - hash(old) * power) % _MOD
 
     def _update_window(self, new):
+        if self._cache is not None:
+            # remove the oldest value from the hash if the window is full
+            if len(self._buffer) == self.window_size:
+                self._hash -= hash(self._buffer[0]) * self._power
+            self._hash = (self._hash * _BASE + hash(new)) % _MOD
         self._buffer.append(new)
 
     @property
@@ -80,3 +218,373 @@ class Apply(RollingObject):
         return "Rolling(operation='{}', window_size={}, window_type='{}')".format(
             self._operation.__name__, self.window_size, self.window_type
         )
+
+
+def _apply_batch(operation, windows):
+    "Apply the operation to each window of a batch (run by the executor)"
+    return [operation(window) for window in windows]
+
+
+class ParallelApply(object):
+    """
+    Iterator object that applies a function to a rolling
+    window over a Python iterable, using an executor to
+    apply the function to many windows at once.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    window_type : str, 'fixed' or 'variable'
+    operation : callable, default sum
+        a function to be applied to each window, which
+        must be picklable if the executor uses processes
+    executor : concurrent.futures.Executor
+        e.g. a ProcessPoolExecutor or ThreadPoolExecutor
+    prefetch : int, default 256
+        the largest number of windows submitted to the
+        executor whose results have not yet been returned
+    batch : int, default 16
+        the number of windows submitted to the executor in
+        each task
+    step : int, default 1, apply the operation to every
+        step-th window only
+
+    Complexity
+    ----------
+
+    Update time:  operation dependent (divided between workers)
+    Memory usage: O(k * prefetch)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    Each window is copied to a tuple, and the tuples are sent
+    to the executor in batches so that the cost of pickling
+    the operation and transferring the results is shared by
+    the windows of the batch. Results are returned in the
+    order of the windows. At most prefetch // batch batches
+    (and at least one) are submitted at a time, so memory use
+    is bounded however long the iterable is.
+
+    The executor is not shut down when iteration finishes.
+
+    Examples
+    --------
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> import rolling
+    >>> with ThreadPoolExecutor(2) as executor:
+    ...     r_sum = rolling.Apply(range(6), 3, operation=sum, executor=executor)
+    ...     list(r_sum)
+    [3, 6, 9, 12]
+
+    """
+
+    def __init__(
+        self,
+        iterable,
+        window_size,
+        window_type="fixed",
+        operation=sum,
+        executor=None,
+        prefetch=256,
+        batch=16,
+        view=None,
+        step=1,
+    ):
+        for name, value in (("prefetch", prefetch), ("batch", batch)):
+            if not isinstance(value, int):
+                raise TypeError(
+                    "{} must be integer type, got {}".format(
+                        name, type(value).__name__
+                    )
+                )
+            if value <= 0:
+                raise ValueError("{} must be positive".format(name))
+
+        self.window_type = window_type
+        self.window_size = window_size
+        self.prefetch = prefetch
+        self.batch = batch
+        self._operation = operation
+        self._executor = executor
+        windows = Apply(
+            iterable,
+            window_size,
+            window_type=window_type,
+            operation=tuple,
+            view=view,
+            step=step,
+        )
+        self._results = self._apply(windows)
+
+    def _apply(self, windows):
+        """
+        Submit batches of windows to the executor and yield
+        their results in order
+        """
+        max_batches = max(1, self.prefetch // self.batch)
+        pending = deque()
+        while True:
+            while len(pending) < max_batches:
+                windows_batch = list(islice(windows, self.batch))
+                if not windows_batch:
+                    break
+                pending.append(
+                    self._executor.submit(_apply_batch, self._operation, windows_batch)
+                )
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._results)
+
+    def __repr__(self):
+        return "Rolling(operation='{}', window_size={}, window_type='{}')".format(
+            self._operation.__name__, self.window_size, self.window_type
+        )
+
+
+class Reduce(RollingObject):
+    """
+    Iterator object that reduces a rolling window over
+    a Python iterable using an associative operation.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    operation : callable, default operator.add
+        a function of two arguments that is associative,
+        i.e. operation(a, operation(b, c)) is equal to
+        operation(operation(a, b), c)
+    identity : default 0
+        the identity value of the operation, i.e.
+        operation(identity, x) and operation(x, identity)
+        are both equal to x
+
+    Complexity
+    ----------
+
+    Update time:  O(1) (amortised)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The window is kept in two stacks. New values are pushed on
+    to the back stack, which tracks the reduction of all of its
+    values. Old values are popped from the front stack, which
+    stores the reduction of each value with all of the values
+    above it. When the front stack is empty, the back stack is
+    reversed on to it, so each value is combined at most three
+    times and the operation never needs an inverse [1].
+
+    The operation need not be commutative: values are always
+    combined in the order in which they are in the window.
+
+    [1] Tangwongsan, Hirzel and Schneider (2017), "Low-latency
+        sliding-window aggregation in worst-case constant time"
+
+    Examples
+    --------
+
+    >>> import math
+    >>> import rolling
+    >>> seq = (12, 18, 8, 20, 30, 45)
+    >>> r_gcd = rolling.Reduce(seq, 3, operation=math.gcd, identity=0)
+    >>> list(r_gcd)
+    [2, 2, 2, 5]
+    >>> r_cat = rolling.Reduce('abcde', 3, operation=str.__add__, identity='')
+    >>> list(r_cat)
+    ['abc', 'bcd', 'cde']
+
+    """
+
+    def _init_fixed(self, iterable, window_size, operation=add, identity=0, **kwargs):
+        self._operation = operation
+        self._identity = identity
+        self._front = []
+        # the identity is a dummy value removed on the first update
+        self._back = [identity]
+        self._back_value = identity
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+    def _init_variable(
+        self, iterable, window_size, operation=add, identity=0, **kwargs
+    ):
+        self._operation = operation
+        self._identity = identity
+        self._front = []
+        self._back = []
+        self._back_value = identity
+
+    def _add_new(self, new):
+        self._back.append(new)
+        self._back_value = self._operation(self._back_value, new)
+
+    def _remove_old(self):
+        if not self._front:
+            # move the back stack on to the front stack, so that
+            # the oldest value is on top
+            operation = self._operation
+            value = self._identity
+            front = self._front
+            for item in reversed(self._back):
+                value = operation(item, value)
+                front.append(value)
+            self._back = []
+            self._back_value = self._identity
+        self._front.pop()
+
+    def _update_window(self, new):
+        self._add_new(new)
+        self._remove_old()
+
+    @property
+    def current_value(self):
+        if self._front:
+            return self._operation(self._front[-1], self._back_value)
+        return self._back_value
+
+    @property
+    def _obs(self):
+        return len(self._front) + len(self._back)
+
+
+class Incremental(RollingObject):
+    """
+    Iterator object that computes a user-defined value of
+    a rolling window by updating a state as values are added
+    to and removed from the window.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    add : callable, add(state, new) returns the state
+        after the value new is added to the window
+    remove : callable, remove(state, old) returns the state
+        after the value old is removed from the window
+    value : callable, optional, value(state) returns the
+        value of the window (if not given, the state
+        itself is returned)
+    init : default 0, the state of an empty window
+
+    Complexity
+    ----------
+
+    Update time:  O(1) if add and remove are O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    On each step the oldest value is removed before the
+    newest value is added. The state may be any object:
+    the functions can return a new object, or change the
+    state in place and return it (in which case init is
+    changed too, so should not be shared between instances).
+
+    Examples
+    --------
+
+    Count the even values in each window:
+
+    >>> import rolling
+    >>> seq = (8, 1, 2, 3, 6, 5)
+    >>> r_even = rolling.Incremental(
+    ...     seq,
+    ...     3,
+    ...     add=lambda count, new: count + (new % 2 == 0),
+    ...     remove=lambda count, old: count - (old % 2 == 0),
+    ... )
+    >>> list(r_even)
+    [2, 1, 2, 1]
+
+    Root mean square of each window:
+
+    >>> from math import sqrt
+    >>> r_rms = rolling.Incremental(
+    ...     seq,
+    ...     2,
+    ...     add=lambda total, new: total + new * new,
+    ...     remove=lambda total, old: total - old * old,
+    ...     value=lambda total: sqrt(total / 2),
+    ... )
+    >>> next(r_rms)
+    5.70087712549569
+
+    """
+
+    def _init_fixed(
+        self, iterable, window_size, add=None, remove=None, value=None, init=0, **kwargs
+    ):
+        self._set_functions(add, remove, value, init)
+        self._buffer = deque()
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+    def _init_variable(
+        self, iterable, window_size, add=None, remove=None, value=None, init=0, **kwargs
+    ):
+        self._set_functions(add, remove, value, init)
+        self._buffer = deque()
+
+    def _reset_fixed(self, **kwargs):
+        # init may have been changed in place, so remove the values
+        # of the window from the state instead of starting again
+        while self._buffer:
+            self._remove_old()
+        for new in islice(self._iterator, self.window_size - 1):
+            self._add_new(new)
+
+    def _set_functions(self, add, remove, value, init):
+        if add is None or remove is None:
+            raise TypeError("add and remove functions must be given")
+        self._add = add
+        self._remove = remove
+        self._value = value
+        self._state = init
+
+    def _add_new(self, new):
+        self._buffer.append(new)
+        self._state = self._add(self._state, new)
+
+    def _remove_old(self):
+        old = self._buffer.popleft()
+        self._state = self._remove(self._state, old)
+
+    def _update_window(self, new):
+        # the window is only full after the first update
+        if len(self._buffer) == self.window_size:
+            self._remove_old()
+        self._add_new(new)
+
+    @property
+    def current_value(self):
+        if self._value is None:
+            return self._state
+        return self._value(self._state)
+
+    @property
+    def _obs(self):
+        return len(self._buffer)
@@ -1,7 +1,27 @@
-from collections import Counter, deque
+from collections import deque
 from itertools import islice
+from operator import mul
 
+from .apply import Reduce
 from .base import RollingObject
+from .structures.frequency import FrequencyTable
+from .structures.hyperloglog import SlidingHyperLogLog
+from .structures.nullbuffer import NullBuffer
+from .summary import SumSummary, NuniqueSummary
+
+
+def _neumaier_add(total, compensation, value):
+    """
+    Add value to a sum with Neumaier compensation, returning
+    the new total and compensation (the compensation is
+    always zero for integers)
+    """
+    new_total = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+    return new_total, compensation
 
 
 class Sum(RollingObject):
@@ -50,6 +70,12 @@ class Sum(RollingObject):
         self._buffer = deque(maxlen=window_size)
         self._sum = 0
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._buffer = NullBuffer()
+        self._sum = 0
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _update_window(self, new):
         self._sum += new - self._buffer.popleft()
         self._buffer.append(new)
@@ -69,6 +95,126 @@ class Sum(RollingObject):
     def _obs(self):
         return len(self._buffer)
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return SumSummary(self._obs, self._sum)
+
+
+class WMA(RollingObject):
+    """
+    Iterator object that computes the linearly weighted
+    moving average of a rolling window over a Python
+    iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The values of a window of n values are given weights
+    1, 2, ..., n from the oldest to the newest. The sum of
+    the values and the weighted sum are kept; when the
+    window moves on, every weight decreases by 1, so the
+    weighted sum is updated by subtracting the sum of the
+    values and adding n times the new value.
+
+    Both sums are kept with Neumaier compensation to limit
+    the rounding error of floats. Integer sums are exact.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> seq = (8, 1, 1, 3, 6, 5)
+    >>> r_wma = rolling.WMA(seq, 3)
+    >>> list(r_wma)
+    [2.1666666666666665, 2.0, 4.166666666666667, 5.0]
+
+    """
+
+    def _init_fixed(self, iterable, window_size, **kwargs):
+        self._init_sums()
+        # weight the dummy value 0 as the oldest value of a full window
+        self._buffer = deque([0], maxlen=window_size)
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+    def _init_variable(self, iterable, window_size, **kwargs):
+        self._init_sums()
+        self._buffer = deque(maxlen=window_size)
+
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._init_sums()
+        self._buffer = NullBuffer()
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
+    def _init_sums(self):
+        self._sum = 0
+        self._sum_compensation = 0
+        self._weighted_sum = 0
+        self._weighted_compensation = 0
+
+    def _add_new(self, new):
+        self._buffer.append(new)
+        self._sum, self._sum_compensation = _neumaier_add(
+            self._sum, self._sum_compensation, new
+        )
+        self._weighted_sum, self._weighted_compensation = _neumaier_add(
+            self._weighted_sum, self._weighted_compensation, self._obs * new
+        )
+
+    def _remove_old(self):
+        old = self._buffer.popleft()
+        self._subtract_sum()
+        self._sum, self._sum_compensation = _neumaier_add(
+            self._sum, self._sum_compensation, -old
+        )
+
+    def _subtract_sum(self):
+        "Decrease the weight of every value in the window by 1"
+        weighted_sum, compensation = _neumaier_add(
+            self._weighted_sum, self._weighted_compensation, -self._sum
+        )
+        self._weighted_sum, self._weighted_compensation = _neumaier_add(
+            weighted_sum, compensation, -self._sum_compensation
+        )
+
+    def _update_window(self, new):
+        old = self._buffer.popleft()
+        self._buffer.append(new)
+        # add each term separately so that no rounding error is missed
+        self._subtract_sum()
+        self._weighted_sum, self._weighted_compensation = _neumaier_add(
+            self._weighted_sum, self._weighted_compensation, self.window_size * new
+        )
+        total, compensation = _neumaier_add(self._sum, self._sum_compensation, new)
+        self._sum, self._sum_compensation = _neumaier_add(total, compensation, -old)
+
+    @property
+    def current_value(self):
+        n = self._obs
+        return (self._weighted_sum + self._weighted_compensation) / (n * (n + 1) // 2)
+
+    @property
+    def _obs(self):
+        return len(self._buffer)
+
 
 class Product(RollingObject):
     """
@@ -81,6 +227,9 @@ class Product(RollingObject):
     iterable : any iterable object
     window_size : integer, the size of the rolling
         window moving over the iterable
+    exact : bool, default False
+        if True, multiply the values of each window without
+        dividing by values leaving the window (see Notes)
 
     Complexity
     ----------
@@ -90,6 +239,18 @@ class Product(RollingObject):
 
     where k is the size of the rolling window
 
+    Notes
+    -----
+
+    By default, the product is updated by dividing by the
+    value leaving the window, which accumulates rounding error
+    for floats and turns integer products into floats.
+
+    If exact is True, the product is computed using Reduce
+    with operator.mul instead, which never divides and so
+    gives exact integer (or Fraction, or Decimal) products
+    in amortised O(1) time.
+
     Examples
     --------
 
@@ -106,6 +267,21 @@ class Product(RollingObject):
 
     """
 
+    def __new__(
+        cls, iterable, window_size=None, window_type="fixed", exact=False, **kwargs
+    ):
+        # expanding windows never divide, so are always exact
+        if exact and window_type != "expanding":
+            return Reduce(
+                iterable,
+                window_size,
+                window_type=window_type,
+                operation=mul,
+                identity=1,
+                **kwargs
+            )
+        return super().__new__(cls, iterable, window_size, window_type, **kwargs)
+
     def _init_fixed(self, iterable, window_size, **kwargs):
         head = islice(self._iterator, window_size - 1)
         self._buffer = deque(head, maxlen=window_size)
@@ -127,6 +303,13 @@ class Product(RollingObject):
         self._zero_count = 0
         self._product = 1
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._buffer = NullBuffer()
+        self._zero_count = 0
+        self._product = 1
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _update_window(self, new):
         old = self._buffer.popleft()
         self._buffer.append(new)
@@ -180,6 +363,11 @@ class Nunique(RollingObject):
     iterable : any iterable object
     window_size : integer, the size of the rolling
         window moving over the iterable
+    approximate : bool, default False
+        if True, estimate the number of unique values
+        using a sliding HyperLogLog (see ApproximateNunique)
+    precision : int, default 12, only used if approximate
+        is True (see ApproximateNunique)
 
     Complexity
     ----------
@@ -205,35 +393,130 @@ class Nunique(RollingObject):
 
     """
 
+    def __new__(
+        cls,
+        iterable,
+        window_size=None,
+        window_type="fixed",
+        approximate=False,
+        **kwargs
+    ):
+        if approximate:
+            return ApproximateNunique(
+                iterable, window_size, window_type=window_type, **kwargs
+            )
+        return super().__new__(cls, iterable, window_size, window_type, **kwargs)
+
     def _init_fixed(self, iterable, window_size, **kwargs):
         head = islice(self._iterator, window_size - 1)
         self._buffer = deque(head, maxlen=window_size)
         # append a dummy value that is removed when next() is called
         self._buffer.appendleft("dummy_value")
-        self._counter = Counter(self._buffer)
+        self._table = FrequencyTable(self._buffer)
 
     def _init_variable(self, iterable, window_size, **kwargs):
         self._buffer = deque(maxlen=window_size)
-        self._counter = Counter()
+        self._table = FrequencyTable()
 
     def _update_window(self, new):
-        # remove oldest value before appending new to buffer
-        self._remove_old()
-        self._counter[new] = self._counter.setdefault(new, 0) + 1
+        old = self._buffer.popleft()
+        self._table.decrement(old)
+        self._table.increment(new)
         self._buffer.append(new)
 
     def _add_new(self, new):
-        self._counter[new] = self._counter.setdefault(new, 0) + 1
+        self._table.increment(new)
         self._buffer.append(new)
 
     def _remove_old(self):
         old = self._buffer.popleft()
-        self._counter -= Counter([old])
+        self._table.decrement(old)
 
     @property
     def current_value(self):
-        return len(self._counter)
+        return len(self._table)
 
     @property
     def _obs(self):
         return len(self._buffer)
+
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return NuniqueSummary(frozenset(self._table))
+
+
+class ApproximateNunique(RollingObject):
+    """
+    Iterator object that estimates the number of
+    unique values in a rolling window.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    precision : int, default 12, between 4 and 16
+        the sketch uses 2**precision registers
+
+    Complexity
+    ----------
+
+    Update time:  O(1) (amortised)
+    Memory usage: O(2**p log k)
+
+    where k is the size of the rolling window and
+    p is the precision
+
+    Notes
+    -----
+
+    A sliding HyperLogLog is used so that values in the
+    window do not need to be stored. The relative standard
+    error of the estimate is about 1.04 / sqrt(2**precision)
+    (1.6% for the default precision of 12, 0.4% for 16).
+
+    Unlike Nunique, the values of the window are not stored,
+    so the window may be much larger than available memory
+    would allow.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> ids = (i % 5000 for i in range(10**6))
+    >>> r_nunique = rolling.Nunique(ids, 10**5, approximate=True)
+    >>> next(r_nunique)
+    5143
+
+    """
+
+    def _init_fixed(self, iterable, window_size, precision=12, **kwargs):
+        self._sketch = SlidingHyperLogLog(precision)
+        # add a dummy value that is removed when next() is called
+        self._sketch.add("dummy_value")
+        for new in islice(self._iterator, window_size - 1):
+            self._sketch.add(new)
+
+    def _init_variable(self, iterable, window_size, precision=12, **kwargs):
+        self._sketch = SlidingHyperLogLog(precision)
+
+    def _update_window(self, new):
+        self._sketch.add(new)
+        self._sketch.remove_oldest()
+
+    def _add_new(self, new):
+        self._sketch.add(new)
+
+    def _remove_old(self):
+        self._sketch.remove_oldest()
+
+    @property
+    def current_value(self):
+        return int(round(self._sketch.estimate()))
+
+    @property
+    def _obs(self):
+        return len(self._sketch)
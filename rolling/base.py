@@ -1,4 +1,6 @@
 import abc
+from collections import deque
+from itertools import islice
 
 
 class RollingObject(metaclass=abc.ABCMeta):
@@ -27,9 +29,31 @@ class RollingObject(metaclass=abc.ABCMeta):
     Variable-length instances must also have a self._obs
     attribute returning the current size of the window.
 
+    Subclasses supporting expanding windows (which start
+    empty and grow with every value, never removing any)
+    also implement:
+
+      _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs)
+
+    which should add the first min_periods-1 values, and must
+    not store the values of the window.
+
+    If step is not 1, an instance is created with step 1
+    and wrapped in a Hopping object which advances the
+    window step values for each value it returns.
+
     """
 
-    def __new__(cls, iterable, window_size, window_type="fixed", **kwargs):
+    def __new__(
+        cls, iterable, window_size=None, window_type="fixed", step=1, **kwargs
+    ):
+
+        if step != 1:
+            step = cls._validate_step(step)
+            rolling_object = cls(
+                iterable, window_size, window_type=window_type, **kwargs
+            )
+            return Hopping(rolling_object, step, **kwargs)
 
         if window_type == "fixed":
             cls.__init__ = cls._init_fixed
@@ -39,13 +63,23 @@ class RollingObject(metaclass=abc.ABCMeta):
             cls.__init__ = cls._init_variable
             cls.__next__ = cls._next_variable
 
+        elif window_type == "expanding":
+            cls.__init__ = cls._init_expanding
+            cls.__next__ = cls._next_expanding
+
         else:
             raise ValueError("Unknown window_type '{}'".format(window_type))
 
         self = super().__new__(cls)
 
         self.window_type = window_type
-        self.window_size = self._validate_window_size(window_size)
+        if window_type == "expanding":
+            if window_size is not None:
+                raise ValueError("window_size must be None for expanding windows")
+            self.window_size = None
+            self._validate_min_periods(kwargs.get("min_periods", 1))
+        else:
+            self.window_size = self._validate_window_size(window_size)
         self._iterator = iter(iterable)
 
         if self.window_type == "variable":
@@ -95,6 +129,39 @@ class RollingObject(metaclass=abc.ABCMeta):
                 self._remove_old()
                 return self.current_value
 
+    def _next_expanding(self):
+        """
+        Return the next value for expanding windows
+        """
+        new = next(self._iterator)
+        self._add_new(new)
+        return self.current_value
+
+    def _advance_variable(self):
+        """
+        Move a variable-length window on by one step, as
+        _next_variable() does, without computing its value
+        """
+        if not self._filled and self._obs < self.window_size:
+            self._add_new(next(self._iterator))
+            if self._obs == self.window_size:
+                self._filled = True
+            return
+
+        try:
+            self._update_window(next(self._iterator))
+        except StopIteration:
+            if self._obs == 1:
+                raise
+            self._remove_old()
+
+    def _reset_fixed(self, **kwargs):
+        """
+        Reset a fixed-length window to the state after
+        initialisation, reading the next k-1 values
+        """
+        self._init_fixed(self._iterator, self.window_size, **kwargs)
+
     @property
     @abc.abstractmethod
     def current_value(self):
@@ -117,6 +184,14 @@ class RollingObject(metaclass=abc.ABCMeta):
         """
         pass
 
+    def _init_expanding(self, iterable, window_size=None, **kwargs):
+        """
+        Intialise as an expanding window
+        """
+        raise NotImplementedError(
+            "{} not implemented for expanding windows".format(type(self).__name__)
+        )
+
     @abc.abstractmethod
     def _remove_old(self):
         """
@@ -150,3 +225,107 @@ class RollingObject(metaclass=abc.ABCMeta):
         if k <= 0:
             raise ValueError("window_size must be positive")
         return k
+
+    @staticmethod
+    def _validate_min_periods(min_periods):
+        """
+        Check if min_periods is a positive integer
+        """
+        if not isinstance(min_periods, int):
+            raise TypeError(
+                "min_periods must be integer type, got {}".format(
+                    type(min_periods).__name__
+                )
+            )
+        if min_periods <= 0:
+            raise ValueError("min_periods must be positive")
+        return min_periods
+
+    @staticmethod
+    def _validate_step(step):
+        """
+        Check if step is a positive integer
+        """
+        if not isinstance(step, int):
+            raise TypeError(
+                "step must be integer type, got {}".format(type(step).__name__)
+            )
+        if step <= 0:
+            raise ValueError("step must be positive")
+        return step
+
+
+class Hopping(object):
+    """
+    Iterator object returning every step-th value of
+    a rolling iterator object (a hopping window).
+
+    The windows between those returned are updated as
+    usual, but their values are not computed. If the
+    window is fixed-length and step is at least the window
+    size (a tumbling window), the values between windows
+    are skipped and the window is reset for each value
+    returned, instead of removing values one at a time.
+
+    Attributes (e.g. window_size, or methods such as
+    summary()) are looked up on the wrapped object.
+
+    """
+
+    def __init__(self, rolling_object, step, **kwargs):
+        self._rolling_object = rolling_object
+        self._kwargs = kwargs
+        self.step = step
+        self._started = False
+
+        if rolling_object.window_type == "variable":
+            self._advance = rolling_object._advance_variable
+        elif rolling_object.window_type == "expanding":
+            self._advance = self._advance_expanding
+        else:
+            self._advance = self._advance_fixed
+
+        if rolling_object.window_type == "fixed" and step >= rolling_object.window_size:
+            self._next = self._next_tumbling
+        else:
+            self._next = self._next_hopping
+
+    def _advance_fixed(self):
+        rolling_object = self._rolling_object
+        rolling_object._update_window(next(rolling_object._iterator))
+
+    def _advance_expanding(self):
+        rolling_object = self._rolling_object
+        rolling_object._add_new(next(rolling_object._iterator))
+
+    def _next_hopping(self):
+        advance = self._advance
+        if self._started:
+            for _ in range(self.step - 1):
+                advance()
+        advance()
+        self._started = True
+        return self._rolling_object.current_value
+
+    def _next_tumbling(self):
+        rolling_object = self._rolling_object
+        if self._started:
+            # skip the values in no window, then read k-1 values
+            skip = self.step - rolling_object.window_size
+            deque(islice(rolling_object._iterator, skip), maxlen=0)
+            rolling_object._reset_fixed(**self._kwargs)
+        rolling_object._update_window(next(rolling_object._iterator))
+        self._started = True
+        return rolling_object.current_value
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self._next()
+
+    def __getattr__(self, name):
+        return getattr(self._rolling_object, name)
+
+    def __repr__(self):
+        return "{}, step={})".format(repr(self._rolling_object)[:-1], self.step)
@@ -0,0 +1,315 @@
+"""
+Compile expressions of rolling operations into a single loop.
+
+An expression such as "(x - mean(x, 20)) / std(x, 20)" could be
+computed by zipping together the iterators of several rolling
+objects, but each object then pays for method calls and property
+lookups on every value. Instead, compile() generates the source of
+a Python function whose loop updates the state of every operation
+inline (using the same algorithms as Sum, Mean, Var, Std, Min and
+Max), and evaluates the expression once per window.
+
+The expression may use:
+
+  - a single input variable (any name, e.g. x), standing for
+    the newest value of the window
+  - numbers and the operators + - * / // % **
+  - the rolling operations sum, mean, var, std, min and max,
+    called as op(x, window_size), where var and std also accept
+    a ddof keyword argument (default 1)
+  - the functions abs, sqrt, log and exp
+
+All windows end at the newest value, and the first result is
+given when the largest window is full.
+
+Examples
+--------
+
+>>> import rolling
+>>> spread = rolling.compile("max(x, 3) - min(x, 3)")
+>>> list(spread([3, 1, 4, 1, 5, 9, 2]))
+[3, 3, 4, 8, 7]
+
+"""
+import ast
+import builtins
+import sys
+from collections import deque
+from functools import lru_cache
+from math import exp, log, sqrt
+
+from .base import RollingObject
+
+_BINARY_OPERATORS = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+    ast.Pow: "**",
+}
+
+_UNARY_OPERATORS = {ast.USub: "-", ast.UAdd: "+"}
+
+_FUNCTIONS = {"abs": abs, "sqrt": sqrt, "log": log, "exp": exp}
+
+_WINDOW_OPERATIONS = {"sum", "mean", "var", "std", "min", "max"}
+
+
+class _Generator(object):
+    """
+    Generate the source of a function computing an expression
+    of rolling operations over an iterable
+    """
+
+    def __init__(self):
+        self.name = None  # the input variable
+        self.sums = {}  # window size -> state variable
+        self.variances = {}  # window size -> (mean, sslm) variables
+        self.minima = {}  # window size -> (values, deaths) variables
+        self.maxima = {}
+        self.n_variables = 0
+
+    def _variable(self, prefix):
+        self.n_variables += 1
+        return "_{}{}".format(prefix, self.n_variables)
+
+    def emit(self, node):
+        "Return the source of the expression at node"
+        if isinstance(node, ast.Expression):
+            return self.emit(node.body)
+
+        if isinstance(node, ast.Name):
+            return self._input(node)
+
+        if _is_number(node):
+            return repr(_number(node))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            return "({} {} {})".format(
+                self.emit(node.left),
+                _BINARY_OPERATORS[type(node.op)],
+                self.emit(node.right),
+            )
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            return "({}{})".format(
+                _UNARY_OPERATORS[type(node.op)], self.emit(node.operand)
+            )
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            name = node.func.id
+            if name in _WINDOW_OPERATIONS:
+                return self._window_operation(name, node)
+            if name in _FUNCTIONS and len(node.args) == 1 and not node.keywords:
+                return "{}({})".format(name, self.emit(node.args[0]))
+
+        raise ValueError("Unsupported expression: {}".format(ast.dump(node)))
+
+    def _input(self, node):
+        if self.name is None:
+            reserved = node.id in _FUNCTIONS or node.id in _WINDOW_OPERATIONS
+            if reserved or node.id.startswith("_"):
+                raise ValueError("Invalid input variable name '{}'".format(node.id))
+            self.name = node.id
+        elif node.id != self.name:
+            raise ValueError(
+                "Expression must have one input variable, got '{}' and '{}'".format(
+                    self.name, node.id
+                )
+            )
+        return node.id
+
+    def _window_operation(self, name, node):
+        if len(node.args) != 2 or not isinstance(node.args[0], ast.Name):
+            raise ValueError(
+                "{}() must be called with the input variable and a window "
+                "size".format(name)
+            )
+        self._input(node.args[0])
+
+        if not _is_number(node.args[1]):
+            raise ValueError("window size of {}() must be a number".format(name))
+        window_size = RollingObject._validate_window_size(_number(node.args[1]))
+
+        ddof = 1
+        for keyword in node.keywords:
+            if name not in ("var", "std") or keyword.arg != "ddof":
+                raise ValueError(
+                    "Unexpected keyword '{}' for {}()".format(keyword.arg, name)
+                )
+            if not _is_number(keyword.value):
+                raise ValueError("ddof must be a number")
+            ddof = _number(keyword.value)
+
+        if name == "sum":
+            return self._sum(window_size)
+        if name == "mean":
+            return "({} / {})".format(self._sum(window_size), window_size)
+        if name in ("var", "std"):
+            if window_size <= ddof:
+                raise ValueError("window_size must be greater than ddof")
+            _, sslm = self._variance(window_size)
+            variance = "({} / {})".format(sslm, window_size - ddof)
+            return variance if name == "var" else "sqrt{}".format(variance)
+        if name == "min":
+            return "{}[0]".format(self._extremum(self.minima, window_size)[0])
+        return "{}[0]".format(self._extremum(self.maxima, window_size)[0])
+
+    def _sum(self, window_size):
+        if window_size not in self.sums:
+            self.sums[window_size] = self._variable("sum")
+        return self.sums[window_size]
+
+    def _variance(self, window_size):
+        if window_size not in self.variances:
+            self.variances[window_size] = (
+                self._variable("mean"),
+                self._variable("sslm"),
+            )
+        return self.variances[window_size]
+
+    def _extremum(self, extrema, window_size):
+        if window_size not in extrema:
+            extrema[window_size] = (self._variable("values"), self._variable("deaths"))
+        return extrema[window_size]
+
+    def source(self, expression):
+        "Return the source of the function computing the expression"
+        x = self.name
+        stored = set(self.sums) | set(self.variances)
+        windows = stored | set(self.minima) | set(self.maxima)
+        largest = max(windows, default=1)
+        ring_size = max(stored, default=1)
+
+        lines = ["def _compiled(iterable):"]
+        add = lines.append
+
+        if stored:
+            add("    _ring = [None] * {}".format(ring_size))
+        for total in self.sums.values():
+            add("    {} = 0".format(total))
+        for mean, sslm in self.variances.values():
+            add("    {} = 0.0".format(mean))
+            add("    {} = 0.0".format(sslm))
+        for values, deaths in list(self.minima.values()) + list(self.maxima.values()):
+            add("    {} = deque()".format(values))
+            add("    {} = deque()".format(deaths))
+        add("    _i = -1")
+        add("    for {} in iterable:".format(x))
+        add("        _i += 1")
+
+        for window_size in sorted(stored):
+            total = self.sums.get(window_size)
+            variance = self.variances.get(window_size)
+
+            # update the full window, as in Sum and Var._update_window
+            add("        if _i >= {}:".format(window_size))
+            old = "_ring[(_i - {}) % {}]".format(window_size, ring_size)
+            add("            _old = {}".format(old))
+            if total:
+                add("            {} += {} - _old".format(total, x))
+            if variance:
+                mean, sslm = variance
+                add("            _delta = {} - _old".format(x))
+                add("            _delta_old = _old - {}".format(mean))
+                add("            {} += _delta / {}".format(mean, window_size))
+                add(
+                    "            {} += _delta * (_delta_old + {} - {})".format(
+                        sslm, x, mean
+                    )
+                )
+
+            # add to the filling window, as in Sum and Var._add_new
+            add("        else:")
+            if total:
+                add("            {} += {}".format(total, x))
+            if variance:
+                mean, sslm = variance
+                add("            _delta = {} - {}".format(x, mean))
+                add("            {} += _delta / (_i + 1)".format(mean))
+                add("            {} += _delta * ({} - {})".format(sslm, x, mean))
+
+        # keep ascending minima and descending maxima, as in Min and Max
+        for extrema, comparison in ((self.minima, ">="), (self.maxima, "<=")):
+            for window_size, (values, deaths) in sorted(extrema.items()):
+                add(
+                    "        while {} and {}[-1] {} {}:".format(
+                        values, values, comparison, x
+                    )
+                )
+                add("            {}.pop()".format(values))
+                add("            {}.pop()".format(deaths))
+                add("        {}.append({})".format(values, x))
+                add("        {}.append(_i + {})".format(deaths, window_size))
+                add("        if {}[0] <= _i:".format(deaths))
+                add("            {}.popleft()".format(values))
+                add("            {}.popleft()".format(deaths))
+
+        if stored:
+            add("        _ring[_i % {}] = {}".format(ring_size, x))
+        add("        if _i >= {}:".format(largest - 1))
+        add("            yield {}".format(expression))
+        return "\n".join(lines) + "\n"
+
+
+def _is_number(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return _is_number(node.operand)
+    if sys.version_info >= (3, 8):
+        value = getattr(node, "value", None)
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        return isinstance(node, ast.Constant) and is_number
+    return isinstance(node, ast.Num)
+
+
+def _number(node):
+    if isinstance(node, ast.UnaryOp):
+        return -_number(node.operand)
+    return node.value if hasattr(node, "value") else node.n
+
+
+@lru_cache(maxsize=128)
+def compile(expression):
+    """
+    Compile an expression of rolling operations into a
+    function computing the expression for each window.
+
+    Parameters
+    ----------
+
+    expression : str, the expression to compute (see the
+        module documentation for what it may contain)
+
+    Returns
+    -------
+
+    A function of an iterable, returning an iterator of the
+    value of the expression for each window. The generated
+    source of the function is available as its 'source'
+    attribute.
+
+    Notes
+    -----
+
+    Compiled functions are cached, so compiling the same
+    expression again returns the same function.
+
+    """
+    tree = ast.parse(expression.strip(), mode="eval")
+    generator = _Generator()
+    body = generator.emit(tree)
+    if generator.name is None:
+        raise ValueError("Expression must have an input variable")
+
+    source = generator.source(body)
+    namespace = {"deque": deque, "sqrt": sqrt, "log": log, "exp": exp}
+    code = builtins.compile(source, "<rolling.compile>", "exec")
+    exec(code, namespace)
+
+    function = namespace["_compiled"]
+    function.__name__ = "compiled"
+    function.__doc__ = "Compute {!r} for each window".format(expression)
+    function.source = source
+    return function
@@ -1,8 +1,8 @@
-from collections import Counter, deque
+from collections import deque
 from itertools import islice
-from math import log2
 
 from .base import RollingObject
+from .structures.frequency import FrequencyTable
 
 
 class Entropy(RollingObject):
@@ -27,6 +27,14 @@ class Entropy(RollingObject):
 
     where k is the size of the rolling window
 
+    Notes
+    -----
+
+    The frequencies of the values in the window are kept in
+    a FrequencyTable, which tracks the sum of c*log2(c) over
+    the frequencies c. The entropy of the window is computed
+    from this sum in constant time.
+
     Examples
     --------
 
@@ -47,24 +55,13 @@ class Entropy(RollingObject):
     """
 
     def _init_fixed(self, iterable, window_size, **kwargs):
-        self._entropy = 0.0
-        self._summands = {}
-
         head = islice(self._iterator, window_size - 1)
         self._buffer = deque(head, maxlen=window_size)
-
-        counts = Counter(self._buffer)
-
-        for value, count in counts.items():
-            x = count / window_size * log2(count / window_size)
-            self._summands[value] = (count, x)
-            self._entropy -= x
+        self._table = FrequencyTable(self._buffer)
 
         # insert a dummy value that is removed when next() is called
         self._buffer.appendleft("DUMMY_VALUE")
-        x = log2(1 / window_size) / window_size
-        self._summands["DUMMY_VALUE"] = (1, x)
-        self._entropy -= x
+        self._table.increment("DUMMY_VALUE")
 
     def _init_variable(self, iterable, window_size, **kwargs):
         raise NotImplementedError("Entropy not implemented for variable windows")
@@ -77,31 +74,8 @@ class Entropy(RollingObject):
         if old == new:
             return
 
-        # remove old summand's contribution to entropy
-        count, summand = self._summands[old]
-        self._entropy += summand
-
-        if count == 1:
-            del self._summands[old]
-        else:
-            p_old = (count - 1) / self.window_size
-            # readjust entropy
-            log_p_old = log2(p_old)
-            self._summands[old] = (count - 1, p_old * log_p_old)
-            self._entropy -= p_old * log_p_old
-
-        # update new summand's contribution to entropy
-        if new in self._summands:
-            count, summand = self._summands[new]
-            p_new = (count + 1) / self.window_size
-            log_p_new = log2(p_new)
-            self._summands[new] = (count + 1, p_new * log_p_new)
-            self._entropy += summand - p_new * log_p_new
-        else:
-            p_new = 1 / self.window_size
-            log_p_new = log2(p_new)
-            self._summands[new] = (1, p_new * log_p_new)
-            self._entropy -= p_new * log_p_new
+        self._table.decrement(old)
+        self._table.increment(new)
 
     def _add_new(self, new):
         pass
@@ -111,7 +85,7 @@ class Entropy(RollingObject):
 
     @property
     def current_value(self):
-        return self._entropy
+        return self._table.entropy
 
     @property
     def _obs(self):
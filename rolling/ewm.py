@@ -0,0 +1,334 @@
+from itertools import islice
+from math import exp, log, sqrt
+
+from .base import RollingObject
+
+
+def _alpha(span, halflife, alpha):
+    """
+    Return the smoothing factor alpha given by exactly
+    one of span, halflife or alpha
+    """
+    given = [value for value in (span, halflife, alpha) if value is not None]
+    if len(given) != 1:
+        raise ValueError("exactly one of span, halflife and alpha must be given")
+
+    if span is not None:
+        if span < 1:
+            raise ValueError("span must be at least 1")
+        return 2 / (span + 1)
+
+    if halflife is not None:
+        if halflife <= 0:
+            raise ValueError("halflife must be positive")
+        return 1 - exp(-log(2) / halflife)
+
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be greater than 0 and at most 1")
+    return alpha
+
+
+class ExponentiallyWeighted(RollingObject):
+    """
+    Baseclass for exponentially weighted iterator objects.
+
+    The windows are expanding (every value seen so far
+    is in the window) but the weight of each value decays
+    by a factor of (1 - alpha) with each new value, so
+    only a few running totals are stored.
+
+    If window_size is given, it is used as the span.
+
+    """
+
+    def __new__(cls, iterable, window_size=None, window_type="expanding", **kwargs):
+        if window_type != "expanding":
+            raise ValueError("{} only supports expanding windows".format(cls.__name__))
+        if window_size is not None:
+            # pass window_size on as the span (for instances created by Hopping)
+            if kwargs.get("span") is not None:
+                raise ValueError("window_size and span cannot both be given")
+            kwargs["span"] = window_size
+        return super().__new__(cls, iterable, None, window_type, **kwargs)
+
+    def _init_fixed(self, iterable, window_size, **kwargs):
+        raise NotImplementedError(
+            "{} only supports expanding windows".format(type(self).__name__)
+        )
+
+    _init_variable = _init_fixed
+
+    def _set_parameters(self, window_size, span, halflife, alpha, adjust):
+        if window_size is not None:
+            span = window_size
+        self.alpha = _alpha(span, halflife, alpha)
+        self.adjust = adjust
+        self._decay = 1 - self.alpha
+        # weight of each new value, relative to the weight of the old values
+        self._new_weight = 1.0 if adjust else self.alpha
+        self._old_weight = 0.0
+        self._nobs = 0
+
+    def _remove_old(self):
+        raise NotImplementedError("values are never removed from expanding windows")
+
+    def _update_window(self, new):
+        self._add_new(new)
+
+    @property
+    def _obs(self):
+        return self._nobs
+
+
+class EWMean(ExponentiallyWeighted):
+    """
+    Iterator object that computes the exponentially
+    weighted mean of the values of a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : number, optional, the same as span
+    span : number >= 1, optional, alpha = 2 / (span + 1)
+    halflife : number > 0, optional, the number of values
+        after which a weight halves, alpha = 1 - 2**(-1/halflife)
+    alpha : number in (0, 1], optional, the smoothing factor
+    adjust : bool, default True
+        if True, divide by the sum of the decaying weights, so
+        that the first values are not biased towards the first
+        value (see Notes)
+    min_periods : int, default 1, the number of values
+        needed before the first mean is returned
+
+    Exactly one of window_size, span, halflife and alpha
+    must be given.
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(1)
+
+    Notes
+    -----
+
+    If adjust is True, the mean of values x[0], ..., x[t] is
+
+        sum((1 - alpha)**i * x[t - i]) / sum((1 - alpha)**i)
+
+    and if adjust is False, it is computed recursively as
+
+        y[0] = x[0]
+        y[t] = (1 - alpha) * y[t - 1] + alpha * x[t]
+
+    These are the same definitions as pandas' ewm().mean().
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> r_ewm = rolling.EWMean([1, 2, 3, 4], alpha=0.5)
+    >>> list(r_ewm)
+    [1.0, 1.6666666666666667, 2.4285714285714284, 3.2666666666666666]
+    >>> r_ewm = rolling.EWMean([1, 2, 3, 4], alpha=0.5, adjust=False)
+    >>> list(r_ewm)
+    [1.0, 1.5, 2.25, 3.125]
+
+    """
+
+    def _init_expanding(
+        self,
+        iterable,
+        window_size=None,
+        span=None,
+        halflife=None,
+        alpha=None,
+        adjust=True,
+        min_periods=1,
+        **kwargs
+    ):
+        self._set_parameters(window_size, span, halflife, alpha, adjust)
+        self._mean = float("nan")
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
+    def _add_new(self, new):
+        self._nobs += 1
+        if self._nobs == 1:
+            self._mean = float(new)
+            self._old_weight = 1.0
+            return
+
+        old_weight = self._old_weight * self._decay
+        new_weight = self._new_weight
+        self._mean = (old_weight * self._mean + new_weight * new) / (
+            old_weight + new_weight
+        )
+        self._old_weight = old_weight + new_weight if self.adjust else 1.0
+
+    @property
+    def current_value(self):
+        return self._mean
+
+
+class EWVar(ExponentiallyWeighted):
+    """
+    Iterator object that computes the exponentially
+    weighted variance of the values of a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : number, optional, the same as span
+    span : number >= 1, optional, alpha = 2 / (span + 1)
+    halflife : number > 0, optional, the number of values
+        after which a weight halves, alpha = 1 - 2**(-1/halflife)
+    alpha : number in (0, 1], optional, the smoothing factor
+    adjust : bool, default True
+        if True, divide by the sum of the decaying weights
+        (see EWMean)
+    bias : bool, default False
+        if False, correct the weighted variance for bias in
+        the same way as the ddof=1 (sample) variance
+    min_periods : int, default 1, the number of values
+        needed before the first variance is returned
+
+    Exactly one of window_size, span, halflife and alpha
+    must be given.
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(1)
+
+    Notes
+    -----
+
+    The weighted mean and variance are updated together
+    as in pandas' ewmcov(). The unbiased variance is the
+    biased variance multiplied by
+
+        sum(w)**2 / (sum(w)**2 - sum(w**2))
+
+    for weights w, and is NaN for a single value.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> r_ewv = rolling.EWVar([1, 2, 3, 4], alpha=0.5)
+    >>> list(r_ewv)
+    [nan, 0.5, 0.9285714285714284, 1.385714285714286]
+
+    """
+
+    def _init_expanding(
+        self,
+        iterable,
+        window_size=None,
+        span=None,
+        halflife=None,
+        alpha=None,
+        adjust=True,
+        bias=False,
+        min_periods=1,
+        **kwargs
+    ):
+        self._set_parameters(window_size, span, halflife, alpha, adjust)
+        self.bias = bias
+        self._mean = float("nan")
+        self._var = float("nan")  # biased weighted variance
+        self._sum_weights = 0.0
+        self._sum_weights2 = 0.0  # sum of the squared weights
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
+    def _add_new(self, new):
+        self._nobs += 1
+        if self._nobs == 1:
+            self._mean = float(new)
+            self._var = 0.0
+            self._old_weight = self._sum_weights = self._sum_weights2 = 1.0
+            return
+
+        decay = self._decay
+        old_weight = self._old_weight * decay
+        new_weight = self._new_weight
+        total_weight = old_weight + new_weight
+        self._sum_weights = self._sum_weights * decay + new_weight
+        self._sum_weights2 = self._sum_weights2 * decay * decay + new_weight ** 2
+
+        old_mean = self._mean
+        mean = (old_weight * old_mean + new_weight * new) / total_weight
+        delta_mean = old_mean - mean
+        delta_new = new - mean
+        self._var = (
+            old_weight * (self._var + delta_mean * delta_mean)
+            + new_weight * delta_new * delta_new
+        ) / total_weight
+        self._mean = mean
+
+        if self.adjust:
+            self._old_weight = total_weight
+        else:
+            self._sum_weights /= total_weight
+            self._sum_weights2 /= total_weight * total_weight
+            self._old_weight = 1.0
+
+    @property
+    def current_value(self):
+        if self.bias:
+            return self._var
+        numerator = self._sum_weights * self._sum_weights
+        denominator = numerator - self._sum_weights2
+        if denominator <= 0:
+            return float("nan")
+        return numerator / denominator * self._var
+
+
+class EWStd(EWVar):
+    """
+    Iterator object that computes the exponentially
+    weighted standard deviation of the values of a
+    Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : number, optional, the same as span
+    span : number >= 1, optional, alpha = 2 / (span + 1)
+    halflife : number > 0, optional, the number of values
+        after which a weight halves, alpha = 1 - 2**(-1/halflife)
+    alpha : number in (0, 1], optional, the smoothing factor
+    adjust : bool, default True
+        if True, divide by the sum of the decaying weights
+        (see EWMean)
+    bias : bool, default False
+        if False, correct the weighted variance for bias
+        (see EWVar)
+    min_periods : int, default 1, the number of values
+        needed before the first value is returned
+
+    Exactly one of window_size, span, halflife and alpha
+    must be given.
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(1)
+
+    Notes
+    -----
+
+    The square root of the variance computed by EWVar.
+
+    """
+
+    @property
+    def current_value(self):
+        return sqrt(super().current_value)
@@ -0,0 +1,185 @@
+from collections import deque
+from itertools import islice
+
+from .base import RollingObject
+
+# base and modulus of the second hash used if double=True
+_DOUBLE_BASE = 131
+_DOUBLE_MOD = 1000000007
+
+
+def _code(item):
+    "Return the integer code of a character, byte or integer"
+    if isinstance(item, int):
+        return item
+    if isinstance(item, (str, bytes)) and len(item) == 1:
+        return ord(item)
+    raise TypeError(
+        "Hash values must be characters or integers, got {}".format(
+            type(item).__name__
+        )
+    )
+
+
+def _byte_view(iterable):
+    """
+    Return a flat memoryview of the bytes of iterable if it
+    is a bytes-like object of single bytes, otherwise None
+    """
+    if isinstance(iterable, (bytes, bytearray)):
+        return memoryview(iterable)
+    if isinstance(iterable, memoryview) and iterable.contiguous:
+        if iterable.format in ("B", "c"):
+            return iterable.cast("B")
+        if iterable.format == "b":
+            return iterable.cast("b")
+    return None
+
+
+class Hash(RollingObject):
+    """
+    Iterator object that computes a polynomial rolling
+    hash (Rabin-Karp fingerprint) of a rolling window
+    over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable of characters, bytes or integers
+        (e.g. a str, bytes, memoryview or list of integers)
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    base : int, default 257, the base of the polynomial
+    mod : int, default 2**61 - 1, the modulus of the hash
+    double : bool, default False
+        if True, also compute a second hash with a different
+        base and modulus and return a tuple of both hashes
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The hash of a window of codes c[0], ..., c[k-1] (where
+    characters are converted to integers with ord()) is
+
+        (c[0] * base**(k-1) + ... + c[k-1] * base**0) % mod
+
+    so equal windows always have equal hashes, and windows
+    with equal hashes are very likely to be equal. With double
+    hashing, the second hash uses base 131 and modulus 10**9 + 7.
+
+    For bytes, bytearray and contiguous memoryview objects of
+    single bytes (format 'B', 'b' or 'c'), the bytes are read
+    from a flat view as integers without converting each value.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> r_hash = rolling.Hash('abcabc', 3, base=10, mod=1000)
+    >>> list(r_hash)
+    [779, 887, 968, 779]
+
+    """
+
+    def __new__(cls, iterable, window_size=None, window_type="fixed", **kwargs):
+        view = _byte_view(iterable)
+        if view is not None:
+            cls, iterable = _BytesHash, view
+        return super().__new__(cls, iterable, window_size, window_type, **kwargs)
+
+    def _init_fixed(
+        self, iterable, window_size, base=257, mod=(1 << 61) - 1, double=False, **kwargs
+    ):
+        self._set_parameters(window_size, base, mod, double)
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+        # insert a zero at the start of the buffer so that the
+        # first call to update removes nothing from the hashes
+        self._buffer.appendleft(0)
+
+    def _init_variable(
+        self, iterable, window_size, base=257, mod=(1 << 61) - 1, double=False, **kwargs
+    ):
+        self._set_parameters(window_size, base, mod, double)
+
+    def _set_parameters(self, window_size, base, mod, double):
+        if not isinstance(base, int) or not isinstance(mod, int):
+            raise TypeError("base and mod must be integer type")
+        if base <= 1 or mod <= 1:
+            raise ValueError("base and mod must be greater than 1")
+
+        self.base = base
+        self.mod = mod
+        self.double = double
+        self._buffer = deque()
+        self._hash = 0
+        self._hash2 = 0
+        # the factors of the oldest value in the hashes of a full window
+        self._power = pow(base, window_size - 1, mod)
+        self._power2 = pow(_DOUBLE_BASE, window_size - 1, _DOUBLE_MOD)
+
+    def _add_new(self, new):
+        code = _code(new)
+        self._buffer.append(code)
+        self._hash = (self._hash * self.base + code) % self.mod
+        if self.double:
+            self._hash2 = (self._hash2 * _DOUBLE_BASE + code) % _DOUBLE_MOD
+
+    def _remove_old(self):
+        old = self._buffer.popleft()
+        n = len(self._buffer)
+        self._hash = (self._hash - old * pow(self.base, n, self.mod)) % self.mod
+        if self.double:
+            power2 = pow(_DOUBLE_BASE, n, _DOUBLE_MOD)
+            self._hash2 = (self._hash2 - old * power2) % _DOUBLE_MOD
+
+    def _update_window(self, new):
+        code = _code(new)
+        old = self._buffer.popleft()
+        self._buffer.append(code)
+        self._hash = ((self._hash - old * self._power) * self.base + code) % self.mod
+        if self.double:
+            self._hash2 = (
+                (self._hash2 - old * self._power2) * _DOUBLE_BASE + code
+            ) % _DOUBLE_MOD
+
+    @property
+    def current_value(self):
+        if self.double:
+            return self._hash, self._hash2
+        return self._hash
+
+    @property
+    def _obs(self):
+        return len(self._buffer)
+
+
+class _BytesHash(Hash):
+    """
+    Hash of a rolling window over a flat memoryview of
+    bytes, whose values are already integers
+    """
+
+    def _add_new(self, new):
+        self._buffer.append(new)
+        self._hash = (self._hash * self.base + new) % self.mod
+        if self.double:
+            self._hash2 = (self._hash2 * _DOUBLE_BASE + new) % _DOUBLE_MOD
+
+    def _update_window(self, new):
+        old = self._buffer.popleft()
+        self._buffer.append(new)
+        self._hash = ((self._hash - old * self._power) * self.base + new) % self.mod
+        if self.double:
+            self._hash2 = (
+                (self._hash2 - old * self._power2) * _DOUBLE_BASE + new
+            ) % _DOUBLE_MOD
@@ -2,6 +2,7 @@ from collections import deque
 from itertools import islice
 
 from .base import RollingObject
+from .summary import AllSummary, AnySummary
 
 
 class All(RollingObject):
@@ -51,6 +52,11 @@ class All(RollingObject):
         self._obs = 0
         self._last_false = -1
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._init_variable(iterable, window_size)
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _add_new(self, new):
         self._i += 1
         self._obs += 1
@@ -69,6 +75,12 @@ class All(RollingObject):
     def current_value(self):
         return self._i - self._obs >= self._last_false
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return AllSummary(self.current_value)
+
 
 class Any(RollingObject):
     """
@@ -117,6 +129,11 @@ class Any(RollingObject):
         self._obs = 0
         self._last_true = -1
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._init_variable(iterable, window_size)
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _add_new(self, new):
         self._i += 1
         self._obs += 1
@@ -134,3 +151,9 @@ class Any(RollingObject):
     @property
     def current_value(self):
         return self._i - self._obs < self._last_true
+
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return AnySummary(self.current_value)
@@ -0,0 +1,256 @@
+from collections import deque
+from itertools import islice
+
+from .base import RollingObject
+
+
+def _import_numpy():
+    "Return the numpy module, which is only needed by CorrMatrix"
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "CorrMatrix requires NumPy, install it with 'pip install numpy'"
+        )
+    return numpy
+
+
+def _replace_row(np, mean, comoment, old, new, window_size):
+    """
+    Update the mean and co-moment matrix of a full window in
+    place when the row old is replaced by the row new
+    """
+    delta = new - old
+    delta_old = old - mean
+    mean += delta / window_size
+    delta_new = new - mean
+    comoment += np.outer(delta, delta_new)
+    comoment += np.outer(delta_old, delta)
+
+
+def _set_equal_series(mean, comoment, equal, row):
+    """
+    Set the mean and co-moments of the series whose values
+    in the window all equal those of row exactly
+    """
+    mean[equal] = row[equal]
+    comoment[equal, :] = 0
+    comoment[:, equal] = 0
+
+
+def _correlation(np, comoment, out=None):
+    "Return the correlation matrix given by a co-moment matrix"
+    std = np.sqrt(np.diag(comoment))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.divide(comoment, np.outer(std, std), out=out)
+
+
+class CorrMatrix(RollingObject):
+    """
+    Iterator object that computes the correlation matrix
+    of a rolling window over a Python iterable of rows,
+    where each row holds one value of each of n series.
+
+    Requires NumPy.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object of rows (sequences or
+        1-D NumPy arrays, all of the same length n)
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+
+    Complexity
+    ----------
+
+    Update time:  O(n²)
+    Memory usage: O(nk + n²)
+
+    where k is the size of the rolling window and n
+    is the number of series
+
+    Notes
+    -----
+
+    The mean of each series and the matrix of sums of
+    products of deviations from the means (the co-moment
+    matrix) are kept as NumPy arrays and updated with the
+    same algorithm as Cov, so each step is two rank-1
+    (outer product) updates of the matrix instead of n²
+    separate pairwise updates.
+
+    Each value is a new n x n array. Entries involving a
+    series whose values in the window are all equal are NaN,
+    as are all entries if the window has fewer than two rows.
+    As for Cov, the newest equal values of each series are
+    counted so that the mean and co-moments of such a series
+    are set exactly, without rounding errors left by values
+    that have left the window.
+
+    To compute the correlation matrices of all windows of
+    a 2-D array, use CorrMatrix.batch().
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> rows = [(1, 2, 9), (2, 4, 7), (3, 5, 8), (4, 4, 6)]
+    >>> r_corr = rolling.CorrMatrix(rows, 3)
+    >>> next(r_corr).round(4)
+    array([[ 1.    ,  0.982 , -0.5   ],
+           [ 0.982 ,  1.    , -0.6547],
+           [-0.5   , -0.6547,  1.    ]])
+
+    """
+
+    def _init_fixed(self, iterable, window_size, **kwargs):
+        self._np = _import_numpy()
+        self._buffer = deque(maxlen=window_size)
+        self._mean = None
+        self._comoment = None
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+        # insert the means at the start of the buffer so that
+        # the first call to update returns the correct value
+        if self._mean is not None:
+            self._buffer.appendleft(self._mean.copy())
+
+    def _init_variable(self, iterable, window_size, **kwargs):
+        self._np = _import_numpy()
+        self._buffer = deque(maxlen=window_size)
+        self._mean = None
+        self._comoment = None
+
+    def _init_arrays(self, n):
+        self._mean = self._np.zeros(n)
+        self._comoment = self._np.zeros((n, n))
+        # the newest row, and how many of the newest values equal it
+        self._last = self._np.full(n, float("nan"))
+        self._run = self._np.zeros(n, dtype=int)
+
+    def _set_equal_values(self, new):
+        """
+        Count the newest values of each series equal to those
+        of the row new, and set the series whose values in the
+        window are all equal exactly
+        """
+        self._run = self._np.where(new == self._last, self._run + 1, 1)
+        self._last = new
+        self._reset_equal_values()
+
+    def _reset_equal_values(self):
+        equal = self._run >= self._obs
+        if equal.any():
+            _set_equal_series(self._mean, self._comoment, equal, self._last)
+
+    def _add_new(self, new):
+        new = self._np.array(new, dtype=float)
+        if self._mean is None:
+            self._init_arrays(len(new))
+        self._buffer.append(new)
+
+        delta = new - self._mean
+        self._mean += delta / self._obs
+        self._comoment += self._np.outer(delta, new - self._mean)
+        self._set_equal_values(new)
+
+    def _remove_old(self):
+        old = self._buffer.popleft()
+
+        delta = old - self._mean
+        self._mean -= delta / self._obs
+        self._comoment -= self._np.outer(delta, old - self._mean)
+        if self._obs:
+            self._reset_equal_values()
+
+    def _update_window(self, new):
+        new = self._np.array(new, dtype=float)
+        if self._mean is None:
+            # window_size is 1, so no rows were read by _init_fixed
+            self._init_arrays(len(new))
+            self._buffer.appendleft(self._mean.copy())
+
+        old = self._buffer[0]
+        self._buffer.append(new)
+        _replace_row(self._np, self._mean, self._comoment, old, new, self._obs)
+        self._set_equal_values(new)
+
+    @property
+    def current_value(self):
+        if self._obs < 2:
+            return self._np.full(self._comoment.shape, float("nan"))
+        return _correlation(self._np, self._comoment)
+
+    @property
+    def _obs(self):
+        return len(self._buffer)
+
+    @classmethod
+    def batch(cls, data, window_size):
+        """
+        Return the correlation matrices of all windows of
+        a 2-D array whose rows are the values of n series.
+
+        Parameters
+        ----------
+
+        data : 2-D array-like of shape (m, n)
+        window_size : integer, the size of the rolling
+            window moving over the rows
+
+        Returns
+        -------
+
+        array of shape (m - window_size + 1, n, n), where
+        the ith matrix is the correlation matrix of rows
+        i to i + window_size - 1
+
+        Notes
+        -----
+
+        The rows are read from the array as the window moves
+        on, so no window buffer is kept, and the results are
+        written into a single preallocated array.
+
+        """
+        np = _import_numpy()
+        window_size = cls._validate_window_size(window_size)
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 2:
+            raise ValueError("data must be a 2-D array")
+
+        m, n = data.shape
+        result = np.empty((max(m - window_size + 1, 0), n, n))
+        if m < window_size:
+            return result
+        if window_size == 1:
+            result.fill(float("nan"))
+            return result
+
+        mean = data[:window_size].mean(axis=0)
+        deviations = data[:window_size] - mean
+        comoment = deviations.T.dot(deviations)
+
+        # count the newest equal values of each series, as in update
+        run = np.zeros(n, dtype=int)
+        for i in range(1, window_size):
+            run = np.where(data[i] == data[i - 1], run + 1, 0)
+        equal = run >= window_size - 1
+        if equal.any():
+            _set_equal_series(mean, comoment, equal, data[window_size - 1])
+        _correlation(np, comoment, out=result[0])
+
+        for i in range(window_size, m):
+            new = data[i]
+            old = data[i - window_size]
+            _replace_row(np, mean, comoment, old, new, window_size)
+            run = np.where(new == data[i - 1], run + 1, 0)
+            equal = run >= window_size - 1
+            if equal.any():
+                _set_equal_series(mean, comoment, equal, new)
+            _correlation(np, comoment, out=result[i - window_size + 1])
+
+        return result
+
@@ -3,6 +3,7 @@ from heapq import heapify, heappush, heappop
 from itertools import islice
 
 from .base import RollingObject
+from .summary import MinSummary, MaxSummary
 
 pair = namedtuple("pair", ["value", "death"])
 
@@ -53,6 +54,13 @@ class Min(RollingObject):
         self._obs = 0
         self._buffer = deque()
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._obs = 0
+        # no value leaves the window, so only the minimum is kept
+        self._buffer = deque(maxlen=1)
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _update_window(self, new):
         self._i += 1
         new_pair = pair(new, self._i + self.window_size)
@@ -65,8 +73,13 @@ class Min(RollingObject):
             self._buffer.popleft()
 
     def _add_new(self, new):
-        self._i += 1
         self._obs += 1
+        if self.window_size is None:
+            # expanding window, so the buffer only holds the minimum
+            if not self._buffer or new < self._buffer[0].value:
+                self._buffer.append(pair(new, None))
+            return
+        self._i += 1
         new_pair = pair(new, self._i + self.window_size)
         # remove larger values from the end of the buffer
         while self._buffer and self._buffer[-1].value >= new:
@@ -84,6 +97,12 @@ class Min(RollingObject):
     def current_value(self):
         return self._buffer[0].value
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return MinSummary(self.current_value)
+
 
 class Max(RollingObject):
     """
@@ -131,6 +150,13 @@ class Max(RollingObject):
         self._i = -1
         self._obs = 0
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._obs = 0
+        # no value leaves the window, so only the maximum is kept
+        self._buffer = deque(maxlen=1)
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _update_window(self, new):
         self._i += 1
         new_pair = pair(new, self._i + self.window_size)
@@ -143,8 +169,13 @@ class Max(RollingObject):
             self._buffer.popleft()
 
     def _add_new(self, new):
-        self._i += 1
         self._obs += 1
+        if self.window_size is None:
+            # expanding window, so the buffer only holds the maximum
+            if not self._buffer or new > self._buffer[0].value:
+                self._buffer.append(pair(new, None))
+            return
+        self._i += 1
         new_pair = pair(new, self._i + self.window_size)
         # remove smaller values from the end of the buffer
         while self._buffer and self._buffer[-1].value <= new:
@@ -162,6 +193,12 @@ class Max(RollingObject):
     def current_value(self):
         return self._buffer[0].value
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return MaxSummary(self.current_value)
+
 
 class MinHeap(RollingObject):
     """
@@ -232,3 +269,9 @@ class MinHeap(RollingObject):
     @property
     def current_value(self):
         return self._heap[0].value
+
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return MinSummary(self.current_value)
@@ -1,11 +1,74 @@
-from collections import deque
+from collections import deque, namedtuple
 from itertools import islice
-from math import sqrt
+from math import ceil, sqrt
 
 from .base import RollingObject
 from .arithmetic import Sum
-from .structures.skiplist import IndexableSkiplist
-from .structures.bicounter import BiCounter
+from .structures.doubleheap import DoubleHeap
+from .structures.fenwick import FenwickHistogram
+from .structures.skiplist import IndexableSkiplist, SummingSkiplist
+from .structures.sortedblocks import SortedBlocks
+from .structures.frequency import FrequencyTable
+from .structures.nullbuffer import NullBuffer
+from .structures.quantilesketch import SlidingQuantileSketch
+from .summary import MeanSummary, VarSummary, StdSummary
+
+_SORTED_COLLECTIONS = {
+    "skiplist": IndexableSkiplist,
+    "heaps": DoubleHeap,
+    "sortedblocks": SortedBlocks,
+}
+
+
+def _sorted_collection(algorithm, window_size, values=(), domain=None):
+    """
+    Return a sorted collection for the named algorithm
+    holding the given values (which must be sorted), or
+    a histogram of the values if a domain is given
+    """
+    if domain is not None:
+        lo, hi = domain
+        return FenwickHistogram.from_sorted(values, lo, hi)
+    if algorithm not in _SORTED_COLLECTIONS:
+        raise ValueError("Unknown algorithm '{}'".format(algorithm))
+    return _SORTED_COLLECTIONS[algorithm].from_sorted(values, window_size)
+
+
+def _linear(values, h):
+    i = int(h)
+    if i == h:
+        return values[i]
+    lower = values[i]
+    return lower + (values[i + 1] - lower) * (h - i)
+
+
+def _lower(values, h):
+    return values[int(h)]
+
+
+def _higher(values, h):
+    return values[ceil(h)]
+
+
+def _nearest(values, h):
+    # round half to even, as NumPy does
+    return values[round(h)]
+
+
+def _midpoint(values, h):
+    i = int(h)
+    if i == h:
+        return values[i]
+    return (values[i] + values[i + 1]) / 2
+
+
+_INTERPOLATIONS = {
+    "linear": _linear,
+    "lower": _lower,
+    "higher": _higher,
+    "nearest": _nearest,
+    "midpoint": _midpoint,
+}
 
 
 class Mean(Sum):
@@ -34,6 +97,110 @@ class Mean(Sum):
     def current_value(self):
         return self._sum / self._obs
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return MeanSummary(self._obs, self._sum)
+
+
+class WeightedMean(RollingObject):
+    """
+    Iterator object that computes the weighted mean of
+    a rolling window over a Python iterable of pairs.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object of (value, weight) pairs
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The sum of the weights and the sum of the products of
+    the values and weights are kept, with a single buffer of
+    the pairs. The weighted mean is NaN if the weights of the
+    window sum to zero.
+
+    VWAP is another name for this class: with pairs of
+    (price, volume) of trades, the weighted mean is the
+    volume-weighted average price.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> trades = [(10.0, 100), (10.5, 300), (10.25, 200), (11.0, 100)]
+    >>> r_vwap = rolling.VWAP(trades, 3)
+    >>> list(r_vwap)
+    [10.333333333333334, 10.5]
+
+    """
+
+    def _init_fixed(self, iterable, window_size, **kwargs):
+        self._buffer = deque(maxlen=window_size)
+        self._weight = 0
+        self._weighted_sum = 0
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+        # insert a pair with zero weight so that the
+        # first call to update returns the correct value
+        self._buffer.appendleft((0, 0))
+
+    def _init_variable(self, iterable, window_size, **kwargs):
+        self._buffer = deque(maxlen=window_size)
+        self._weight = 0
+        self._weighted_sum = 0
+
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._buffer = NullBuffer()
+        self._weight = 0
+        self._weighted_sum = 0
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
+    def _add_new(self, new):
+        self._buffer.append(new)
+        value, weight = new
+        self._weight += weight
+        self._weighted_sum += value * weight
+
+    def _remove_old(self):
+        value, weight = self._buffer.popleft()
+        self._weight -= weight
+        self._weighted_sum -= value * weight
+
+    def _update_window(self, new):
+        old_value, old_weight = self._buffer.popleft()
+        self._buffer.append(new)
+        value, weight = new
+        self._weight += weight - old_weight
+        self._weighted_sum += value * weight - old_value * old_weight
+
+    @property
+    def current_value(self):
+        if not self._weight:
+            return float("nan")
+        return self._weighted_sum / self._weight
+
+    @property
+    def _obs(self):
+        return len(self._buffer)
+
+
+VWAP = WeightedMean
+
 
 class Var(RollingObject):
     """
@@ -95,6 +262,16 @@ class Var(RollingObject):
         self._mean = 0.0  # mean of values
         self._sslm = 0.0  # sum of squared values less the mean
 
+    def _init_expanding(
+        self, iterable, window_size=None, ddof=1, min_periods=1, **kwargs
+    ):
+        self.ddof = ddof
+        self._buffer = NullBuffer()
+        self._mean = 0.0
+        self._sslm = 0.0
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _add_new(self, new):
         self._buffer.append(new)
 
@@ -130,6 +307,12 @@ class Var(RollingObject):
     def _obs(self):
         return len(self._buffer)
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return VarSummary(self._obs, self._mean, self._sslm, self.ddof)
+
 
 class Std(Var):
     """
@@ -174,6 +357,12 @@ class Std(Var):
         else:
             return sqrt(self._sslm / (self._obs - self.ddof))
 
+    def summary(self):
+        """
+        Return a mergeable summary of the current window
+        """
+        return StdSummary(self._obs, self._mean, self._sslm, self.ddof)
+
 
 class Median(RollingObject):
     """
@@ -186,6 +375,13 @@ class Median(RollingObject):
     iterable : any iterable object
     window_size : integer, the size of the rolling
         window moving over the iterable
+    algorithm : {'skiplist', 'heaps', 'sortedblocks'}, default 'skiplist'
+        the sorted collection used to track the median
+        (see Notes)
+    domain : tuple of two integers (lo, hi), optional
+        if given, the values must be integers from lo to hi
+        inclusive and a histogram of the values is used
+        instead of the algorithm (see Notes)
 
     Complexity
     ----------
@@ -198,63 +394,647 @@ class Median(RollingObject):
     Notes
     -----
 
-    An indexable skiplist is used to track the median
-    as the window moves (using an idea of R. Hettinger [1]).
+    By default, an indexable skiplist is used to track the
+    median as the window moves (using an idea of R. Hettinger [1]).
+
+    Alternatively, algorithm='heaps' keeps the window in two
+    heaps either side of the median with lazy deletion, and
+    algorithm='sortedblocks' keeps the window as a list of
+    sorted blocks that are updated with bisect. Both are
+    several times faster than the skiplist in CPython (see
+    benchmarks/bench_median.py): 'sortedblocks' tends to be
+    fastest for windows of up to a few thousand values and
+    'heaps' for larger windows. The 'heaps' algorithm
+    requires numeric values.
+
+    If the values are integers from a small domain, passing
+    domain=(lo, hi) keeps a count of each value in a Fenwick
+    tree instead, and each update takes O(log V) time where
+    V = hi - lo + 1, using O(V) memory. This is faster than
+    the skiplist, though 'sortedblocks' can still be faster
+    in CPython (see benchmarks/bench_fenwick.py).
 
     [1] http://code.activestate.com/recipes/576930/
 
     """
 
-    def _init_fixed(self, iterable, window_size, **kwargs):
-        self._buffer = deque(maxlen=window_size)
-        self._skiplist = IndexableSkiplist(window_size)
-
-        # update buffer and skiplist with initial values
-        for new in islice(self._iterator, window_size - 1):
-            self._add_new(new)
+    def _init_fixed(
+        self, iterable, window_size, algorithm="skiplist", domain=None, **kwargs
+    ):
+        head = islice(self._iterator, window_size - 1)
+        self._buffer = deque(head, maxlen=window_size)
+
+        # insert a dummy value (the last element seen, or the lowest
+        # value of the domain or 0 if no elements were seen) so that
+        # the window is full and the iterator works as expected
+        if self._buffer:
+            self._buffer.appendleft(self._buffer[-1])
+        else:
+            self._buffer.appendleft(domain[0] if domain is not None else 0)
 
-        try:
-            # insert a dummy value (the last element seen) so that
-            # the window is full and iterator works as expected
-            self._buffer.appendleft(new)
-            self._skiplist.insert(new)
-        except UnboundLocalError:
-            # if we didn't see any elements (the iterable had no
-            # elements or just one element), just use 0 instead
-            self._buffer.appendleft(0)
-            self._skiplist.insert(0)
+        # build the sorted collection in bulk from the initial values
+        self._sorted = _sorted_collection(
+            algorithm, window_size, sorted(self._buffer), domain
+        )
 
-    def _init_variable(self, iterable, window_size, **kwargs):
+    def _init_variable(
+        self, iterable, window_size, algorithm="skiplist", domain=None, **kwargs
+    ):
         self._buffer = deque(maxlen=window_size)
-        self._skiplist = IndexableSkiplist(window_size)
+        self._sorted = _sorted_collection(algorithm, window_size, domain=domain)
 
     def _update_window(self, new):
         old = self._buffer.popleft()
-        self._skiplist.remove(old)
-        self._skiplist.insert(new)
+        self._sorted.remove(old)
+        self._sorted.insert(new)
         self._buffer.append(new)
 
     def _add_new(self, new):
-        self._skiplist.insert(new)
+        self._sorted.insert(new)
         self._buffer.append(new)
 
     def _remove_old(self):
         old = self._buffer.popleft()
-        self._skiplist.remove(old)
+        self._sorted.remove(old)
 
     @property
     def current_value(self):
         if self._obs % 2 == 1:
-            return self._skiplist[self._obs // 2]
+            return self._sorted[self._obs // 2]
         else:
             i = self._obs // 2
-            return (self._skiplist[i] + self._skiplist[i - 1]) / 2
+            return (self._sorted[i] + self._sorted[i - 1]) / 2
 
     @property
     def _obs(self):
         return len(self._buffer)
 
 
+class Quantile(Median):
+    """
+    Iterator object that computes one or more quantiles
+    of a rolling window over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    q : float or list of floats, default 0.5
+        the quantile(s) to compute, each between 0 and 1
+    interpolation : {'linear', 'lower', 'higher', 'nearest', 'midpoint'}
+        default 'linear', how to compute a quantile lying
+        between two values i < j of the window:
+
+          - linear: i + (j - i) * fraction
+          - lower: i
+          - higher: j
+          - nearest: i or j, whichever is nearest
+          - midpoint: (i + j) / 2
+
+    algorithm : {'skiplist', 'sortedblocks'}, default 'skiplist'
+        the sorted collection used to look up values by rank
+    domain : tuple of two integers (lo, hi), optional
+        if given, the values must be integers from lo to hi
+        inclusive and a Fenwick tree of value counts is used
+        instead of the algorithm
+    approximate : bool, default False
+        if True, estimate the quantiles using a sketch with
+        memory sublinear in the window size (see
+        ApproximateQuantile)
+    eps : float, default 0.01, only used if approximate
+        is True (see ApproximateQuantile)
+
+    Complexity
+    ----------
+
+    Update time:  O(log k)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    All of the quantiles are looked up by rank in the same
+    sorted collection, so computing several quantiles costs
+    little more than computing one.
+
+    If q is a single number, a single value is returned for
+    each window, otherwise a list of values is returned in
+    the same order as q.
+
+    Quantiles are computed in the same way as NumPy's
+    percentile() and quantile() functions.
+
+    """
+
+    def __new__(
+        cls,
+        iterable,
+        window_size=None,
+        window_type="fixed",
+        approximate=False,
+        **kwargs
+    ):
+        if approximate:
+            return ApproximateQuantile(
+                iterable, window_size, window_type=window_type, **kwargs
+            )
+        return super().__new__(cls, iterable, window_size, window_type, **kwargs)
+
+    def _init_fixed(
+        self,
+        iterable,
+        window_size,
+        q=0.5,
+        interpolation="linear",
+        algorithm="skiplist",
+        **kwargs
+    ):
+        self._set_quantiles(q, interpolation, algorithm)
+        super()._init_fixed(iterable, window_size, algorithm=algorithm, **kwargs)
+
+    def _init_variable(
+        self,
+        iterable,
+        window_size,
+        q=0.5,
+        interpolation="linear",
+        algorithm="skiplist",
+        **kwargs
+    ):
+        self._set_quantiles(q, interpolation, algorithm)
+        super()._init_variable(iterable, window_size, algorithm=algorithm, **kwargs)
+
+    def _set_quantiles(self, q, interpolation, algorithm):
+        if algorithm == "heaps":
+            raise ValueError("algorithm 'heaps' can only be used with Median")
+        if interpolation not in _INTERPOLATIONS:
+            raise ValueError("Unknown interpolation '{}'".format(interpolation))
+
+        self._scalar = not isinstance(q, (list, tuple))
+        self.q = q
+        self.interpolation = interpolation
+        self._quantiles = [q] if self._scalar else list(q)
+
+        for quantile in self._quantiles:
+            if not 0 <= quantile <= 1:
+                raise ValueError("quantiles must be between 0 and 1")
+
+    @property
+    def current_value(self):
+        interpolate = _INTERPOLATIONS[self.interpolation]
+        values = [
+            interpolate(self._sorted, (self._obs - 1) * quantile)
+            for quantile in self._quantiles
+        ]
+        return values[0] if self._scalar else values
+
+
+class ApproximateQuantile(RollingObject):
+    """
+    Iterator object that estimates one or more quantiles
+    of a rolling window over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    q : float or list of floats, default 0.5
+        the quantile(s) to compute, each between 0 and 1
+    eps : float, default 0.01, between 0 and 1
+        the permitted rank error as a fraction of the
+        window size
+
+    Complexity
+    ----------
+
+    Update time:  O(log(1 / eps)) (amortised)
+    Memory usage: O(1 / eps**2 + log(eps * k)**2 / eps)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The window is split into blocks of about eps * k / 3
+    values, each summarised by a compacting sketch, and
+    blocks are discarded whole once they leave the window
+    (see rolling.structures.quantilesketch). Each value
+    returned has a rank in the window within eps * k of
+    the exact rank of the quantile.
+
+    The estimate only changes when a block is completed,
+    so a new value may take up to eps * k / 3 steps to
+    affect the quantiles.
+
+    This is only implemented for fixed-size windows.
+
+    """
+
+    def _init_fixed(self, iterable, window_size, q=0.5, eps=0.01, **kwargs):
+        for name in ("interpolation", "algorithm", "domain"):
+            if name in kwargs:
+                raise ValueError(
+                    "{} cannot be used with approximate quantiles".format(name)
+                )
+
+        self._scalar = not isinstance(q, (list, tuple))
+        self.q = q
+        self._quantiles = [q] if self._scalar else list(q)
+
+        for quantile in self._quantiles:
+            if not 0 <= quantile <= 1:
+                raise ValueError("quantiles must be between 0 and 1")
+
+        self._sketch = SlidingQuantileSketch(window_size, eps)
+        for new in islice(self._iterator, window_size - 1):
+            self._sketch.add(new)
+
+    def _init_variable(self, iterable, window_size, **kwargs):
+        raise NotImplementedError(
+            "ApproximateQuantile not implemented for variable windows"
+        )
+
+    def _update_window(self, new):
+        # the sketch discards values as they leave the window
+        self._sketch.add(new)
+
+    def _add_new(self, new):
+        self._sketch.add(new)
+
+    def _remove_old(self):
+        raise NotImplementedError(
+            "ApproximateQuantile not implemented for variable windows"
+        )
+
+    @property
+    def current_value(self):
+        values = [self._sketch.quantile(quantile) for quantile in self._quantiles]
+        return values[0] if self._scalar else values
+
+    @property
+    def _obs(self):
+        return len(self._sketch)
+
+
+class Rank(Median):
+    """
+    Iterator object that computes the rank of the newest
+    value within a rolling window over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    pct : bool, default False
+        if True, return the rank as a fraction of the
+        number of values in the window
+    method : {'average', 'min', 'max'}, default 'average'
+        how to rank a value that is equal to other values
+        in the window:
+
+          - average: the average of the ranks of the tied values
+          - min: the lowest rank of the tied values
+          - max: the highest rank of the tied values
+
+    ascending : bool, default True
+        if False, the largest value has rank 1
+    algorithm : {'skiplist', 'sortedblocks'}, default 'skiplist'
+        the sorted collection used to find the rank
+    domain : tuple of two integers (lo, hi), optional
+        if given, the values must be integers from lo to hi
+        inclusive and a Fenwick tree of value counts is used
+        instead of the algorithm
+
+    Complexity
+    ----------
+
+    Update time:  O(log k)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    Ranks start at 1, as in pandas' rank() method. The rank
+    is found by counting the values less than (and less than
+    or equal to) the newest value in the sorted collection.
+
+    """
+
+    def _init_fixed(
+        self,
+        iterable,
+        window_size,
+        pct=False,
+        method="average",
+        ascending=True,
+        algorithm="skiplist",
+        **kwargs
+    ):
+        self._set_method(pct, method, ascending, algorithm)
+        super()._init_fixed(iterable, window_size, algorithm=algorithm, **kwargs)
+
+    def _init_variable(
+        self,
+        iterable,
+        window_size,
+        pct=False,
+        method="average",
+        ascending=True,
+        algorithm="skiplist",
+        **kwargs
+    ):
+        self._set_method(pct, method, ascending, algorithm)
+        super()._init_variable(iterable, window_size, algorithm=algorithm, **kwargs)
+
+    def _set_method(self, pct, method, ascending, algorithm):
+        if algorithm == "heaps":
+            raise ValueError("algorithm 'heaps' can only be used with Median")
+        if method not in ("average", "min", "max"):
+            raise ValueError("Unknown method '{}'".format(method))
+        self.pct = pct
+        self.method = method
+        self.ascending = ascending
+
+    @property
+    def current_value(self):
+        newest = self._buffer[-1]
+        n = self._obs
+
+        if self.ascending:
+            lowest = self._sorted.bisect_left(newest) + 1
+            highest = self._sorted.bisect_right(newest)
+        else:
+            lowest = n - self._sorted.bisect_right(newest) + 1
+            highest = n - self._sorted.bisect_left(newest)
+
+        if self.method == "min":
+            rank = lowest
+        elif self.method == "max":
+            rank = highest
+        else:
+            rank = (lowest + highest) / 2
+
+        return rank / n if self.pct else rank
+
+
+class TrimmedMean(Median):
+    """
+    Iterator object that computes the trimmed mean
+    of a rolling window over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    proportiontocut : float, default 0.1
+        the proportion of values to cut from each end
+        of the sorted window (at least 0 and less than 0.5)
+
+    Complexity
+    ----------
+
+    Update time:  O(log k)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    As in SciPy's trim_mean(), int(proportiontocut * n)
+    values are cut from each end of a window of n values.
+
+    The window is kept in a skiplist that also stores the
+    sum of the values spanned by each link, so the sum of
+    the values between two ranks is found in O(log k) time.
+
+    """
+
+    def _init_fixed(self, iterable, window_size, proportiontocut=0.1, **kwargs):
+        if not 0 <= proportiontocut < 0.5:
+            raise ValueError("proportiontocut must be at least 0 and less than 0.5")
+        self.proportiontocut = proportiontocut
+        self._init_summing_fixed(window_size, **kwargs)
+
+    def _init_variable(self, iterable, window_size, proportiontocut=0.1, **kwargs):
+        if not 0 <= proportiontocut < 0.5:
+            raise ValueError("proportiontocut must be at least 0 and less than 0.5")
+        self.proportiontocut = proportiontocut
+        self._init_summing_variable(window_size, **kwargs)
+
+    def _check_summing_options(self, kwargs):
+        for name in ("algorithm", "domain"):
+            if name in kwargs:
+                raise ValueError(
+                    "{} cannot be used with {}, which always uses a "
+                    "SummingSkiplist".format(name, type(self).__name__)
+                )
+
+    def _init_summing_fixed(self, window_size, **kwargs):
+        self._check_summing_options(kwargs)
+        head = islice(self._iterator, window_size - 1)
+        self._buffer = deque(head, maxlen=window_size)
+
+        # insert a dummy value (the last element seen, or 0 if no
+        # elements were seen) so that the window is full and
+        # the iterator works as expected
+        self._buffer.appendleft(self._buffer[-1] if self._buffer else 0)
+
+        self._sorted = SummingSkiplist.from_sorted(sorted(self._buffer), window_size)
+
+    def _init_summing_variable(self, window_size, **kwargs):
+        self._check_summing_options(kwargs)
+        self._buffer = deque(maxlen=window_size)
+        self._sorted = SummingSkiplist(window_size)
+
+    @property
+    def current_value(self):
+        n = self._obs
+        cut = int(self.proportiontocut * n)
+        return self._sorted.range_sum(cut, n - cut) / (n - 2 * cut)
+
+
+class WinsorizedMean(TrimmedMean):
+    """
+    Iterator object that computes the winsorized mean
+    of a rolling window over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    limits : float or tuple of two floats, default 0.05
+        the proportion of values to replace at the lower
+        and upper ends of the sorted window (a single float
+        is used for both ends, and the two proportions must
+        sum to less than 1)
+
+    Complexity
+    ----------
+
+    Update time:  O(log k)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    As in SciPy's mstats.winsorize(), the int(lower * n)
+    smallest values of a window of n values are replaced
+    by the next smallest value, and the int(upper * n)
+    largest values by the next largest value.
+
+    The window is kept in a skiplist that also stores the
+    sum of the values spanned by each link, so the sum of
+    the values between two ranks is found in O(log k) time.
+
+    """
+
+    def _init_fixed(self, iterable, window_size, limits=0.05, **kwargs):
+        self._set_limits(limits)
+        self._init_summing_fixed(window_size, **kwargs)
+
+    def _init_variable(self, iterable, window_size, limits=0.05, **kwargs):
+        self._set_limits(limits)
+        self._init_summing_variable(window_size, **kwargs)
+
+    def _set_limits(self, limits):
+        if isinstance(limits, (list, tuple)):
+            lower, upper = limits
+        else:
+            lower = upper = limits
+        if not (0 <= lower < 1 and 0 <= upper < 1 and lower + upper < 1):
+            raise ValueError("limits must be at least 0 and sum to less than 1")
+        self.limits = limits
+        self._lower = lower
+        self._upper = upper
+
+    @property
+    def current_value(self):
+        n = self._obs
+        lo = int(self._lower * n)
+        hi = n - int(self._upper * n)
+        total = self._sorted.range_sum(lo, hi)
+        if lo:
+            total += lo * self._sorted[lo]
+        if hi < n:
+            total += (n - hi) * self._sorted[hi - 1]
+        return total / n
+
+
+class MAD(Median):
+    """
+    Iterator object that computes the median absolute
+    deviation of a rolling window over a Python iterable.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    algorithm : {'skiplist', 'sortedblocks'}, default 'skiplist'
+        the sorted collection used to look up values by rank
+    domain : tuple of two integers (lo, hi), optional
+        if given, the values must be integers from lo to hi
+        inclusive and a Fenwick tree of value counts is used
+        instead of the algorithm
+
+    Complexity
+    ----------
+
+    Update time:  O(log^2 k)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The median absolute deviation is the median of the
+    absolute deviations of the window values from their
+    median. It is not scaled to estimate the standard
+    deviation of normally-distributed values.
+
+    The deviations are never computed for the whole window.
+    The values below the median give one sorted sequence of
+    deviations (read from the median downwards) and the values
+    at or above the median give another, so the median of
+    the deviations is found by a binary search for the j-th
+    smallest item of two sorted sequences, making O(log k)
+    lookups by rank in the sorted collection.
+
+    """
+
+    def _init_fixed(self, iterable, window_size, algorithm="skiplist", **kwargs):
+        if algorithm == "heaps":
+            raise ValueError("algorithm 'heaps' can only be used with Median")
+        super()._init_fixed(iterable, window_size, algorithm=algorithm, **kwargs)
+
+    def _init_variable(self, iterable, window_size, algorithm="skiplist", **kwargs):
+        if algorithm == "heaps":
+            raise ValueError("algorithm 'heaps' can only be used with Median")
+        super()._init_variable(iterable, window_size, algorithm=algorithm, **kwargs)
+
+    def _smallest_deviation(self, j, median, split):
+        """
+        Return the j-th smallest (from 0) absolute deviation from
+        the median, where the first split values are below it
+        """
+        values = self._sorted
+        n_below = split
+        n_above = self._obs - split
+
+        # binary search for the number i of deviations from
+        # below the median among the j + 1 smallest deviations
+        lo = max(0, j + 1 - n_above)
+        hi = min(j + 1, n_below)
+        while lo < hi:
+            i = (lo + hi) // 2
+            # compare the i-th deviation below and (j - i)-th above
+            if median - values[split - 1 - i] < values[split + j - i] - median:
+                lo = i + 1
+            else:
+                hi = i
+
+        i = lo
+        deviation = None
+        if i > 0:
+            deviation = median - values[split - i]
+        if i <= j:
+            above = values[split + j - i] - median
+            if deviation is None or above > deviation:
+                deviation = above
+        return deviation
+
+    @property
+    def current_value(self):
+        median = super().current_value
+        split = self._sorted.bisect_left(median)
+        n = self._obs
+        if n % 2 == 1:
+            return self._smallest_deviation(n // 2, median, split)
+        else:
+            lower = self._smallest_deviation(n // 2 - 1, median, split)
+            upper = self._smallest_deviation(n // 2, median, split)
+            return (lower + upper) / 2
+
+
 class Mode(RollingObject):
     """
     Iterator object that computes the mode
@@ -299,39 +1079,39 @@ class Mode(RollingObject):
     def _init_fixed(self, iterable, window_size, return_count=False, **kwargs):
         self._buffer = deque(maxlen=window_size)
         self.return_count = return_count
-        self._bicounter = BiCounter()
+        self._table = FrequencyTable()
         for item in islice(self._iterator, window_size - 1):
             self._add_new(item)
 
         # insert a value to be removed on the first call to update
         self._buffer.appendleft("DUMMY_VALUE")
-        self._bicounter.increment("DUMMY_VALUE")
+        self._table.increment("DUMMY_VALUE")
 
     def _init_variable(self, iterable, window_size, return_count=False, **kwargs):
         self._buffer = deque(maxlen=window_size)
         self.return_count = return_count
-        self._bicounter = BiCounter()
+        self._table = FrequencyTable()
 
     def _update_window(self, new):
         old = self._buffer.popleft()
-        self._bicounter.decrement(old)
-        self._bicounter.increment(new)
+        self._table.decrement(old)
+        self._table.increment(new)
         self._buffer.append(new)
 
     def _add_new(self, new):
-        self._bicounter.increment(new)
+        self._table.increment(new)
         self._buffer.append(new)
 
     def _remove_old(self):
         old = self._buffer.popleft()
-        self._bicounter.decrement(old)
+        self._table.decrement(old)
 
     @property
     def current_value(self):
         if self.return_count:
-            return self._bicounter.most_common_items, self._bicounter.largest_count
+            return self._table.most_common_items, self._table.largest_count
         else:
-            return self._bicounter.most_common_items
+            return self._table.most_common_items
 
     @property
     def _obs(self):
@@ -394,6 +1174,14 @@ class Skew(RollingObject):
         self._x2 = 0.0
         self._x3 = 0.0
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._buffer = NullBuffer()
+        self._x1 = 0.0
+        self._x2 = 0.0
+        self._x3 = 0.0
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _add_new(self, new):
         self._buffer.append(new)
 
@@ -498,6 +1286,15 @@ class Kurtosis(RollingObject):
         self._x3 = 0.0
         self._x4 = 0.0
 
+    def _init_expanding(self, iterable, window_size=None, min_periods=1, **kwargs):
+        self._buffer = NullBuffer()
+        self._x1 = 0.0
+        self._x2 = 0.0
+        self._x3 = 0.0
+        self._x4 = 0.0
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
     def _add_new(self, new):
         self._buffer.append(new)
 
@@ -551,3 +1348,275 @@ class Kurtosis(RollingObject):
     @property
     def _obs(self):
         return len(self._buffer)
+
+
+class Cov(RollingObject):
+    """
+    Iterator object that computes the covariance of
+    a rolling window over a Python iterable of pairs.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object of (x, y) pairs
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+    ddof : int, default 1, the divisor used in calculation
+        is (N - ddof) where N is the number of observations
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    A bivariate form of Welford's algorithm (as used by Var)
+    updates the means of x and y and the sums of products of
+    deviations from the means, so Corr and LinReg can be
+    computed from the same sums.
+
+    As for Var, ddof must be less than window_size, and the
+    covariance is NaN if (N - ddof) is not positive.
+
+    The number of newest values of x (and y) that are equal
+    is also counted. If all the x (or y) values in the window
+    are equal, their mean and sums are set exactly, so that the
+    rounding errors left by values that have left the window
+    do not give a nonzero covariance.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> pairs = [(1, 2), (2, 4), (3, 5), (4, 4), (5, 6)]
+    >>> r_cov = rolling.Cov(pairs, 3)
+    >>> [round(cov, 10) for cov in r_cov]
+    [1.5, 0.0, 0.5]
+
+    """
+
+    def _init_fixed(self, iterable, window_size, ddof=1, **kwargs):
+        self._init_sums(window_size, ddof)
+        self._buffer = deque(maxlen=window_size)
+        for new in islice(self._iterator, window_size - 1):
+            self._add_new(new)
+
+        # insert the means at the start of the buffer so that
+        # the first call to update returns the correct value
+        self._buffer.appendleft((self._mean_x, self._mean_y))
+
+    def _init_variable(self, iterable, window_size, ddof=1, **kwargs):
+        self._init_sums(window_size, ddof)
+        self._buffer = deque(maxlen=window_size)
+
+    def _init_expanding(
+        self, iterable, window_size=None, ddof=1, min_periods=1, **kwargs
+    ):
+        self._init_sums(window_size, ddof)
+        self._buffer = NullBuffer()
+        for new in islice(self._iterator, min_periods - 1):
+            self._add_new(new)
+
+    def _init_sums(self, window_size, ddof):
+        if window_size is not None and window_size <= ddof:
+            raise ValueError("window_size must be greater than ddof")
+
+        self.ddof = ddof
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._sxx = 0.0  # sum of squared deviations of x from its mean
+        self._syy = 0.0
+        self._sxy = 0.0  # sum of products of deviations of x and y
+        # the newest x and y, and how many of the newest values equal them
+        self._last_x = None
+        self._last_y = None
+        self._run_x = 0
+        self._run_y = 0
+
+    def _set_equal_values(self, x, y):
+        """
+        Count the newest values equal to x and y, and if all
+        the x or y values in the window are equal, set their
+        mean and sums exactly
+        """
+        self._run_x = self._run_x + 1 if x == self._last_x else 1
+        self._run_y = self._run_y + 1 if y == self._last_y else 1
+        self._last_x = x
+        self._last_y = y
+        self._reset_equal_values()
+
+    def _reset_equal_values(self):
+        if self._run_x >= self._obs:
+            self._mean_x = float(self._last_x)
+            self._sxx = self._sxy = 0.0
+        if self._run_y >= self._obs:
+            self._mean_y = float(self._last_y)
+            self._syy = self._sxy = 0.0
+
+    def _add_new(self, new):
+        self._buffer.append(new)
+        x, y = new
+
+        delta_x = x - self._mean_x
+        delta_y = y - self._mean_y
+        self._mean_x += delta_x / self._obs
+        self._mean_y += delta_y / self._obs
+        self._sxx += delta_x * (x - self._mean_x)
+        self._syy += delta_y * (y - self._mean_y)
+        self._sxy += delta_x * (y - self._mean_y)
+        self._set_equal_values(x, y)
+
+    def _remove_old(self):
+        x, y = self._buffer.popleft()
+
+        delta_x = x - self._mean_x
+        delta_y = y - self._mean_y
+        self._mean_x -= delta_x / self._obs
+        self._mean_y -= delta_y / self._obs
+        self._sxx -= delta_x * (x - self._mean_x)
+        self._syy -= delta_y * (y - self._mean_y)
+        self._sxy -= delta_x * (y - self._mean_y)
+        if self._obs:
+            self._reset_equal_values()
+
+    def _update_window(self, new):
+        x_old, y_old = self._buffer[0]
+        self._buffer.append(new)
+        x, y = new
+
+        delta_x = x - x_old
+        delta_y = y - y_old
+        delta_x_old = x_old - self._mean_x
+        delta_y_old = y_old - self._mean_y
+        self._mean_x += delta_x / self._obs
+        self._mean_y += delta_y / self._obs
+        delta_x_new = x - self._mean_x
+        delta_y_new = y - self._mean_y
+        self._sxx += delta_x * (delta_x_old + delta_x_new)
+        self._syy += delta_y * (delta_y_old + delta_y_new)
+        self._sxy += delta_x * delta_y_new + delta_x_old * delta_y
+        self._set_equal_values(x, y)
+
+    @property
+    def current_value(self):
+        if self._obs <= self.ddof:
+            return float("nan")
+        else:
+            return self._sxy / (self._obs - self.ddof)
+
+    @property
+    def _obs(self):
+        return len(self._buffer)
+
+
+class Corr(Cov):
+    """
+    Iterator object that computes the Pearson correlation
+    coefficient of a rolling window over a Python iterable
+    of pairs.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object of (x, y) pairs
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    The sums of Cov are used, so the ddof terms cancel. The
+    correlation is NaN if the window has fewer than two
+    values, or if all x or all y values are equal.
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> pairs = [(1, 2), (2, 4), (3, 5), (4, 4), (5, 6)]
+    >>> r_corr = rolling.Corr(pairs, 3)
+    >>> [round(corr, 10) for corr in r_corr]
+    [0.9819805061, 0.0, 0.5]
+
+    """
+
+    @property
+    def current_value(self):
+        denominator = self._sxx * self._syy
+        if self._obs < 2 or denominator <= 0:
+            return float("nan")
+        return self._sxy / sqrt(denominator)
+
+
+LinRegResult = namedtuple("LinRegResult", ["slope", "intercept", "rsquared"])
+
+
+class LinReg(Cov):
+    """
+    Iterator object that computes the least squares line
+    y = slope * x + intercept fitted to a rolling window
+    over a Python iterable of pairs.
+
+    Parameters
+    ----------
+
+    iterable : any iterable object of (x, y) pairs
+    window_size : integer, the size of the rolling
+        window moving over the iterable
+
+    Complexity
+    ----------
+
+    Update time:  O(1)
+    Memory usage: O(k)
+
+    where k is the size of the rolling window
+
+    Notes
+    -----
+
+    Each value is a LinRegResult named tuple of the slope,
+    intercept and coefficient of determination (rsquared)
+    of the line, found from the sums of Cov. The values
+    are NaN if the window has fewer than two values, or if
+    all x values are equal. If all y values are equal, the
+    line is flat and rsquared is NaN (as the correlation is).
+
+    Examples
+    --------
+
+    >>> import rolling
+    >>> pairs = [(1, 2), (2, 4), (3, 5), (4, 4), (5, 6)]
+    >>> r_reg = rolling.LinReg(pairs, 3)
+    >>> next(r_reg)
+    LinRegResult(slope=1.5, intercept=0.6666666666666665, rsquared=0.9642857142857142)
+
+    """
+
+    @property
+    def current_value(self):
+        if self._obs < 2 or self._sxx <= 0:
+            nan = float("nan")
+            return LinRegResult(nan, nan, nan)
+
+        slope = self._sxy / self._sxx
+        intercept = self._mean_y - slope * self._mean_x
+        if self._syy <= 0:
+            # as for Corr, r is undefined if all y values are equal
+            rsquared = float("nan")
+        else:
+            rsquared = self._sxy * self._sxy / (self._sxx * self._syy)
+        return LinRegResult(slope, intercept, rsquared)
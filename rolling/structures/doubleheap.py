@@ -0,0 +1,143 @@
+from heapq import heapify, heappush, heappop
+
+
+class DoubleHeap(object):
+    """
+    Collection of numbers split into two heaps about the
+    median, supporting O(log n) insertion and removal, and
+    O(1) lookup of the middle one or two values by rank.
+
+    The smaller half of the values is stored in a max-heap
+    (as negated values) and the larger half in a min-heap.
+    The lower heap holds the extra value if the size is odd.
+
+    Parameters
+    ----------
+
+    expected_size : int, optional (unused, for compatibility
+        with other sorted collections)
+
+    Notes
+    -----
+
+    Removal is lazy: a removed value is recorded and only
+    popped from its heap once it reaches the top. The heaps
+    are rebuilt whenever more than half of their entries are
+    waiting to be removed, so memory usage remains O(n).
+
+    Only the middle ranks (n - 1) // 2 and n // 2 can be
+    looked up, where n is the number of values.
+
+    """
+
+    def __init__(self, expected_size=None):
+        self._lo = []  # max-heap of the smaller values (negated)
+        self._hi = []  # min-heap of the larger values
+        self._lo_size = 0
+        self._hi_size = 0
+        # counts of values waiting to be removed from each heap
+        self._lo_removed = {}
+        self._hi_removed = {}
+
+    @classmethod
+    def from_sorted(cls, values, expected_size=None):
+        """
+        Build a DoubleHeap from an iterable of sorted values in O(n) time
+        """
+        values = list(values)
+        n_lo = (len(values) + 1) // 2
+        self = cls(expected_size)
+        # negated values in descending order and values in
+        # ascending order are both already valid heaps
+        self._lo = [-value for value in reversed(values[:n_lo])]
+        self._hi = values[n_lo:]
+        self._lo_size = n_lo
+        self._hi_size = len(values) - n_lo
+        return self
+
+    def insert(self, value):
+        if not self._lo_size or value <= -self._lo[0]:
+            heappush(self._lo, -value)
+            self._lo_size += 1
+        else:
+            heappush(self._hi, value)
+            self._hi_size += 1
+        self._rebalance()
+
+    def remove(self, value):
+        # the value must be in the collection
+        if value <= -self._lo[0]:
+            self._lo_removed[value] = self._lo_removed.get(value, 0) + 1
+            self._lo_size -= 1
+            self._prune_lo()
+        else:
+            self._hi_removed[value] = self._hi_removed.get(value, 0) + 1
+            self._hi_size -= 1
+            self._prune_hi()
+        self._rebalance()
+
+    def _rebalance(self):
+        if self._lo_size > self._hi_size + 1:
+            heappush(self._hi, -heappop(self._lo))
+            self._lo_size -= 1
+            self._hi_size += 1
+            self._prune_lo()
+        elif self._lo_size < self._hi_size:
+            heappush(self._lo, -heappop(self._hi))
+            self._hi_size -= 1
+            self._lo_size += 1
+            self._prune_hi()
+
+    def _prune_lo(self):
+        "Pop removed values from the top of the lower heap"
+        lo, removed = self._lo, self._lo_removed
+        while lo and -lo[0] in removed:
+            value = -heappop(lo)
+            if removed[value] == 1:
+                del removed[value]
+            else:
+                removed[value] -= 1
+        if len(lo) > 2 * self._lo_size + 16:
+            self._lo = self._compact(lo, removed, -1)
+
+    def _prune_hi(self):
+        "Pop removed values from the top of the upper heap"
+        hi, removed = self._hi, self._hi_removed
+        while hi and hi[0] in removed:
+            value = heappop(hi)
+            if removed[value] == 1:
+                del removed[value]
+            else:
+                removed[value] -= 1
+        if len(hi) > 2 * self._hi_size + 16:
+            self._hi = self._compact(hi, removed, 1)
+
+    @staticmethod
+    def _compact(heap, removed, sign):
+        "Return the heap without any of the removed values"
+        kept = []
+        for entry in heap:
+            value = sign * entry
+            count = removed.get(value)
+            if count:
+                if count == 1:
+                    del removed[value]
+                else:
+                    removed[value] -= 1
+            else:
+                kept.append(entry)
+        heapify(kept)
+        return kept
+
+    def __getitem__(self, i):
+        n = self._lo_size + self._hi_size
+        if i < 0:
+            i += n
+        if i == (n - 1) // 2 and n:
+            return -self._lo[0]
+        if i == n // 2 and n:
+            return self._hi[0]
+        raise IndexError("only the middle ranks of a DoubleHeap can be looked up")
+
+    def __len__(self):
+        return self._lo_size + self._hi_size
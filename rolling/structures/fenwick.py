@@ -0,0 +1,141 @@
+from math import ceil, floor
+from operator import index
+
+
+class FenwickHistogram(object):
+    """
+    Sorted collection of integers from a bounded domain,
+    stored as a Fenwick tree (binary indexed tree) of the
+    count of each value, supporting O(log V) insertion,
+    removal, lookup by rank and finding the rank of a value.
+
+    Parameters
+    ----------
+
+    lo : int, the smallest value that can be stored
+    hi : int, the largest value that can be stored
+
+    Notes
+    -----
+
+    V = hi - lo + 1 is the size of the domain. Memory usage
+    is O(V) regardless of the number of values stored, and
+    no objects are allocated when values are inserted.
+
+    The value at a given rank is found by descending the
+    implicit tree from its largest power of two, as described
+    by Fenwick [1].
+
+    [1] Fenwick (1994), "A new data structure for cumulative
+        frequency tables"
+
+    """
+
+    def __init__(self, lo, hi):
+        lo, hi = index(lo), index(hi)
+        if hi < lo:
+            raise ValueError("hi must not be less than lo")
+        self.lo = lo
+        self.hi = hi
+        self._size = size = hi - lo + 1
+        self._tree = [0] * (size + 1)
+        self._counts = [0] * size
+        self._len = 0
+        self._top = 1 << (size.bit_length() - 1)
+
+    @classmethod
+    def from_sorted(cls, values, lo, hi):
+        """
+        Build a FenwickHistogram from an iterable of values in O(n + V) time
+        """
+        self = cls(lo, hi)
+        counts = self._counts
+        for value in values:
+            counts[self._position(value)] += 1
+            self._len += 1
+
+        # each node adds its partial sum to its parent
+        tree = self._tree
+        tree[1:] = counts
+        for i in range(1, self._size + 1):
+            parent = i + (i & -i)
+            if parent <= self._size:
+                tree[parent] += tree[i]
+        return self
+
+    def _position(self, value):
+        "Return the position of value in the domain, from 0"
+        position = index(value) - self.lo
+        if not 0 <= position < self._size:
+            raise ValueError(
+                "value {} outside of domain ({}, {})".format(value, self.lo, self.hi)
+            )
+        return position
+
+    def _add(self, position, delta):
+        tree = self._tree
+        i = position + 1
+        while i <= self._size:
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i):
+        "Return the number of values at the first i positions"
+        tree = self._tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def insert(self, value):
+        position = self._position(value)
+        self._counts[position] += 1
+        self._add(position, 1)
+        self._len += 1
+
+    def remove(self, value):
+        position = self._position(value)
+        if not self._counts[position]:
+            raise KeyError("Not Found")
+        self._counts[position] -= 1
+        self._add(position, -1)
+        self._len -= 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("index out of range")
+
+        # find the last position whose prefix count is <= i
+        tree = self._tree
+        position = 0
+        step = self._top
+        while step:
+            j = position + step
+            if j <= self._size and tree[j] <= i:
+                position = j
+                i -= tree[j]
+            step >>= 1
+        return self.lo + position
+
+    def bisect_left(self, value):
+        """
+        Return the number of values less than value
+        """
+        return self._prefix(min(max(ceil(value) - self.lo, 0), self._size))
+
+    def bisect_right(self, value):
+        """
+        Return the number of values less than or equal to value
+        """
+        return self._prefix(min(max(floor(value) - self.lo + 1, 0), self._size))
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for position, count in enumerate(self._counts):
+            for _ in range(count):
+                yield self.lo + position
@@ -0,0 +1,121 @@
+from math import log2
+
+
+def _xlog2x(x):
+    return x * log2(x) if x else 0.0
+
+
+class FrequencyTable(object):
+    """
+    A dictionary mapping each item to a count, and mapping
+    these counts to a set of items, with O(1) increment and
+    decrement of an item's count.
+
+    As well as the count of each item, the table tracks:
+
+      - the number of distinct items, len(table)
+      - the set of items with the largest count
+      - the total count of all items
+      - the sum of c*log2(c) over all item counts c, from
+        which the Shannon entropy is computed in O(1)
+
+    Parameters
+    ----------
+
+    iterable : any iterable object (optional)
+        count the frequencies of items in the iterable
+
+    Notes
+    -----
+
+    The entropy term is updated incrementally, so after a very
+    large number of updates it may differ from a freshly computed
+    value by a small amount of floating point error.
+
+    """
+
+    def __init__(self, iterable=None):
+        self.item_to_freq = {}
+        self.freq_to_items = {}
+        self.largest_count = 0
+        self.total = 0
+        self.entropy_term = 0.0
+        if iterable:
+            for item in iterable:
+                self.increment(item)
+
+    def increment(self, item):
+        "Increase the count of an item by one"
+        freq = self.item_to_freq.get(item, 0)
+        self.item_to_freq[item] = freq + 1
+
+        if freq:
+            items = self.freq_to_items[freq]
+            items.remove(item)
+            if not items:
+                del self.freq_to_items[freq]
+
+        try:
+            self.freq_to_items[freq + 1].add(item)
+        except KeyError:
+            self.freq_to_items[freq + 1] = {item}
+
+        if freq == self.largest_count:
+            self.largest_count += 1
+
+        self.total += 1
+        self.entropy_term += _xlog2x(freq + 1) - _xlog2x(freq)
+
+    def decrement(self, item):
+        "Decrease the count of an item by one"
+        freq = self.item_to_freq.get(item, 0)
+        # if the item in not there already, we are done
+        if not freq:
+            return
+
+        items = self.freq_to_items[freq]
+        items.remove(item)
+        if not items:
+            del self.freq_to_items[freq]
+            # if the item was the single most common item,
+            # the largest count goes down by one
+            if freq == self.largest_count:
+                self.largest_count -= 1
+
+        if freq > 1:
+            self.item_to_freq[item] = freq - 1
+            try:
+                self.freq_to_items[freq - 1].add(item)
+            except KeyError:
+                self.freq_to_items[freq - 1] = {item}
+        else:
+            del self.item_to_freq[item]
+
+        self.total -= 1
+        self.entropy_term += _xlog2x(freq - 1) - _xlog2x(freq)
+
+    @property
+    def most_common_items(self):
+        return self.freq_to_items.get(self.largest_count, set())
+
+    @property
+    def entropy(self):
+        "Shannon entropy (in bits) of the item frequencies"
+        if not self.total:
+            return 0.0
+        return log2(self.total) - self.entropy_term / self.total
+
+    def __iter__(self):
+        return iter(self.item_to_freq)
+
+    def __len__(self):
+        return len(self.item_to_freq)
+
+    def __contains__(self, item):
+        return item in self.item_to_freq
+
+    def __getitem__(self, item):
+        return self.item_to_freq.get(item, 0)
+
+    def __bool__(self):
+        return bool(self.item_to_freq)
@@ -0,0 +1,177 @@
+"""
+Sliding HyperLogLog for estimating the number of distinct
+items among the most recent items of a stream.
+
+HyperLogLog [1] hashes each item to one of m = 2**p registers
+and records the largest "rank" (the position of the leftmost
+1-bit in the rest of the hash) seen in each register. The
+number of distinct items is estimated from the harmonic mean
+of 2**rank over the registers.
+
+To support a sliding window, each register keeps the list of
+possible future maxima (LPFM) proposed by Chabchoub and Hebrail [2]:
+the (position, rank) pairs that could still be the maximum of the
+register once older items leave the window. A pair is dropped as
+soon as a newer item with a greater or equal rank arrives, so the
+ranks in each list are strictly decreasing from oldest to newest
+and the register's current value is the rank at the front.
+
+    [1] Flajolet, Fusy, Gandouet and Meunier (2007), "HyperLogLog: the
+        analysis of a near-optimal cardinality estimation algorithm"
+    [2] Chabchoub and Hebrail (2010), "Sliding HyperLogLog: Estimating
+        cardinality in a data stream over a sliding window"
+
+"""
+from heapq import heappush, heappop
+from math import log
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash64(item):
+    """
+    Return a well-mixed 64-bit hash of item (the
+    splitmix64 finaliser applied to Python's hash)
+    """
+    z = (hash(item) + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class SlidingHyperLogLog(object):
+    """
+    Estimate the number of distinct items in a window
+    of the most recently added items.
+
+    Items are added to the newest end of the window with
+    add() and expire from the oldest end with remove_oldest().
+
+    Parameters
+    ----------
+
+    precision : int, default 12, between 4 and 16
+        the number of registers used is 2**precision
+
+    Notes
+    -----
+
+    The relative standard error of the estimate is about
+    1.04 / sqrt(2**precision), e.g. 1.6% for precision 12.
+
+    Memory use does not depend on the window size, only on
+    the number of registers and the lengths of their LPFMs
+    (O(log k) entries each on average, where k is the number
+    of items in the window).
+
+    """
+
+    def __init__(self, precision=12):
+        if not isinstance(precision, int):
+            raise TypeError(
+                "precision must be integer type, got {}".format(
+                    type(precision).__name__
+                )
+            )
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+
+        self.precision = precision
+        self._m = m = 1 << precision
+        self._rank_bits = 64 - precision
+        self._rank_mask = (1 << self._rank_bits) - 1
+
+        if m == 16:
+            self._alpha = 0.673
+        elif m == 32:
+            self._alpha = 0.697
+        elif m == 64:
+            self._alpha = 0.709
+        else:
+            self._alpha = 0.7213 / (1 + 1.079 / m)
+
+        # each LPFM entry is packed into one integer as
+        # (position << 6) | rank, as rank is always < 64
+        self._registers = [None] * m
+
+        # heap of (position, register) for the front entry of
+        # each register, used to find entries that expire
+        self._fronts = []
+
+        # the sum of 2**(64 - rank) over the current register
+        # values (kept as an integer so that it never drifts)
+        self._harmonic = m << 64
+        self._zeros = m
+
+        self._start = 0  # position of the oldest item in the window
+        self._end = 0  # position of the next item to be added
+
+    def _set_register(self, old_rank, new_rank):
+        self._harmonic += (1 << (64 - new_rank)) - (1 << (64 - old_rank))
+        if not old_rank:
+            self._zeros -= 1
+        if not new_rank:
+            self._zeros += 1
+
+    def add(self, item):
+        "Add an item to the newest end of the window"
+        h = _hash64(item)
+        j = h >> self._rank_bits
+        rank = self._rank_bits - (h & self._rank_mask).bit_length() + 1
+        entry = (self._end << 6) | rank
+
+        register = self._registers[j]
+
+        if register is None:
+            self._registers[j] = [entry]
+            heappush(self._fronts, (self._end, j))
+            self._set_register(0, rank)
+
+        else:
+            front_rank = register[0] & 63
+            # remove the entries that can no longer be the maximum
+            while register and register[-1] & 63 <= rank:
+                register.pop()
+            register.append(entry)
+            if len(register) == 1:
+                heappush(self._fronts, (self._end, j))
+                self._set_register(front_rank, rank)
+
+        self._end += 1
+
+    def remove_oldest(self):
+        "Remove the oldest item from the window"
+        self._start += 1
+        fronts = self._fronts
+
+        while fronts and fronts[0][0] < self._start:
+            position, j = heappop(fronts)
+            register = self._registers[j]
+
+            # skip fronts which were removed by a later item
+            if register is None or register[0] >> 6 != position:
+                continue
+
+            old_rank = register[0] & 63
+            del register[0]
+
+            if register:
+                heappush(fronts, (register[0] >> 6, j))
+                self._set_register(old_rank, register[0] & 63)
+            else:
+                self._registers[j] = None
+                self._set_register(old_rank, 0)
+
+    def estimate(self):
+        "Return the estimated number of distinct items in the window"
+        m = self._m
+        estimate = self._alpha * m * m * (1 << 64) / self._harmonic
+
+        # use linear counting for small cardinalities
+        if estimate <= 2.5 * m and self._zeros:
+            estimate = m * log(m / self._zeros)
+
+        return estimate
+
+    def __len__(self):
+        return self._end - self._start
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+
+
+class LRU(object):
+    """
+    Mapping of a bounded size that discards the least
+    recently used item when full, and counts how many
+    lookups find (hits) or do not find (misses) a key.
+
+    Parameters
+    ----------
+
+    maxsize : int, default 128, the largest number of
+        items held
+
+    Notes
+    -----
+
+    Lookup and insertion are O(1), using an OrderedDict
+    whose order is the order in which keys were last used.
+
+    """
+
+    def __init__(self, maxsize=128):
+        if not isinstance(maxsize, int):
+            raise TypeError(
+                "maxsize must be integer type, got {}".format(type(maxsize).__name__)
+            )
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def get(self, key, default=None):
+        "Return the value for key (marking it as most recently used), or default"
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        "Set the value for key, discarding the least recently used item if full"
+        items = self._items
+        items[key] = value
+        items.move_to_end(key)
+        if len(items) > self.maxsize:
+            items.popitem(last=False)
+
+    def clear(self):
+        "Remove all items and reset the hit and miss counts"
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "LRU(maxsize={}, hits={}, misses={})".format(
+            self.maxsize, self.hits, self.misses
+        )
@@ -0,0 +1,79 @@
+from array import array
+
+
+class MirroredBuffer(object):
+    """
+    Ring buffer of a bounded size, storing each value twice
+    in an array of twice the size so that the values of the
+    buffer, oldest first, are always contiguous in memory.
+
+    Parameters
+    ----------
+
+    typecode : str, the typecode of the array holding
+        the values (as for array.array, e.g. 'd' or 'q')
+    maxsize : int, the largest number of values held
+
+    Notes
+    -----
+
+    A value at position i of the ring is also stored at
+    position i + maxsize of the array. If the oldest value
+    is at position s, the values of the buffer are those
+    of the array between s and s + len(buffer), so a view
+    of them can be taken without copying.
+
+    Like a deque with maxlen, appending to a full buffer
+    discards the oldest value.
+
+    """
+
+    def __init__(self, typecode, maxsize):
+        self.maxsize = maxsize
+        self._array = array(typecode, bytes(2 * maxsize * array(typecode).itemsize))
+        self._memoryview = memoryview(self._array)
+        if hasattr(self._memoryview, "toreadonly"):
+            self._memoryview = self._memoryview.toreadonly()
+        self._start = 0
+        self._length = 0
+
+    def append(self, value):
+        "Add value as the newest value, discarding the oldest value if full"
+        maxsize = self.maxsize
+        if self._length == maxsize:
+            position = self._start
+            self._start = (position + 1) % maxsize
+        else:
+            position = (self._start + self._length) % maxsize
+            self._length += 1
+        self._array[position] = value
+        self._array[position + maxsize] = value
+
+    def popleft(self):
+        "Remove and return the oldest value"
+        if not self._length:
+            raise IndexError("pop from an empty buffer")
+        value = self._array[self._start]
+        self._start = (self._start + 1) % self.maxsize
+        self._length -= 1
+        return value
+
+    def view(self):
+        """
+        Return a memoryview of the values, oldest first, which
+        is read-only on Python 3.8+ and is only valid until the
+        buffer is next changed
+        """
+        return self._memoryview[self._start : self._start + self._length]
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "MirroredBuffer({!r})".format(self.view().tolist())
@@ -0,0 +1,25 @@
+class NullBuffer(object):
+    """
+    Stand-in for the buffer of a window that only counts
+    the values appended to it, without storing them.
+
+    Used for expanding windows, whose values are never
+    removed, so that the size of the window is known
+    while memory usage stays O(1).
+
+    """
+
+    __slots__ = ("_length",)
+
+    def __init__(self):
+        self._length = 0
+
+    def append(self, value):
+        "Count a value added to the window"
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "NullBuffer(length={})".format(self._length)
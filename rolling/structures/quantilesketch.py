@@ -0,0 +1,166 @@
+"""
+Sliding quantile sketch for approximating the quantiles of the
+most recent values of a stream using memory sublinear in the
+number of values.
+
+The stream is split into consecutive blocks of B values. The
+block currently being filled is summarised by a compactor in the
+style of Munro and Paterson [1] and KLL [2]: values are collected
+in a buffer of capacity c and, when a buffer is full, it is sorted
+and every other value is promoted to the buffer at the next level
+up, where each value stands for twice as many values.
+
+When a block is complete it is sealed: its compacted values are
+resampled into a sorted list of values which each stand for the
+same number s of values. Sealed blocks are discarded whole once
+all of their values have left the window. The samples of all the
+sealed blocks are kept together in a sorted collection, from
+which quantiles are read by rank.
+
+    [1] Munro and Paterson (1980), "Selection and sorting with
+        limited storage"
+    [2] Karnin, Lang and Liberty (2016), "Optimal quantile
+        approximation in streams"
+
+"""
+from collections import deque
+from math import ceil
+
+from .sortedblocks import SortedBlocks
+
+
+class SlidingQuantileSketch(object):
+    """
+    Approximate the quantiles of a window of the most
+    recently added values.
+
+    Parameters
+    ----------
+
+    window_size : int, the number of most recent values
+        in the window
+    eps : float, default 0.01, between 0 and 1
+        the permitted rank error as a fraction of the
+        window size
+
+    Notes
+    -----
+
+    The exact rank in the window of each value returned by
+    quantile(q) is deterministically within eps * window_size
+    of q * window_size. The block size is B = eps * window_size / 3
+    and errors in the ranks arise in three places:
+
+      - the oldest sealed block may hold values that have
+        left the window, and values in the block being
+        filled are not counted (less than B in total)
+      - compacting the values of each block (at most
+        eps * B / 4 per block)
+      - resampling each sealed block (less than
+        s = eps * B / 4 per block)
+
+    Memory use is O(1 / eps**2 + log(eps * k)**2 / eps), where
+    k is the window size, rather than O(k). Only when k is much
+    larger than 1 / eps**2 does the sketch use less memory than
+    storing the window.
+
+    """
+
+    def __init__(self, window_size, eps=0.01):
+        if not 0 < eps < 1:
+            raise ValueError("eps must be between 0 and 1")
+
+        self.window_size = window_size
+        self.eps = eps
+
+        self._block_size = block_size = max(1, int(eps * window_size / 3))
+        self._weight = max(1, int(eps * block_size / 4))
+
+        # each level compacts at most B / c times, adding an error
+        # of at most B / c in total, and there are fewer than
+        # B.bit_length() levels that compact
+        levels = block_size.bit_length()
+        capacity = ceil(4 * levels / eps)
+        self._capacity = capacity + capacity % 2
+
+        self._levels = [[]]
+        self._offsets = [0]
+        self._filled = 0  # number of values in the open block
+        self._count = 0  # number of values ever added
+
+        # deque of (end position, samples) for each sealed block
+        self._blocks = deque()
+        self._samples = SortedBlocks(max(1, window_size // self._weight))
+
+    def add(self, value):
+        "Add a value to the newest end of the window"
+        level = self._levels[0]
+        level.append(value)
+        if len(level) >= self._capacity:
+            self._compact(0)
+
+        self._count += 1
+        self._filled += 1
+
+        if self._filled == self._block_size:
+            self._seal()
+
+        # discard blocks whose values have all left the window
+        blocks = self._blocks
+        while blocks and blocks[0][0] <= self._count - self.window_size:
+            _, samples = blocks.popleft()
+            for sample in samples:
+                self._samples.remove(sample)
+
+    def _compact(self, h):
+        "Promote every other value of the h-th level to the next level"
+        levels = self._levels
+        if h + 1 == len(levels):
+            levels.append([])
+            self._offsets.append(0)
+
+        level = levels[h]
+        level.sort()
+        # alternate between keeping the odd and even values so
+        # that errors from successive compactions tend to cancel
+        offset = self._offsets[h]
+        self._offsets[h] = 1 - offset
+        levels[h + 1].extend(level[offset::2])
+        level.clear()
+
+        if len(levels[h + 1]) >= self._capacity:
+            self._compact(h + 1)
+
+    def _seal(self):
+        "Resample the open block into values of equal weight"
+        weighted = sorted(
+            (value, 1 << h)
+            for h, level in enumerate(self._levels)
+            for value in level
+        )
+        weight = self._weight
+        samples = []
+        total = 0
+        for value, w in weighted:
+            total += w
+            while total >= weight:
+                samples.append(value)
+                total -= weight
+
+        self._blocks.append((self._count, samples))
+        for sample in samples:
+            self._samples.insert(sample)
+
+        self._levels = [[]]
+        self._offsets = [0]
+        self._filled = 0
+
+    def quantile(self, q):
+        "Return the approximate q-th quantile (0 <= q <= 1) of the window"
+        samples = self._samples
+        if not samples:
+            return float("nan")
+        return samples[round(q * (len(samples) - 1))]
+
+    def __len__(self):
+        return min(self._count, self.window_size)
@@ -1,8 +1,10 @@
 """
 This code is taken from Raymond Hettinger's recipe for
 indexable skiplist solution to the rolling median problem.
-Only very minor modifications have been made to the code
-(e.g. to make it compatible with Python 3).
+It has been made compatible with Python 3, and modified to
+reuse removed nodes, to draw node levels from a seedable
+random number generator and to build a skiplist from sorted
+values in linear time.
 
     http://code.activestate.com/recipes/576930/
 
@@ -21,11 +23,12 @@ I referred to the implementation there also:
     github.com/pandas-dev/pandas/blob/master/pandas/_libs/skiplist.pxd
 
 The indexable skiplist allows O(log k) insertions and deletions
-and allows a value to be retrieved by rank.
+and allows a value to be retrieved by rank, or the rank of a value
+to be found.
 
 """
-from random import random
-from math import log, ceil
+from random import Random
+from math import log
 
 
 class Node(object):
@@ -56,12 +59,79 @@ NIL = Node(End(), [], [])
 class IndexableSkiplist(object):
     """
     Sorted collection supporting O(lg n) insertion, removal, and lookup by rank.
+
+    Parameters
+    ----------
+
+    expected_size : int, the expected maximum number of values,
+        used to choose the number of levels in the skiplist
+    seed : optional, seed for the random number generator used
+        to choose node levels (for reproducible structures)
+
+    Notes
+    -----
+
+    Node levels are drawn by counting the trailing zero bits of
+    a single call to getrandbits(), giving level d with
+    probability 2**-d (up to the maximum number of levels).
+
+    Nodes unlinked by remove() are kept on a free list and are
+    reused (with their level) by the next insert(). When a window
+    slides, each removal is followed by an insertion, so no new
+    nodes are allocated and no random levels need to be drawn.
+
     """
 
-    def __init__(self, expected_size):
+    def __init__(self, expected_size, seed=None):
         self.size = 0
         self.maxlevels = int(1 + log(expected_size, 2))
         self.head = Node("HEAD", [NIL] * self.maxlevels, [1] * self.maxlevels)
+        self._random = Random(seed)
+        self._free = []
+
+    @classmethod
+    def from_sorted(cls, values, expected_size=None, seed=None):
+        """
+        Build a skiplist from an iterable of sorted values in O(n) time
+        """
+        values = list(values)
+        if expected_size is None:
+            expected_size = max(len(values), 1)
+
+        self = cls(expected_size, seed)
+        maxlevels = self.maxlevels
+
+        # the last node seen at each level, and its position
+        # (the head is at position 0, the i-th value at i + 1)
+        last = [self.head] * maxlevels
+        last_position = [0] * maxlevels
+
+        for position, value in enumerate(values, 1):
+            d = self._random_level()
+            node = Node(value, [None] * d, [None] * d)
+            for level in range(d):
+                prevnode = last[level]
+                prevnode.next[level] = node
+                prevnode.width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+
+        for level in range(maxlevels):
+            last[level].next[level] = NIL
+            last[level].width[level] = len(values) + 1 - last_position[level]
+
+        self.size = len(values)
+        return self
+
+    def _random_level(self):
+        """
+        Return a level d between 1 and maxlevels with probability 2**-d
+        """
+        bits = self._random.getrandbits(self.maxlevels)
+        if not bits:
+            return self.maxlevels
+        # count the trailing zero bits
+        return (bits & -bits).bit_length()
 
     def __getitem__(self, i):
         node = self.head
@@ -72,6 +142,39 @@ class IndexableSkiplist(object):
                 node = node.next[level]
         return node.value
 
+    def bisect_left(self, value):
+        """
+        Return the number of values less than value
+        """
+        node = self.head
+        position = 0
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value < value:
+                position += node.width[level]
+                node = node.next[level]
+        return position
+
+    def bisect_right(self, value):
+        """
+        Return the number of values less than or equal to value
+        """
+        node = self.head
+        position = 0
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value <= value:
+                position += node.width[level]
+                node = node.next[level]
+        return position
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not NIL:
+            yield node.value
+            node = node.next[0]
+
     def insert(self, value):
         # find first node on each level where node.next[levels].value > value
         chain = [None] * self.maxlevels
@@ -83,9 +186,16 @@ class IndexableSkiplist(object):
                 node = node.next[level]
             chain[level] = node
 
+        # reuse a removed node if possible, else make a new one
+        if self._free:
+            newnode = self._free.pop()
+            newnode.value = value
+            d = len(newnode.next)
+        else:
+            d = self._random_level()
+            newnode = Node(value, [None] * d, [None] * d)
+
         # insert a link to the newnode at each level
-        d = min(self.maxlevels, 1 - int(log(random(), 2.0)))
-        newnode = Node(value, [None] * d, [None] * d)
         steps = 0
         for level in range(d):
             prevnode = chain[level]
@@ -110,7 +220,8 @@ class IndexableSkiplist(object):
             raise KeyError("Not Found")
 
         # remove one link at each level
-        d = len(chain[0].next[0].next)
+        oldnode = chain[0].next[0]
+        d = len(oldnode.next)
         for level in range(d):
             prevnode = chain[level]
             prevnode.width[level] += prevnode.next[level].width[level] - 1
@@ -118,3 +229,178 @@ class IndexableSkiplist(object):
         for level in range(d, self.maxlevels):
             chain[level].width[level] -= 1
         self.size -= 1
+
+        # keep the node for reuse by the next insert
+        oldnode.value = None
+        self._free.append(oldnode)
+
+
+class SumNode(object):
+    __slots__ = "value", "next", "width", "sum"
+
+    def __init__(self, value, next, width, sum):
+        self.value, self.next, self.width = value, next, width
+        self.sum = sum
+
+
+class SummingSkiplist(IndexableSkiplist):
+    """
+    Indexable skiplist that also keeps the sum of the values
+    spanned by each link, supporting O(lg n) insertion, removal,
+    lookup by rank and sums of values between two ranks.
+
+    Parameters
+    ----------
+
+    expected_size : int, the expected maximum number of values,
+        used to choose the number of levels in the skiplist
+    seed : optional, seed for the random number generator used
+        to choose node levels (for reproducible structures)
+
+    Notes
+    -----
+
+    Alongside its width, each link stores the sum of the values
+    of the nodes it passes over, including the node it points to.
+    A sum of the values with rank less than i is then found on
+    the same path as the i-th value is looked up.
+
+    The link sums are updated by adding and subtracting values,
+    so floating point values may accumulate rounding error.
+
+    """
+
+    def __init__(self, expected_size, seed=None):
+        super().__init__(expected_size, seed)
+        self.head = SumNode(
+            "HEAD", [NIL] * self.maxlevels, [1] * self.maxlevels, [0] * self.maxlevels
+        )
+
+    @classmethod
+    def from_sorted(cls, values, expected_size=None, seed=None):
+        """
+        Build a skiplist from an iterable of sorted values in O(n) time
+        """
+        values = list(values)
+        if expected_size is None:
+            expected_size = max(len(values), 1)
+
+        self = cls(expected_size, seed)
+        maxlevels = self.maxlevels
+
+        # the last node seen at each level, and its position and
+        # the sum of the values up to and including that node
+        last = [self.head] * maxlevels
+        last_position = [0] * maxlevels
+        last_total = [0] * maxlevels
+        total = 0
+
+        for position, value in enumerate(values, 1):
+            total += value
+            d = self._random_level()
+            node = SumNode(value, [None] * d, [None] * d, [None] * d)
+            for level in range(d):
+                prevnode = last[level]
+                prevnode.next[level] = node
+                prevnode.width[level] = position - last_position[level]
+                prevnode.sum[level] = total - last_total[level]
+                last[level] = node
+                last_position[level] = position
+                last_total[level] = total
+
+        for level in range(maxlevels):
+            last[level].next[level] = NIL
+            last[level].width[level] = len(values) + 1 - last_position[level]
+            last[level].sum[level] = total - last_total[level]
+
+        self.size = len(values)
+        return self
+
+    def prefix_sum(self, i):
+        """
+        Return the sum of the values with rank less than i
+        """
+        node = self.head
+        total = 0
+        for level in reversed(range(self.maxlevels)):
+            while node.width[level] <= i:
+                i -= node.width[level]
+                total += node.sum[level]
+                node = node.next[level]
+        return total
+
+    def range_sum(self, i, j):
+        """
+        Return the sum of the values with rank from i up to (but not including) j
+        """
+        return self.prefix_sum(j) - self.prefix_sum(i)
+
+    def insert(self, value):
+        # find first node on each level where node.next[levels].value > value
+        chain = [None] * self.maxlevels
+        steps_at_level = [0] * self.maxlevels
+        sums_at_level = [0] * self.maxlevels
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                sums_at_level[level] += node.sum[level]
+                node = node.next[level]
+            chain[level] = node
+
+        # reuse a removed node if possible, else make a new one
+        if self._free:
+            newnode = self._free.pop()
+            newnode.value = value
+            d = len(newnode.next)
+        else:
+            d = self._random_level()
+            newnode = SumNode(value, [None] * d, [None] * d, [None] * d)
+
+        # insert a link to the newnode at each level, splitting the
+        # sum of the link it replaces at the new node
+        steps = 0
+        total = 0
+        for level in range(d):
+            prevnode = chain[level]
+            newnode.next[level] = prevnode.next[level]
+            prevnode.next[level] = newnode
+            newnode.width[level] = prevnode.width[level] - steps
+            prevnode.width[level] = steps + 1
+            newnode.sum[level] = prevnode.sum[level] - total
+            prevnode.sum[level] = total + value
+            steps += steps_at_level[level]
+            total += sums_at_level[level]
+        for level in range(d, self.maxlevels):
+            chain[level].width[level] += 1
+            chain[level].sum[level] += value
+        self.size += 1
+
+    def remove(self, value):
+        # find first node on each level where node.next[levels].value >= value
+        chain = [None] * self.maxlevels
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+        if value != chain[0].next[0].value:
+            raise KeyError("Not Found")
+
+        # remove one link at each level, joining the sums of the
+        # links either side of the removed node
+        oldnode = chain[0].next[0]
+        d = len(oldnode.next)
+        for level in range(d):
+            prevnode = chain[level]
+            prevnode.width[level] += oldnode.width[level] - 1
+            prevnode.sum[level] += oldnode.sum[level] - value
+            prevnode.next[level] = oldnode.next[level]
+        for level in range(d, self.maxlevels):
+            chain[level].width[level] -= 1
+            chain[level].sum[level] -= value
+        self.size -= 1
+
+        # keep the node for reuse by the next insert
+        oldnode.value = None
+        self._free.append(oldnode)
@@ -0,0 +1,162 @@
+from bisect import bisect_left, bisect_right, insort
+from math import sqrt
+
+
+class SortedBlocks(object):
+    """
+    Sorted collection stored as a list of sorted blocks,
+    supporting insertion, removal, lookup by rank and
+    finding the rank of a value.
+
+    Values are located with bisect on the maximum of each
+    block and then within the block. Blocks are split when
+    they grow to twice the load and merged with a neighbour
+    when they shrink below half of it.
+
+    Parameters
+    ----------
+
+    expected_size : int, default 1000
+        the expected number of values, used to choose the
+        size of the blocks
+
+    Notes
+    -----
+
+    With block size b, insertion and removal are O(log n + b)
+    and lookup by rank is O(n / b), but the O(b) part is a
+    single memmove of a list, which is very fast in CPython.
+    The block size is chosen to be roughly 8 * sqrt(n).
+
+    """
+
+    def __init__(self, expected_size=1000):
+        self._load = max(64, 8 * int(sqrt(expected_size)))
+        self._lists = []
+        self._maxes = []
+        self._len = 0
+
+    @classmethod
+    def from_sorted(cls, values, expected_size=None):
+        """
+        Build a SortedBlocks from an iterable of sorted values in O(n) time
+        """
+        values = list(values)
+        if expected_size is None:
+            expected_size = max(len(values), 1)
+        self = cls(expected_size)
+        load = self._load
+        self._lists = [values[i : i + load] for i in range(0, len(values), load)]
+        self._maxes = [block[-1] for block in self._lists]
+        self._len = len(values)
+        return self
+
+    def insert(self, value):
+        lists, maxes = self._lists, self._maxes
+
+        if not maxes:
+            lists.append([value])
+            maxes.append(value)
+            self._len = 1
+            return
+
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            i -= 1
+            lists[i].append(value)
+            maxes[i] = value
+        else:
+            insort(lists[i], value)
+
+        self._len += 1
+
+        if len(lists[i]) > 2 * self._load:
+            self._split(i)
+
+    def remove(self, value):
+        lists, maxes = self._lists, self._maxes
+
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            raise KeyError("Not Found")
+
+        block = lists[i]
+        j = bisect_left(block, value)
+        if block[j] != value:
+            raise KeyError("Not Found")
+
+        del block[j]
+        self._len -= 1
+
+        if not block:
+            del lists[i]
+            del maxes[i]
+            return
+
+        if j == len(block):
+            maxes[i] = block[-1]
+
+        # merge small blocks into their neighbour
+        if len(block) < self._load // 2 and len(lists) > 1:
+            if i == len(lists) - 1:
+                i -= 1
+            lists[i].extend(lists[i + 1])
+            maxes[i] = maxes[i + 1]
+            del lists[i + 1]
+            del maxes[i + 1]
+            if len(lists[i]) > 2 * self._load:
+                self._split(i)
+
+    def _split(self, i):
+        "Split the i-th block into two halves"
+        block = self._lists[i]
+        half = block[self._load :]
+        del block[self._load :]
+        self._maxes[i] = block[-1]
+        self._lists.insert(i + 1, half)
+        self._maxes.insert(i + 1, half[-1])
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("index out of range")
+
+        if i < self._len // 2:
+            for block in self._lists:
+                if i < len(block):
+                    return block[i]
+                i -= len(block)
+        else:
+            i -= self._len
+            for block in reversed(self._lists):
+                if -i <= len(block):
+                    return block[i]
+                i += len(block)
+
+    def bisect_left(self, value):
+        """
+        Return the number of values less than value
+        """
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        before = sum(len(block) for block in self._lists[:i])
+        return before + bisect_left(self._lists[i], value)
+
+    def bisect_right(self, value):
+        """
+        Return the number of values less than or equal to value
+        """
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        before = sum(len(block) for block in self._lists[:i])
+        return before + bisect_right(self._lists[i], value)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._lists:
+            yield from block
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from rolling.structures.doubleheap import DoubleHeap
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("insert_probability", [0.3, 0.5, 0.7])
+def test_random_updates_match_sorted_list(seed, insert_probability):
+    rng = random.Random(seed)
+    heap = DoubleHeap()
+    values = []
+    for _ in range(3000):
+        if values and rng.random() > insert_probability:
+            value = rng.choice(values)
+            values.remove(value)
+            heap.remove(value)
+        else:
+            value = rng.randrange(100) if seed else rng.random()
+            values.append(value)
+            heap.insert(value)
+        values.sort()
+
+        n = len(values)
+        assert len(heap) == n
+        if n:
+            assert heap[(n - 1) // 2] == values[(n - 1) // 2]
+            assert heap[n // 2] == values[n // 2]
+
+    # lazily removed values do not accumulate
+    assert len(heap._lo) <= 2 * heap._lo_size + 16
+    assert len(heap._hi) <= 2 * heap._hi_size + 16
+
+
+def test_only_middle_ranks_can_be_looked_up():
+    heap = DoubleHeap()
+    for x in [4, 1, 3, 2]:
+        heap.insert(x)
+    assert heap[1] == 2
+    assert heap[2] == 3
+    with pytest.raises(IndexError):
+        heap[0]
@@ -0,0 +1,76 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from rolling.structures.fenwick import FenwickHistogram
+
+
+@pytest.mark.parametrize("lo, hi", [(0, 0), (0, 9), (-50, 50), (1000, 1300)])
+@pytest.mark.parametrize("insert_probability", [0.3, 0.7])
+def test_random_updates_match_sorted_list(lo, hi, insert_probability):
+    rng = random.Random(hi)
+    histogram = FenwickHistogram(lo, hi)
+    values = []
+    for _ in range(2000):
+        if values and rng.random() > insert_probability:
+            value = rng.choice(values)
+            values.remove(value)
+            histogram.remove(value)
+        else:
+            value = rng.randint(lo, hi)
+            values.append(value)
+            histogram.insert(value)
+        values.sort()
+
+        assert len(histogram) == len(values)
+        if values:
+            i = rng.randrange(len(values))
+            assert histogram[i] == values[i]
+            assert histogram[i - len(values)] == values[i]
+        value = rng.randint(lo - 2, hi + 2)
+        assert histogram.bisect_left(value) == bisect_left(values, value)
+        assert histogram.bisect_right(value) == bisect_right(values, value)
+    assert list(histogram) == values
+
+
+@pytest.mark.parametrize("values", [[], [3], [0, 0, 1, 5, 5, 5, 9, 10]])
+def test_from_sorted(values):
+    histogram = FenwickHistogram.from_sorted(values, 0, 10)
+    assert list(histogram) == values
+    for i in range(len(values)):
+        assert histogram[i] == values[i]
+    for value in range(-1, 12):
+        assert histogram.bisect_left(value) == bisect_left(values, value)
+
+
+def test_bisect_non_integer_value():
+    histogram = FenwickHistogram.from_sorted([1, 2, 2, 3], 0, 5)
+    assert histogram.bisect_left(2.5) == 3
+    assert histogram.bisect_right(1.5) == 1
+
+
+@pytest.mark.parametrize("value", [-1, 11])
+def test_value_outside_domain_raises(value):
+    histogram = FenwickHistogram(0, 10)
+    with pytest.raises(ValueError):
+        histogram.insert(value)
+
+
+def test_non_integer_value_raises():
+    histogram = FenwickHistogram(0, 10)
+    with pytest.raises(TypeError):
+        histogram.insert(2.5)
+
+
+def test_remove_missing_value_raises():
+    histogram = FenwickHistogram.from_sorted([1, 3], 0, 10)
+    with pytest.raises(KeyError):
+        histogram.remove(2)
+
+
+@pytest.mark.parametrize("index", [4, -5])
+def test_index_out_of_range_raises(index):
+    histogram = FenwickHistogram.from_sorted([1, 2, 3, 4], 0, 10)
+    with pytest.raises(IndexError):
+        histogram[index]
@@ -0,0 +1,99 @@
+from collections import Counter
+from math import fsum, log2
+import random
+
+import pytest
+
+from rolling.structures.frequency import FrequencyTable
+
+
+def _entropy(counts):
+    N = sum(counts.values())
+    return -fsum((c / N) * log2(c / N) for c in counts.values())
+
+
+@pytest.mark.parametrize(
+    "iterable,common_items,largest_count",
+    [
+        (None, set(), 0),
+        ("a", {"a"}, 1),
+        ("ab", {"a", "b"}, 1),
+        ("aba", {"a"}, 2),
+        ("abaa", {"a"}, 3),
+        ("ababc", {"a", "b"}, 2),
+        ("ababcc", {"a", "b", "c"}, 2),
+    ],
+)
+def test_init(iterable, common_items, largest_count):
+    table = FrequencyTable(iterable)
+    assert table.most_common_items == common_items
+    assert table.largest_count == largest_count
+    assert len(table) == len(set(iterable or ""))
+
+
+@pytest.mark.parametrize(
+    "iterable,common_items,largest_count",
+    [
+        (None, {"a"}, 1),
+        ("a", {"a"}, 2),
+        ("ab", {"a"}, 2),
+        ("aba", {"a"}, 3),
+        ("ababc", {"a"}, 3),
+        ("ababcc", {"a"}, 3),
+    ],
+)
+def test_increment_item_a(iterable, common_items, largest_count):
+    table = FrequencyTable(iterable)
+    table.increment("a")
+    assert table.most_common_items == common_items
+    assert table.largest_count == largest_count
+
+
+@pytest.mark.parametrize(
+    "iterable,common_items,largest_count",
+    [
+        (None, set(), 0),
+        ("a", set(), 0),
+        ("ab", {"b"}, 1),
+        ("aba", {"a", "b"}, 1),
+        ("abaa", {"a"}, 2),
+        ("ababc", {"b"}, 2),
+        ("ababcc", {"b", "c"}, 2),
+    ],
+)
+def test_decrement_item_a(iterable, common_items, largest_count):
+    table = FrequencyTable(iterable)
+    table.decrement("a")
+    assert table.most_common_items == common_items
+    assert table.largest_count == largest_count
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_updates_match_counter(seed):
+    rng = random.Random(seed)
+    table = FrequencyTable()
+    counter = Counter()
+    for _ in range(2000):
+        item = rng.randrange(30)
+        if rng.random() < 0.55:
+            table.increment(item)
+            counter[item] += 1
+        else:
+            table.decrement(item)
+            if counter[item]:
+                counter[item] -= 1
+        counter += Counter()  # drop zero counts
+
+        assert len(table) == len(counter)
+        assert table.total == sum(counter.values())
+        assert all(table[item] == count for item, count in counter.items())
+        if counter:
+            largest = max(counter.values())
+            assert table.largest_count == largest
+            assert table.most_common_items == {
+                item for item, count in counter.items() if count == largest
+            }
+            assert pytest.approx(table.entropy, abs=1e-9) == _entropy(counter)
+        else:
+            assert table.largest_count == 0
+            assert table.entropy == 0.0
@@ -0,0 +1,39 @@
+import pytest
+
+from rolling.structures.lru import LRU
+
+
+def test_least_recently_used_item_is_discarded():
+    cache = LRU(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_hits_and_misses_are_counted():
+    cache = LRU()
+    assert cache.get("x", "default") == "default"
+    cache.put("x", None)
+    assert cache.get("x", "default") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_put_existing_key_updates_value():
+    cache = LRU(2)
+    cache.put("a", 1)
+    cache.put("a", 2)
+    assert cache.get("a") == 2
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("maxsize, error", [(0, ValueError), (1.5, TypeError)])
+def test_invalid_maxsize(maxsize, error):
+    with pytest.raises(error):
+        LRU(maxsize)
@@ -0,0 +1,40 @@
+from collections import deque
+import random
+
+import pytest
+
+from rolling.structures.mirrored import MirroredBuffer
+
+
+@pytest.mark.parametrize("maxsize", [1, 2, 3, 10])
+def test_mirrored_buffer_matches_deque(maxsize):
+    rng = random.Random(maxsize)
+    buffer = MirroredBuffer("q", maxsize)
+    expected = deque(maxlen=maxsize)
+    for _ in range(500):
+        if expected and rng.random() < 0.3:
+            assert buffer.popleft() == expected.popleft()
+        else:
+            value = rng.randint(-100, 100)
+            buffer.append(value)
+            expected.append(value)
+        assert buffer.view().tolist() == list(expected)
+        assert list(buffer) == list(expected)
+        assert len(buffer) == len(expected)
+        if expected:
+            assert buffer[0] == expected[0]
+
+
+def test_mirrored_buffer_view_does_not_copy():
+    buffer = MirroredBuffer("d", 3)
+    for value in [1.0, 2.0, 3.0, 4.0]:
+        buffer.append(value)
+    view = buffer.view()
+    assert view.obj is buffer._array
+    assert view.tolist() == [2.0, 3.0, 4.0]
+
+
+def test_mirrored_buffer_pop_from_empty():
+    buffer = MirroredBuffer("q", 2)
+    with pytest.raises(IndexError):
+        buffer.popleft()
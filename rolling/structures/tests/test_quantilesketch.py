@@ -0,0 +1,61 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from rolling.structures.quantilesketch import SlidingQuantileSketch
+
+
+def _rank_error(window, value, q):
+    "Distance of the exact ranks of value from q * len(window)"
+    window = sorted(window)
+    target = q * len(window)
+    lo, hi = bisect_left(window, value), bisect_right(window, value)
+    if lo <= target <= hi:
+        return 0
+    return min(abs(lo - target), abs(hi - target))
+
+
+@pytest.mark.parametrize("window_size", [1, 10, 1000, 5000])
+@pytest.mark.parametrize("eps", [0.01, 0.05, 0.2])
+def test_quantile_rank_error(window_size, eps):
+    random.seed(window_size)
+    data = [random.gauss(0, 1) for _ in range(3 * window_size + 7)]
+    sketch = SlidingQuantileSketch(window_size, eps)
+    for i, value in enumerate(data, 1):
+        sketch.add(value)
+        if i >= window_size and i % max(1, window_size // 7) == 0:
+            window = data[i - window_size : i]
+            for q in [0, 0.05, 0.5, 0.95, 1]:
+                got = sketch.quantile(q)
+                assert _rank_error(window, got, q) <= eps * window_size
+
+
+def test_quantile_repeated_values():
+    sketch = SlidingQuantileSketch(2000, 0.05)
+    for i in range(10000):
+        sketch.add(i % 3)
+    assert sketch.quantile(0) == 0
+    assert sketch.quantile(0.5) == 1
+    assert sketch.quantile(1) == 2
+
+
+def test_memory_is_sublinear():
+    window_size = 200000
+    sketch = SlidingQuantileSketch(window_size, 0.05)
+    for i in range(2 * window_size):
+        sketch.add(i)
+    stored = len(sketch._samples) + sum(len(level) for level in sketch._levels)
+    assert stored < window_size / 20
+
+
+def test_empty_sketch():
+    sketch = SlidingQuantileSketch(10)
+    assert len(sketch) == 0
+    assert sketch.quantile(0.5) != sketch.quantile(0.5)  # nan
+
+
+@pytest.mark.parametrize("eps", [0, 1, -0.5])
+def test_invalid_eps(eps):
+    with pytest.raises(ValueError):
+        SlidingQuantileSketch(10, eps)
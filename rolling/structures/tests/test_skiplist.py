@@ -0,0 +1,161 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from rolling.structures.skiplist import IndexableSkiplist, SummingSkiplist, NIL
+
+
+def _levels(skiplist):
+    "Return the level of each node in order"
+    levels = []
+    node = skiplist.head.next[0]
+    while node is not NIL:
+        levels.append(len(node.next))
+        node = node.next[0]
+    return levels
+
+
+def _check_widths(skiplist):
+    "Check that the width of every link is the distance it spans"
+    positions = {id(skiplist.head): 0}
+    node = skiplist.head.next[0]
+    position = 1
+    while node is not NIL:
+        positions[id(node)] = position
+        node = node.next[0]
+        position += 1
+    positions[id(NIL)] = position
+
+    node = skiplist.head
+    while node is not NIL:
+        for nextnode, width in zip(node.next, node.width):
+            assert positions[id(nextnode)] - positions[id(node)] == width
+        node = node.next[0]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_updates_match_sorted_list(seed):
+    rng = random.Random(seed)
+    skiplist = IndexableSkiplist(100, seed=seed)
+    values = []
+    for _ in range(2000):
+        if values and rng.random() < 0.5:
+            value = rng.choice(values)
+            values.remove(value)
+            skiplist.remove(value)
+        else:
+            value = rng.randrange(50)
+            values.append(value)
+            skiplist.insert(value)
+        values.sort()
+
+        assert len(skiplist) == len(values)
+        if values:
+            i = rng.randrange(len(values))
+            assert skiplist[i] == values[i]
+        value = rng.randrange(-1, 52)
+        assert skiplist.bisect_left(value) == bisect_left(values, value)
+        assert skiplist.bisect_right(value) == bisect_right(values, value)
+    assert list(skiplist) == values
+    _check_widths(skiplist)
+
+
+@pytest.mark.parametrize(
+    "values", [[], [1], [1, 2], [3, 3, 3], list(range(100)), sorted(range(-50, 50, 3))]
+)
+@pytest.mark.parametrize("expected_size", [None, 1000])
+def test_from_sorted(values, expected_size):
+    skiplist = IndexableSkiplist.from_sorted(values, expected_size, seed=0)
+    assert len(skiplist) == len(values)
+    assert list(skiplist) == values
+    assert [skiplist[i] for i in range(len(values))] == values
+    _check_widths(skiplist)
+
+    # the skiplist can be updated as normal afterwards
+    skiplist.insert(10)
+    skiplist.insert(-10)
+    if values:
+        skiplist.remove(values[0])
+    assert list(skiplist) == sorted(values[1:] + [10, -10])
+    _check_widths(skiplist)
+
+
+def test_same_seed_gives_same_structure():
+    values = [random.random() for _ in range(500)]
+    first = IndexableSkiplist(500, seed=42)
+    second = IndexableSkiplist(500, seed=42)
+    for value in values:
+        first.insert(value)
+        second.insert(value)
+    assert _levels(first) == _levels(second)
+    assert _levels(IndexableSkiplist.from_sorted(sorted(values), seed=7)) == _levels(
+        IndexableSkiplist.from_sorted(sorted(values), seed=7)
+    )
+
+
+def test_levels_are_geometric():
+    skiplist = IndexableSkiplist(2 ** 16, seed=0)
+    levels = [skiplist._random_level() for _ in range(20000)]
+    assert min(levels) == 1
+    assert max(levels) <= skiplist.maxlevels
+    # about half of the levels are 1 and a quarter are 2
+    assert 0.47 < levels.count(1) / len(levels) < 0.53
+    assert 0.22 < levels.count(2) / len(levels) < 0.28
+
+
+def test_removed_nodes_are_reused():
+    skiplist = IndexableSkiplist.from_sorted(range(100), seed=0)
+    node = skiplist.head.next[0]
+    level = len(node.next)
+
+    skiplist.remove(0)
+    assert skiplist._free == [node]
+
+    # the node is reused by the next insert, keeping its level
+    skiplist.insert(1000)
+    assert skiplist._free == []
+    assert node.value == 1000
+    assert len(node.next) == level
+    assert skiplist[99] == 1000
+    _check_widths(skiplist)
+
+
+def test_remove_missing_value_raises():
+    skiplist = IndexableSkiplist.from_sorted([1, 3, 5])
+    with pytest.raises(KeyError):
+        skiplist.remove(4)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_summing_skiplist_range_sums(seed):
+    rng = random.Random(seed)
+    skiplist = SummingSkiplist(100, seed=seed)
+    values = []
+    for _ in range(2000):
+        if values and rng.random() < 0.5:
+            value = rng.choice(values)
+            values.remove(value)
+            skiplist.remove(value)
+        else:
+            value = rng.randrange(50)
+            values.append(value)
+            skiplist.insert(value)
+        values.sort()
+
+        i = rng.randrange(len(values) + 1)
+        j = rng.randrange(i, len(values) + 1)
+        assert skiplist.range_sum(i, j) == sum(values[i:j])
+        assert skiplist.prefix_sum(len(values)) == sum(values)
+    assert list(skiplist) == values
+    _check_widths(skiplist)
+
+
+@pytest.mark.parametrize("values", [[], [4], list(range(100)), [2, 2, 2, 5, 5, 9]])
+def test_summing_skiplist_from_sorted(values):
+    skiplist = SummingSkiplist.from_sorted(values, seed=0)
+    for i in range(len(values) + 1):
+        assert skiplist.prefix_sum(i) == sum(values[:i])
+    skiplist.insert(3)
+    values = sorted(values + [3])
+    assert skiplist.prefix_sum(len(values)) == sum(values)
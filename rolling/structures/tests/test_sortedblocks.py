@@ -0,0 +1,52 @@
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from rolling.structures.sortedblocks import SortedBlocks
+
+
+@pytest.mark.parametrize("expected_size", [1, 100, 10000])
+@pytest.mark.parametrize("insert_probability", [0.2, 0.5, 0.8])
+def test_random_updates_match_sorted_list(expected_size, insert_probability):
+    rng = random.Random(expected_size)
+    blocks = SortedBlocks(expected_size)
+    values = []
+    for _ in range(3000):
+        if values and rng.random() > insert_probability:
+            value = rng.choice(values)
+            values.remove(value)
+            blocks.remove(value)
+        else:
+            value = rng.randrange(300)
+            values.append(value)
+            blocks.insert(value)
+        values.sort()
+
+        assert len(blocks) == len(values)
+        if values:
+            i = rng.randrange(len(values))
+            assert blocks[i] == values[i]
+            assert blocks[i - len(values)] == values[i]
+        value = rng.randrange(-1, 302)
+        assert blocks.bisect_left(value) == bisect_left(values, value)
+        assert blocks.bisect_right(value) == bisect_right(values, value)
+    assert list(blocks) == values
+
+
+@pytest.mark.parametrize("value", [0, 4, 10])
+def test_remove_missing_value_raises(value):
+    blocks = SortedBlocks()
+    for x in [1, 3, 5, 7]:
+        blocks.insert(x)
+    with pytest.raises(KeyError):
+        blocks.remove(value)
+
+
+@pytest.mark.parametrize("index", [4, -5])
+def test_index_out_of_range_raises(index):
+    blocks = SortedBlocks()
+    for x in [1, 3, 5, 7]:
+        blocks.insert(x)
+    with pytest.raises(IndexError):
+        blocks[index]
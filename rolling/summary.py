@@ -0,0 +1,290 @@
+"""
+Mergeable summaries of windows.
+
+A summary holds just enough information about a group of values
+to compute some aggregate of those values (e.g. the sum or the
+variance). Two summaries of disjoint groups of values can be
+combined using merge() to give the summary of the union of the
+groups. Merging is associative, so summaries of blocks, shards or
+partial windows can be combined in any grouping.
+
+Summaries are immutable (they are namedtuples) and so can be
+pickled and sent between processes cheaply.
+
+Examples
+--------
+
+>>> from functools import reduce
+>>> from rolling.summary import VarSummary
+>>> blocks = [[2, 4], [4, 4, 5], [5, 7, 9]]
+>>> parts = [VarSummary.from_iterable(block, ddof=0) for block in blocks]
+>>> reduce(VarSummary.merge, parts).value
+4.0
+
+"""
+from collections import namedtuple
+from math import sqrt
+
+
+class SumSummary(namedtuple("SumSummary", ["obs", "total"])):
+    """
+    Summary of a group of values for computing their sum.
+
+    Parameters
+    ----------
+
+    obs : int, the number of values in the group
+    total : the sum of the values in the group
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        obs = 0
+        total = 0
+        for value in iterable:
+            obs += 1
+            total += value
+        return cls(obs, total)
+
+    def merge(self, other):
+        return self.__class__(self.obs + other.obs, self.total + other.total)
+
+    @property
+    def value(self):
+        return self.total
+
+
+class MeanSummary(SumSummary):
+    """
+    Summary of a group of values for computing their mean.
+
+    Parameters
+    ----------
+
+    obs : int, the number of values in the group
+    total : the sum of the values in the group
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        if self.obs == 0:
+            return float("nan")
+        return self.total / self.obs
+
+
+class VarSummary(namedtuple("VarSummary", ["obs", "mean", "sslm", "ddof"])):
+    """
+    Summary of a group of values for computing their variance.
+
+    Parameters
+    ----------
+
+    obs : int, the number of values in the group
+    mean : float, the mean of the values in the group
+    sslm : float, the sum of squared values less the mean
+    ddof : int, the divisor used in calculation is (N - ddof)
+        where N is the number of observations
+
+    Notes
+    -----
+
+    Summaries are merged using the parallel algorithm of
+    Chan et al. [1]. The ddof of the left-hand summary is
+    kept when merging.
+
+    [1] https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable, ddof=1):
+        obs = 0
+        mean = 0.0
+        sslm = 0.0
+        for value in iterable:
+            obs += 1
+            delta = value - mean
+            mean += delta / obs
+            sslm += delta * (value - mean)
+        return cls(obs, mean, sslm, ddof)
+
+    def merge(self, other):
+        if other.obs == 0:
+            return self
+        if self.obs == 0:
+            return self.__class__(other.obs, other.mean, other.sslm, self.ddof)
+
+        obs = self.obs + other.obs
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.obs / obs
+        sslm = self.sslm + other.sslm + delta * delta * self.obs * other.obs / obs
+        return self.__class__(obs, mean, sslm, self.ddof)
+
+    @property
+    def value(self):
+        if self.obs <= self.ddof:
+            return float("nan")
+        return self.sslm / (self.obs - self.ddof)
+
+
+class StdSummary(VarSummary):
+    """
+    Summary of a group of values for computing their
+    standard deviation.
+
+    Parameters
+    ----------
+
+    obs : int, the number of values in the group
+    mean : float, the mean of the values in the group
+    sslm : float, the sum of squared values less the mean
+    ddof : int, the divisor used in calculation is (N - ddof)
+        where N is the number of observations
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        if self.obs <= self.ddof:
+            return float("nan")
+        return sqrt(self.sslm / (self.obs - self.ddof))
+
+
+class MinSummary(namedtuple("MinSummary", ["value"])):
+    """
+    Summary of a group of values for computing their minimum.
+
+    Parameters
+    ----------
+
+    value : the minimum value of the group, or None
+        if the group is empty
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(min(iterable, default=None))
+
+    def merge(self, other):
+        if other.value is None:
+            return self
+        if self.value is None or other.value < self.value:
+            return other
+        return self
+
+
+class MaxSummary(namedtuple("MaxSummary", ["value"])):
+    """
+    Summary of a group of values for computing their maximum.
+
+    Parameters
+    ----------
+
+    value : the maximum value of the group, or None
+        if the group is empty
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(max(iterable, default=None))
+
+    def merge(self, other):
+        if other.value is None:
+            return self
+        if self.value is None or other.value > self.value:
+            return other
+        return self
+
+
+class AnySummary(namedtuple("AnySummary", ["value"])):
+    """
+    Summary of a group of values for computing whether
+    any value evaluates to True.
+
+    Parameters
+    ----------
+
+    value : bool, True if any value in the group is True
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(any(iterable))
+
+    def merge(self, other):
+        return self.__class__(self.value or other.value)
+
+
+class AllSummary(namedtuple("AllSummary", ["value"])):
+    """
+    Summary of a group of values for computing whether
+    all values evaluate to True.
+
+    Parameters
+    ----------
+
+    value : bool, True if all values in the group are True
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(all(iterable))
+
+    def merge(self, other):
+        return self.__class__(self.value and other.value)
+
+
+class NuniqueSummary(namedtuple("NuniqueSummary", ["items"])):
+    """
+    Summary of a group of values for counting the
+    number of unique values.
+
+    Parameters
+    ----------
+
+    items : frozenset, the distinct values in the group
+
+    Notes
+    -----
+
+    The number of unique values in a union of groups
+    cannot be known without the distinct values of each
+    group, so the size of this summary is O(d) where d
+    is the number of distinct values.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(frozenset(iterable))
+
+    def merge(self, other):
+        return self.__class__(self.items | other.items)
+
+    @property
+    def value(self):
+        return len(self.items)
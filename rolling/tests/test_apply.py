@@ -1,6 +1,13 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+from math import gcd
+from operator import add, or_
+
 import pytest
 
-from rolling.apply import Apply
+from rolling.apply import Apply, ParallelApply, Reduce, Incremental
+from rolling.structures.lru import LRU
 
 
 @pytest.mark.parametrize("array", [[3, 6, 5, 8, 1]])
@@ -74,3 +81,270 @@ def test_rolling_apply_variable(array, window_size, expected):
 def test_rolling_apply_over_short_iterable(array, window_type, expected):
     r = Apply(array, 5, operation=list, window_type=window_type)
     assert list(r) == expected
+
+
+def _matmul(a, b):
+    "Multiply two 2x2 matrices given as tuples"
+    return (
+        a[0] * b[0] + a[1] * b[2],
+        a[0] * b[1] + a[1] * b[3],
+        a[2] * b[0] + a[3] * b[2],
+        a[2] * b[1] + a[3] * b[3],
+    )
+
+
+@pytest.mark.parametrize(
+    "array,operation,identity",
+    [
+        ([12, 18, 8, 20, 30, 45, 7, 14, 0, 21], gcd, 0),
+        ([1, 2, 4, 8, 16, 1, 3, 64], or_, 0),
+        ("rolling windows", add, ""),
+        ([(i % 3, 1, 1, i % 2) for i in range(12)], _matmul, (1, 0, 0, 1)),
+        ([5], add, 0),
+        ([], add, 0),
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 4, 7])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_reduce(array, operation, identity, window_size, window_type):
+    got = Reduce(
+        array,
+        window_size,
+        window_type=window_type,
+        operation=operation,
+        identity=identity,
+    )
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda window: reduce(operation, window, identity),
+        window_type=window_type,
+    )
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize("array", [[3, 6, 5, 8, 1, -2, 4, 4], [7], []])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 6, 10])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_incremental_sum_of_squares(array, window_size, window_type):
+    got = Incremental(
+        array,
+        window_size,
+        window_type=window_type,
+        add=lambda total, new: total + new * new,
+        remove=lambda total, old: total - old * old,
+    )
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda window: sum(x * x for x in window),
+        window_type=window_type,
+    )
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_incremental_mutable_state_and_value(window_type):
+    def add(counts, new):
+        counts[new] = counts.get(new, 0) + 1
+        return counts
+
+    def remove(counts, old):
+        counts[old] -= 1
+        if not counts[old]:
+            del counts[old]
+        return counts
+
+    word = "mississippi"
+    got = Incremental(
+        word,
+        4,
+        window_type=window_type,
+        add=add,
+        remove=remove,
+        value=lambda counts: max(counts.values()),
+        init={},
+    )
+    expected = Apply(
+        word,
+        4,
+        operation=lambda window: max(window.count(c) for c in window),
+        window_type=window_type,
+    )
+    assert list(got) == list(expected)
+
+
+def test_rolling_incremental_requires_functions():
+    with pytest.raises(TypeError):
+        Incremental([1, 2, 3], 2, add=lambda state, new: state)
+
+
+@pytest.mark.parametrize(
+    "array",
+    ["abaabaabbbabaab", [1, 2, 1, 2, 1, 2, 3, 1, 2], [None, 0, None], [], [5]],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 5])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("maxsize", [1, 2, 100])
+def test_rolling_apply_cache(array, window_size, window_type, maxsize):
+    cache = LRU(maxsize)
+    got = Apply(
+        array, window_size, operation=tuple, window_type=window_type, cache=cache
+    )
+    expected = list(
+        Apply(array, window_size, operation=tuple, window_type=window_type)
+    )
+    assert list(got) == expected
+    assert cache.hits + cache.misses == len(expected)
+    assert len(cache) <= maxsize
+
+
+def test_rolling_apply_cache_counts_hits():
+    cache = LRU(100)
+    calls = []
+
+    def operation(window):
+        calls.append(tuple(window))
+        return "".join(sorted(window))
+
+    got = list(Apply("abcabcabcabc", 3, operation=operation, cache=cache))
+    assert got == ["abc"] * 10
+    assert calls == [("a", "b", "c"), ("b", "c", "a"), ("c", "a", "b")]
+    assert (cache.hits, cache.misses) == (7, 3)
+
+
+class _Collide(object):
+    "Distinct values with the same hash"
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 1
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def test_rolling_apply_cache_hash_collision():
+    array = [_Collide(i % 4) for i in range(20)]
+    cache = LRU(100)
+    got = Apply(
+        array,
+        2,
+        operation=lambda window: [x.value for x in window],
+        cache=cache,
+    )
+    expected = [[i % 4, (i + 1) % 4] for i in range(19)]
+    assert list(got) == expected
+    assert cache.misses == 4
+
+
+@pytest.mark.parametrize("array", [[3, 6, 5, 8, 1, -2, 4, 4], [7], []])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 6, 10])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_apply_view(array, window_size, window_type):
+    got = Apply(
+        array, window_size, operation=list, window_type=window_type, view="q"
+    )
+    expected = Apply(array, window_size, operation=list, window_type=window_type)
+    assert list(got) == list(expected)
+
+
+def test_rolling_apply_view_is_contiguous_memoryview():
+    def operation(window):
+        assert isinstance(window, memoryview)
+        assert window.contiguous
+        return window.tobytes()
+
+    got = list(Apply([1.0, 2.0, 3.0, 4.0], 3, operation=operation, view="d"))
+    assert got == [
+        array("d", [1.0, 2.0, 3.0]).tobytes(),
+        array("d", [2.0, 3.0, 4.0]).tobytes(),
+    ]
+
+
+@pytest.mark.skipif(not hasattr(memoryview, "toreadonly"), reason="Python 3.8+")
+def test_rolling_apply_view_is_read_only():
+    def operation(window):
+        window[0] = 0
+
+    with pytest.raises(TypeError):
+        list(Apply([1, 2, 3], 2, operation=operation, view="q"))
+
+
+@pytest.mark.parametrize("array", [[3, 6, 5, 8, 1, -2, 4, 4], [7], []])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 10])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("batch,prefetch", [(1, 1), (3, 2), (2, 8)])
+def test_rolling_apply_executor(array, window_size, window_type, batch, prefetch):
+    with ThreadPoolExecutor(2) as executor:
+        got = Apply(
+            array,
+            window_size,
+            operation=list,
+            window_type=window_type,
+            executor=executor,
+            batch=batch,
+            prefetch=prefetch,
+        )
+        assert isinstance(got, ParallelApply)
+        expected = Apply(array, window_size, operation=list, window_type=window_type)
+        assert list(got) == list(expected)
+
+
+def test_rolling_apply_process_pool_executor():
+    array = list(range(-50, 50))
+    with ProcessPoolExecutor(2) as executor:
+        got = Apply(array, 7, operation=max, executor=executor, batch=5)
+        assert list(got) == list(Apply(array, 7, operation=max))
+
+
+class _RecordingExecutor(object):
+    "Executor running tasks immediately, recording the windows in flight"
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batch_sizes = []
+
+    def submit(self, function, operation, windows):
+        executor = self
+
+        class Future(object):
+            def result(self):
+                executor.in_flight -= len(windows)
+                return function(operation, windows)
+
+        self.in_flight += len(windows)
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.batch_sizes.append(len(windows))
+        return Future()
+
+
+def test_rolling_apply_executor_bounds_windows_in_flight():
+    executor = _RecordingExecutor()
+    got = Apply(range(100), 3, executor=executor, batch=4, prefetch=12)
+    assert list(got) == [3 * i + 3 for i in range(98)]
+    assert executor.max_in_flight == 12
+    assert executor.batch_sizes == [4] * 24 + [2]
+
+
+@pytest.mark.parametrize(
+    "kwargs,error",
+    [
+        ({"batch": 0}, ValueError),
+        ({"prefetch": -1}, ValueError),
+        ({"batch": 2.0}, TypeError),
+    ],
+)
+def test_rolling_apply_executor_invalid_arguments(kwargs, error):
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(error):
+            Apply([1, 2, 3], 2, executor=executor, **kwargs)
+
+
+def test_rolling_apply_executor_with_cache_raises():
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            Apply([1, 2, 3], 2, executor=executor, cache=LRU(4))
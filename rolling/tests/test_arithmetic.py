@@ -1,7 +1,11 @@
+import random
+from fractions import Fraction
+from math import fsum, sqrt
+
 import pytest
 
 from rolling.apply import Apply
-from rolling.arithmetic import Sum, Product, Nunique
+from rolling.arithmetic import Sum, Product, Nunique, ApproximateNunique, WMA
 
 
 def _product(it):
@@ -47,6 +51,15 @@ def test_rolling_product(array, window_size, window_type):
     assert list(got) == list(expected)
 
 
+@pytest.mark.parametrize("window_size", [1, 2, 3, 5])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_product_exact(window_size, window_type):
+    array = [3, 10 ** 20 + 1, 0, 7, 2.5, 10 ** 30 + 7, 1, 0, 0, 11]
+    got = Product(array, window_size, window_type=window_type, exact=True)
+    expected = Apply(array, window_size, operation=_product, window_type=window_type)
+    assert list(got) == list(expected)
+
+
 @pytest.mark.parametrize("word", ["aabbc", "xooxyzzziiismsdd", "jjjjjj", ""])
 @pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5])
 @pytest.mark.parametrize("window_type", ["fixed", "variable"])
@@ -56,3 +69,106 @@ def test_rolling_nunique(word, window_size, window_type):
         word, window_size, operation=lambda x: len(set(x)), window_type=window_type
     )
     assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize("window_size", [10, 100, 500])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_nunique_high_cardinality(window_size, window_type):
+    ids = [(i * 7919) % 1009 for i in range(2000)]
+    got = Nunique(ids, window_size, window_type=window_type)
+    expected = Apply(
+        ids, window_size, operation=lambda x: len(set(x)), window_type=window_type
+    )
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize("word", ["aabbc", "xooxyzzziiismsdd", "jjjjjj", ""])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_nunique_approximate_small_windows(word, window_size, window_type):
+    # linear counting is exact (after rounding) for a handful of values
+    # unless two of them share a register, so use the character codes,
+    # whose hashes (unlike those of strings) do not depend on PYTHONHASHSEED
+    codes = [ord(char) for char in word]
+    got = Nunique(codes, window_size, window_type=window_type, approximate=True)
+    expected = Nunique(codes, window_size, window_type=window_type)
+    assert isinstance(got, ApproximateNunique)
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize("precision", [8, 12])
+@pytest.mark.parametrize("window_size", [1000, 20000])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_nunique_approximate(precision, window_size, window_type):
+    rng = random.Random(precision + window_size)
+    ids = [rng.randrange(window_size) for _ in range(3 * window_size)]
+    got = Nunique(
+        ids, window_size, window_type=window_type, approximate=True, precision=precision
+    )
+    expected = Nunique(ids, window_size, window_type=window_type)
+
+    # allow four standard errors
+    tolerance = 4 * 1.04 / sqrt(2 ** precision)
+    for estimate, exact in zip(got, expected):
+        assert abs(estimate - exact) <= tolerance * exact + 1
+
+
+def test_rolling_nunique_approximate_memory_independent_of_window():
+    ids = range(2 * 10 ** 5)
+    r = Nunique(ids, 10 ** 5, approximate=True, precision=6)
+    for _ in r:
+        pass
+    # 64 registers, each holding O(log k) possible future maxima
+    entries = sum(len(reg) for reg in r._sketch._registers if reg is not None)
+    assert entries < 1000
+
+
+@pytest.mark.parametrize("precision", [3, 17])
+def test_rolling_nunique_approximate_bad_precision(precision):
+    with pytest.raises(ValueError):
+        Nunique([], 5, approximate=True, precision=precision)
+
+
+def _wma(window):
+    n = len(window)
+    return Fraction(sum(i * x for i, x in enumerate(window, 1)), n * (n + 1) // 2)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        [3, -8, 1, 7, -2, 4, 7, 2, 1],
+        [10 ** 20, 1, -(10 ** 20), 3, 5],
+        [1],
+        [],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_wma(array, window_size, window_type):
+    got = WMA(array, window_size, window_type=window_type)
+    expected = Apply(array, window_size, operation=_wma, window_type=window_type)
+    assert list(got) == [float(x) for x in expected]
+
+
+def test_rolling_wma_expanding():
+    array = [3, -8, 1, 7, -2, 4, 7, 2, 1]
+    got = WMA(array, window_type="expanding")
+    expected = [float(_wma(array[:n])) for n in range(1, len(array) + 1)]
+    assert list(got) == expected
+
+
+def test_rolling_wma_compensated():
+    rng = random.Random(1)
+    array = [rng.choice([1e16, 1.0, -1e16, 0.1]) for _ in range(2000)]
+    window_size = 50
+    got = list(WMA(array, window_size))
+    for i in range(0, len(got), 37):
+        window = array[i : i + window_size]
+        weighted = fsum(j * x for j, x in enumerate(window, 1))
+        expected = weighted / (window_size * (window_size + 1) // 2)
+        assert got[i] == pytest.approx(expected, rel=1e-12, abs=1e-2)
+
+
+def test_rolling_wma_has_no_summary():
+    assert not hasattr(WMA([1, 2, 3], 2), "summary")
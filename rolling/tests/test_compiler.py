@@ -0,0 +1,93 @@
+from math import exp, sqrt
+
+import pytest
+
+import rolling
+from rolling.arithmetic import Sum
+from rolling.compiler import compile
+from rolling.minmax import Max, Min
+from rolling.stats import Mean, Std, Var
+
+ARRAYS = [
+    [3, -8, 1, 7, -2, 8, 1, -7, -2, 9, 3, 100, -50, 4, 4, 4],
+    [0.5, -1.25, 0.5, 3.0, 2.75, -1.25, 0.0, 9.5, 1.5, 2.0],
+    [5],
+    [],
+]
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+@pytest.mark.parametrize(
+    "expression, cls",
+    [
+        ("sum(x, 3)", Sum),
+        ("mean(x, 4)", Mean),
+        ("var(x, 5)", Var),
+        ("std(x, 2)", Std),
+        ("min(x, 3)", Min),
+        ("max(x, 6)", Max),
+    ],
+)
+def test_compiled_operation_matches_rolling_object(array, expression, cls):
+    window_size = int(expression.split(", ")[1][:-1])
+    got = list(compile(expression)(array))
+    expected = list(cls(array, window_size))
+    assert got == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+def test_compiled_zscore_matches_zipped_iterators(array):
+    got = list(compile("(x - mean(x, 5)) / std(x, 5)")(array))
+    expected = [
+        (x - mean) / std
+        for x, mean, std in zip(array[4:], Mean(array, 5), Std(array, 5))
+    ]
+    assert got == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+def test_compiled_mixed_window_sizes(array):
+    f = compile("max(x, 4) - min(x, 2) + sum(x, 3) / var(x, 4, ddof=0) - -x ** 2")
+    got = list(f(array))
+    n = len(array)
+    expected = [
+        max(array[i - 3 : i + 1])
+        - min(array[i - 1 : i + 1])
+        + sum(array[i - 2 : i + 1]) / list(Var(array[i - 3 : i + 1], 4, ddof=0))[0]
+        + array[i] ** 2
+        for i in range(3, n)
+    ]
+    assert got == pytest.approx(expected)
+
+
+def test_compiled_functions():
+    f = compile("abs(x - sqrt(max(x, 2))) + exp(0)")
+    array = [4, 9, 1, 16]
+    expected = [abs(b - sqrt(max(a, b))) + exp(0) for a, b in zip(array, array[1:])]
+    assert list(f(array)) == pytest.approx(expected)
+
+
+def test_compile_is_cached():
+    assert compile("sum(x, 3) * 2") is compile("sum(x, 3) * 2")
+    assert rolling.compile is compile
+
+
+@pytest.mark.parametrize(
+    "expression, error",
+    [
+        ("1 + 2", ValueError),
+        ("x + y", ValueError),
+        ("median(x, 3)", ValueError),
+        ("sum(x + 1, 3)", ValueError),
+        ("sum(x, 0)", ValueError),
+        ("sum(x, 2.5)", TypeError),
+        ("var(x, 1)", ValueError),
+        ("sum(x, 3, ddof=1)", ValueError),
+        ("x if x else 0", ValueError),
+        ("_i + mean(_i, 3)", ValueError),
+        ("x +", SyntaxError),
+    ],
+)
+def test_invalid_expressions(expression, error):
+    with pytest.raises(error):
+        compile(expression)
@@ -0,0 +1,92 @@
+from math import exp, isnan, log, sqrt
+import random
+
+import pytest
+
+from rolling.ewm import EWMean, EWVar, EWStd
+
+
+def _weights(n, alpha, adjust):
+    "Weights of values x[0], ..., x[n-1] in the last window"
+    if adjust:
+        return [(1 - alpha) ** (n - 1 - i) for i in range(n)]
+    return [(1 - alpha) ** (n - 1)] + [
+        alpha * (1 - alpha) ** (n - 1 - i) for i in range(1, n)
+    ]
+
+
+def _ewm(array, alpha, adjust, bias):
+    "Exponentially weighted means and variances, computed directly"
+    means, variances = [], []
+    for n in range(1, len(array) + 1):
+        weights = _weights(n, alpha, adjust)
+        total = sum(weights)
+        mean = sum(w * x for w, x in zip(weights, array)) / total
+        var = sum(w * (x - mean) ** 2 for w, x in zip(weights, array)) / total
+        if not bias:
+            denominator = total * total - sum(w * w for w in weights)
+            var = var * total * total / denominator if denominator > 0 else float("nan")
+        means.append(mean)
+        variances.append(var)
+    return means, variances
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 30])
+@pytest.mark.parametrize("alpha", [0.05, 0.5, 1.0])
+@pytest.mark.parametrize("adjust", [True, False])
+@pytest.mark.parametrize("bias", [True, False])
+def test_ewm_matches_weighted_definitions(size, alpha, adjust, bias):
+    rng = random.Random(size)
+    array = [rng.uniform(-10, 10) for _ in range(size)]
+    means, variances = _ewm(array, alpha, adjust, bias)
+
+    got_mean = EWMean(array, alpha=alpha, adjust=adjust)
+    got_var = EWVar(array, alpha=alpha, adjust=adjust, bias=bias)
+    got_std = EWStd(array, alpha=alpha, adjust=adjust, bias=bias)
+
+    assert list(got_mean) == pytest.approx(means)
+    assert list(got_var) == pytest.approx(variances, nan_ok=True, abs=1e-9)
+    stds = [sqrt(v) if not isnan(v) else v for v in variances]
+    assert list(got_std) == pytest.approx(stds, nan_ok=True, abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "kwargs,alpha",
+    [
+        ({"span": 9}, 0.2),
+        ({"window_size": 9}, 0.2),
+        ({"halflife": 3}, 1 - exp(-log(2) / 3)),
+        ({"alpha": 0.3}, 0.3),
+    ],
+)
+def test_ewm_parameters(kwargs, alpha):
+    assert EWMean([], **kwargs).alpha == pytest.approx(alpha)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"span": 3, "alpha": 0.5},
+        {"span": 0.5},
+        {"halflife": 0},
+        {"alpha": 0},
+        {"alpha": 1.5},
+    ],
+)
+def test_ewm_bad_parameters_raise(kwargs):
+    with pytest.raises(ValueError):
+        EWMean([1, 2, 3], **kwargs)
+
+
+def test_ewm_only_expanding():
+    with pytest.raises(ValueError):
+        EWMean([1, 2, 3], 3, window_type="fixed")
+
+
+def test_ewm_min_periods_and_step():
+    array = list(range(10))
+    expected = list(EWVar(array, span=4))
+    assert list(EWVar(array, span=4, min_periods=3)) == expected[2:]
+    got = list(EWVar(array, 4, step=3))
+    assert got == pytest.approx(expected[::3], nan_ok=True)
@@ -0,0 +1,84 @@
+from itertools import islice
+import random
+
+import pytest
+
+from rolling.apply import Apply
+from rolling.arithmetic import Sum, Product, Nunique
+from rolling.logical import All, Any
+from rolling.minmax import Min, Max, MinHeap
+from rolling.stats import Mean, Var, Std, Skew, Kurtosis, Median, Quantile
+from rolling.structures.nullbuffer import NullBuffer
+
+
+def _prefixes(cls, array, **kwargs):
+    "Values of the variable-size windows containing the first 1, 2, ... values"
+    window_size = max(len(array), 4)
+    expected = cls(array, window_size, window_type="variable", **kwargs)
+    return list(islice(expected, len(array)))
+
+
+@pytest.mark.parametrize("size", [0, 1, 5, 40])
+@pytest.mark.parametrize("min_periods", [1, 2, 6])
+@pytest.mark.parametrize(
+    "cls,kwargs",
+    [
+        (Sum, {}),
+        (Mean, {}),
+        (Var, {}),
+        (Std, {"ddof": 0}),
+        (Skew, {}),
+        (Kurtosis, {}),
+        (Min, {}),
+        (Max, {}),
+        (Any, {}),
+        (All, {}),
+        (Product, {}),
+    ],
+)
+def test_expanding_matches_variable_prefixes(size, min_periods, cls, kwargs):
+    rng = random.Random(size)
+    array = [rng.randint(-3, 3) for _ in range(size)]
+    # compute the expected values first, as __next__ is set on the
+    # class when an instance is created
+    expected = _prefixes(cls, array, **kwargs)[min_periods - 1 :]
+    got = cls(array, window_type="expanding", min_periods=min_periods, **kwargs)
+    assert list(got) == pytest.approx(expected, nan_ok=True)
+
+
+def test_expanding_does_not_store_values():
+    r_mean = Mean(range(10 ** 4), window_type="expanding")
+    assert list(r_mean)[-1] == 4999.5
+    assert isinstance(r_mean._buffer, NullBuffer)
+    assert len(r_mean._buffer) == 10 ** 4
+
+    r_min = Min(range(10 ** 4, 0, -1), window_type="expanding")
+    assert list(r_min)[-1] == 1
+    assert len(r_min._buffer) == 1
+
+
+def test_expanding_product_is_exact():
+    got = Product([10 ** 20, 3, 0, 7], window_type="expanding", exact=True)
+    assert list(got) == [10 ** 20, 3 * 10 ** 20, 0, 0]
+
+
+def test_expanding_with_step():
+    got = Sum(range(10), window_type="expanding", step=4)
+    assert list(got) == [0, 10, 36]
+
+
+@pytest.mark.parametrize("cls", [Median, MinHeap, Nunique, Apply, Quantile])
+def test_expanding_not_implemented(cls):
+    with pytest.raises(NotImplementedError):
+        cls([1, 2, 3], window_type="expanding")
+
+
+def test_expanding_window_size_raises():
+    with pytest.raises(ValueError):
+        Sum([1, 2, 3], 2, window_type="expanding")
+
+
+@pytest.mark.parametrize("min_periods,error", [(0, ValueError), (1.5, TypeError)])
+def test_expanding_bad_min_periods_raises(min_periods, error):
+    with pytest.raises(error):
+        Sum([1, 2, 3], window_type="expanding", min_periods=min_periods)
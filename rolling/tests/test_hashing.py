@@ -0,0 +1,90 @@
+from array import array
+
+import pytest
+
+from rolling.apply import Apply
+from rolling.hashing import Hash
+
+
+def _hash(window, base, mod):
+    h = 0
+    for item in window:
+        h = (h * base + (ord(item) if isinstance(item, str) else item)) % mod
+    return h
+
+
+PARAMETERS = [(257, (1 << 61) - 1), (10, 1000), (31, 101)]
+
+
+@pytest.mark.parametrize(
+    "array", ["abracadabra", "x", "", [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 900]]
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 7])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("base, mod", PARAMETERS)
+def test_rolling_hash(array, window_size, window_type, base, mod):
+    got = Hash(array, window_size, window_type=window_type, base=base, mod=mod)
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda window: _hash(window, base, mod),
+        window_type=window_type,
+    )
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "data", [b"abracadabra", bytearray(b"\x00\xff\x10" * 5), memoryview(b"xyzzy")]
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 20])
+@pytest.mark.parametrize("double", [False, True])
+@pytest.mark.parametrize("base, mod", PARAMETERS)
+def test_rolling_hash_bytes_matches_generic(data, window_size, double, base, mod):
+    got = Hash(data, window_size, base=base, mod=mod, double=double)
+    expected = Hash(list(bytes(data)), window_size, base=base, mod=mod, double=double)
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        memoryview(array("q", [1, 2, 300, 4, 1 << 40])),
+        memoryview(b"abracadabra")[::2],
+        memoryview(b"abracadabra").cast("c"),
+        memoryview(b"abracadabra").cast("c")[::3],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_hash_memoryview_hashes_values(data, window_size, window_type):
+    values = [item[0] if isinstance(item, bytes) else item for item in data]
+    got = Hash(data, window_size, window_type=window_type)
+    expected = Hash(values, window_size, window_type=window_type)
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_hash_double(window_type):
+    text = "mississippi"
+    got = list(Hash(text, 4, window_type=window_type, double=True))
+    first = Hash(text, 4, window_type=window_type)
+    second = Hash(text, 4, window_type=window_type, base=131, mod=10 ** 9 + 7)
+    assert got == list(zip(first, second))
+
+
+def test_equal_windows_have_equal_hashes():
+    text = "the cat sat on the mat"
+    hashes = list(Hash(text, 3))
+    windows = [text[i : i + 3] for i in range(len(text) - 2)]
+    for i in range(len(windows)):
+        for j in range(len(windows)):
+            assert (hashes[i] == hashes[j]) == (windows[i] == windows[j])
+
+
+def test_rolling_hash_invalid_values():
+    with pytest.raises(TypeError):
+        list(Hash([1.5, 2.5], 1))
+    with pytest.raises(ValueError):
+        Hash("abc", 2, base=1)
+    with pytest.raises(TypeError):
+        Hash("abc", 2, mod=2.0 ** 61)
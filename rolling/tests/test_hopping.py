@@ -0,0 +1,113 @@
+from collections import Counter
+from itertools import islice
+import random
+
+import pytest
+
+from rolling.apply import Apply, Incremental
+from rolling.arithmetic import Sum, Product, Nunique
+from rolling.base import Hopping
+from rolling.hashing import Hash
+from rolling.logical import Any
+from rolling.minmax import Max, MinHeap
+from rolling.stats import Median, Quantile, Std, Mode
+
+
+def _every(iterator, step):
+    return list(islice(iterator, 0, None, step))
+
+
+@pytest.mark.parametrize("size", [0, 1, 9, 50])
+@pytest.mark.parametrize("window_size", [1, 3, 5])
+@pytest.mark.parametrize("step", [1, 2, 4, 5, 7])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize(
+    "cls,kwargs",
+    [
+        (Sum, {}),
+        (Product, {"exact": True}),
+        (Nunique, {}),
+        (Any, {}),
+        (Max, {}),
+        (MinHeap, {}),
+        (Median, {}),
+        (Quantile, {"q": [0.25, 0.75]}),
+        (Std, {}),
+        (Apply, {"operation": tuple}),
+    ],
+)
+def test_step_returns_every_step_th_value(
+    size, window_size, step, window_type, cls, kwargs
+):
+    rng = random.Random(size)
+    array = [rng.randint(-5, 5) for _ in range(size)]
+    if cls is Std and window_size == 1:
+        return
+    got = cls(array, window_size, window_type=window_type, step=step, **kwargs)
+    expected = cls(array, window_size, window_type=window_type, **kwargs)
+    if cls is Std:
+        # tumbling windows are reset, so rounding errors can differ
+        assert list(got) == pytest.approx(_every(expected, step), nan_ok=True)
+    else:
+        assert list(got) == _every(expected, step)
+
+
+@pytest.mark.parametrize("step", [3, 4, 10])
+def test_tumbling_window_is_reset(step):
+    array = list(range(30))
+    got = Sum(array, 3, step=step)
+    assert got._next == got._next_tumbling
+    assert list(got) == _every(Sum(array, 3), step)
+
+
+@pytest.mark.parametrize("step", [3, 4])
+def test_tumbling_window_with_state_changed_in_place(step):
+    def add(counts, new):
+        counts[new] += 1
+        return counts
+
+    def remove(counts, old):
+        counts[old] -= 1
+        return counts
+
+    def total(counts):
+        return sum(counts.values())
+
+    array = [1, 1, 2, 3, 3, 3, 4, 4, 5, 5]
+    expected = _every(
+        Incremental(array, 3, add=add, remove=remove, value=total, init=Counter()),
+        step,
+    )
+    got = Incremental(
+        array, 3, add=add, remove=remove, value=total, init=Counter(), step=step
+    )
+    assert list(got) == expected
+
+
+@pytest.mark.parametrize("step", [2, 4, 9])
+@pytest.mark.parametrize("data", [b"abracadabra abracadabra", "abracadabra"])
+def test_step_hash_bytes(step, data):
+    got = Hash(data, 4, double=True, step=step)
+    assert list(got) == _every(Hash(data, 4, double=True), step)
+
+
+def test_step_does_not_compute_skipped_values():
+    calls = []
+
+    def operation(window):
+        calls.append(tuple(window))
+        return sum(window)
+
+    got = list(Apply(range(10), 3, operation=operation, step=3))
+    assert got == [3, 12, 21]
+    assert calls == [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
+
+
+def test_step_attributes_and_repr():
+    r_mode = Mode([1, 2, 2, 3], 2, step=2)
+    assert isinstance(r_mode, Hopping)
+    assert r_mode.step == 2
+    assert r_mode.window_size == 2
+    assert repr(r_mode) == (
+        "Rolling(operation='Mode', window_size=2, window_type='fixed', step=2)"
+    )
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from rolling.apply import Apply
+from rolling.matrix import CorrMatrix
+
+np = pytest.importorskip("numpy")
+
+
+def _corrcoef(window):
+    n = len(window[0])
+    if len(window) < 2:
+        return np.full((n, n), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.corrcoef(np.array(window, dtype=float), rowvar=False).reshape(n, n)
+
+
+def _rows(size, n, seed):
+    rng = random.Random(seed)
+    return [[rng.uniform(-5, 5) for _ in range(n)] for _ in range(size)]
+
+
+@pytest.mark.parametrize("size", [0, 1, 8, 50])
+@pytest.mark.parametrize("n", [1, 2, 5])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 10])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_corr_matrix(size, n, window_size, window_type):
+    rows = _rows(size, n, window_size)
+    got = list(CorrMatrix(rows, window_size, window_type=window_type))
+    expected = list(
+        Apply(rows, window_size, operation=_corrcoef, window_type=window_type)
+    )
+    assert len(got) == len(expected)
+    for matrix, expected_matrix in zip(got, expected):
+        np.testing.assert_allclose(matrix, expected_matrix, atol=1e-9)
+
+
+def test_rolling_corr_matrix_constant_series_is_nan():
+    rows = [(1, 1.0, 5), (2, 1.0, 3), (3, 1.0, 4)]
+    matrix = next(CorrMatrix(rows, 3))
+    assert np.isnan(matrix[1]).all()
+    assert np.isnan(matrix[:, 1]).all()
+    assert matrix[0, 2] == pytest.approx(-0.5)
+
+
+@pytest.mark.parametrize("window_type", ["fixed", "variable", "batch"])
+def test_rolling_corr_matrix_constant_after_sliding(window_type):
+    # values leaving the window must not leave rounding errors behind,
+    # so the last two series are NaN once they are constant
+    rows = _rows(5, 4, 0) + [row + [0.1, 0.0] for row in _rows(5, 2, 1)]
+    if window_type == "batch":
+        got = CorrMatrix.batch(rows, 3)
+        window_type = "fixed"
+    else:
+        got = list(CorrMatrix(rows, 3, window_type=window_type))
+    windows = Apply(rows, 3, operation=list, window_type=window_type)
+    constant = 0
+    for window, matrix in zip(windows, got):
+        if len(window) > 1 and all(row[2:] == [0.1, 0.0] for row in window):
+            constant += 1
+            assert np.isnan(matrix[2:]).all()
+            assert np.isnan(matrix[:, 2:]).all()
+            assert np.isfinite(matrix[:2, :2]).all()
+    assert constant >= 3
+
+
+@pytest.mark.parametrize("size", [0, 3, 50])
+@pytest.mark.parametrize("window_size", [1, 3, 10])
+def test_rolling_corr_matrix_batch(size, window_size):
+    data = np.array(_rows(size, 4, size), dtype=float).reshape(size, 4)
+    got = CorrMatrix.batch(data, window_size)
+    expected = list(CorrMatrix(data, window_size))
+    assert got.shape == (len(expected), 4, 4)
+    for matrix, expected_matrix in zip(got, expected):
+        np.testing.assert_allclose(matrix, expected_matrix, atol=1e-9)
+
+
+def test_rolling_corr_matrix_batch_requires_2d():
+    with pytest.raises(ValueError):
+        CorrMatrix.batch(np.zeros(5), 2)
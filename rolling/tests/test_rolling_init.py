@@ -19,3 +19,15 @@ def test_bad_window_size_value_raises(window_size):
 def test_bad_window_size_type_raises(window_size):
     with pytest.raises(TypeError):
         Apply([], window_size)
+
+
+@pytest.mark.parametrize("step", [0, -3])
+def test_bad_step_value_raises(step):
+    with pytest.raises(ValueError):
+        Apply([], 5, step=step)
+
+
+@pytest.mark.parametrize("step", [2.0, "2"])
+def test_bad_step_type_raises(step):
+    with pytest.raises(TypeError):
+        Apply([], 5, step=step)
@@ -1,11 +1,30 @@
 from collections import Counter
-from math import sqrt
+from math import ceil, floor, isnan, sqrt
+import random
 from statistics import variance, stdev, mean as _mean, median as _median
 
 import pytest
 
 from rolling.apply import Apply
-from rolling.stats import Mean, Var, Std, Median, Mode, Skew, Kurtosis
+from rolling.stats import (
+    Mean,
+    WeightedMean,
+    VWAP,
+    Var,
+    Std,
+    Median,
+    Quantile,
+    Rank,
+    TrimmedMean,
+    WinsorizedMean,
+    MAD,
+    Mode,
+    Skew,
+    Kurtosis,
+    Cov,
+    Corr,
+    LinReg,
+)
 
 
 def _var(seq):
@@ -285,6 +304,346 @@ def test_rolling_median(array, window_size, window_type):
     assert pytest.approx(list(got)) == list(expected)
 
 
+@pytest.mark.parametrize(
+    "array",
+    [
+        [3, 0, 1, 7, 2],
+        [3, -8, 1, 7, -2, 8, 1, -7, -2, 9, 3],
+        [5, 5, 1, 5, 1, 1, 5, 5, 5, 1, 1, 1, 5],
+        [0.5, -1.25, 0.5, 3.0, 2.75, -1.25, 0.0, 9.5],
+        [1],
+        [],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5, 6])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("algorithm", ["skiplist", "heaps", "sortedblocks"])
+def test_rolling_median_algorithm(array, window_size, window_type, algorithm):
+    got = Median(array, window_size, window_type=window_type, algorithm=algorithm)
+    expected = Apply(array, window_size, operation=_median, window_type=window_type)
+    assert pytest.approx(list(got)) == list(expected)
+
+
+@pytest.mark.parametrize("algorithm", ["heaps", "sortedblocks"])
+@pytest.mark.parametrize("window_size", [10, 200])
+def test_rolling_median_algorithm_long_array(algorithm, window_size):
+    array = [(i * 7919) % 1013 - 500 for i in range(3000)]
+    got = Median(array, window_size, algorithm=algorithm)
+    expected = Median(array, window_size, algorithm="skiplist")
+    assert list(got) == list(expected)
+
+
+def test_rolling_median_unknown_algorithm():
+    with pytest.raises(ValueError):
+        Median([1, 2, 3], 2, algorithm="bubblesort")
+
+
+def _quantile(seq, q, interpolation):
+    values = sorted(seq)
+    h = (len(values) - 1) * q
+    lower, higher = values[floor(h)], values[ceil(h)]
+    if interpolation == "lower":
+        return lower
+    if interpolation == "higher":
+        return higher
+    if interpolation == "nearest":
+        return values[round(h)]
+    if interpolation == "midpoint":
+        return (lower + higher) / 2
+    return lower + (higher - lower) * (h - floor(h))
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        [3, 0, 1, 7, 2],
+        [3, -8, 1, 7, -2, 8, 1, -7, -2, 9, 3],
+        [0.5, -1.25, 0.5, 3.0, 2.75, -1.25, 0.0, 9.5],
+        [1],
+        [],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 4, 6])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "nearest", "midpoint"]
+)
+@pytest.mark.parametrize("algorithm", ["skiplist", "sortedblocks"])
+def test_rolling_quantile(array, window_size, window_type, interpolation, algorithm):
+    q = [0, 0.05, 0.25, 0.5, 0.95, 1]
+    got = Quantile(
+        array,
+        window_size,
+        window_type=window_type,
+        q=q,
+        interpolation=interpolation,
+        algorithm=algorithm,
+    )
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda seq: [_quantile(seq, p, interpolation) for p in q],
+        window_type=window_type,
+    )
+    assert [pytest.approx(x) for x in got] == list(expected)
+
+
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_quantile_scalar_q_is_median(window_type):
+    array = [3, -8, 1, 7, -2, 8, 1, -7, -2, 9, 3]
+    got = Quantile(array, 4, window_type=window_type, q=0.5)
+    expected = Median(array, 4, window_type=window_type)
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"q": 1.5},
+        {"q": [0.5, -0.1]},
+        {"interpolation": "cubic"},
+        {"algorithm": "heaps"},
+    ],
+)
+def test_rolling_quantile_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        Quantile([1, 2, 3], 2, **kwargs)
+
+
+@pytest.mark.parametrize("window_size", [5, 300, 2000])
+@pytest.mark.parametrize("eps", [0.01, 0.1])
+def test_rolling_quantile_approximate(window_size, eps):
+    array = [(i * 7919) % 1013 for i in range(3 * window_size)]
+    q = [0.05, 0.5, 0.95]
+    got = Quantile(array, window_size, q=q, approximate=True, eps=eps)
+    for i, values in enumerate(got):
+        if i % 97:
+            continue
+        window = array[i : i + window_size]
+        for p, value in zip(q, values):
+            below = sum(x < value for x in window)
+            at_or_below = sum(x <= value for x in window)
+            target = p * window_size
+            error = max(0, below - target, target - at_or_below)
+            assert error <= eps * window_size
+
+
+def test_rolling_quantile_approximate_scalar_q():
+    got = list(Quantile(range(100), 10, approximate=True, eps=0.1))
+    assert got == list(Quantile(range(100), 10, interpolation="nearest"))
+
+
+def test_rolling_quantile_approximate_variable_not_implemented():
+    with pytest.raises(NotImplementedError):
+        Quantile([1, 2, 3], 2, window_type="variable", approximate=True)
+
+
+@pytest.mark.parametrize(
+    "option",
+    [{"interpolation": "lower"}, {"algorithm": "sortedblocks"}, {"domain": (0, 9)}],
+)
+def test_rolling_quantile_approximate_unsupported_option_raises(option):
+    with pytest.raises(ValueError):
+        Quantile([1, 2, 3], 2, approximate=True, **option)
+
+
+def _rank(seq, pct, method, ascending):
+    newest = seq[-1]
+    if ascending:
+        lowest = sum(x < newest for x in seq) + 1
+        highest = sum(x <= newest for x in seq)
+    else:
+        lowest = sum(x > newest for x in seq) + 1
+        highest = sum(x >= newest for x in seq)
+    rank = {"min": lowest, "max": highest, "average": (lowest + highest) / 2}[method]
+    return rank / len(seq) if pct else rank
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        [3, 0, 1, 7, 2],
+        [5, 5, 1, 5, 1, 1, 5, 5, 5, 1, 1, 1, 5],
+        [0.5, -1.25, 0.5, 3.0, 2.75, -1.25, 0.0, 9.5],
+        [1],
+        [],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 6])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("method", ["average", "min", "max"])
+@pytest.mark.parametrize("pct", [False, True])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("algorithm", ["skiplist", "sortedblocks"])
+def test_rolling_rank(
+    array, window_size, window_type, method, pct, ascending, algorithm
+):
+    got = Rank(
+        array,
+        window_size,
+        window_type=window_type,
+        pct=pct,
+        method=method,
+        ascending=ascending,
+        algorithm=algorithm,
+    )
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda seq: _rank(seq, pct, method, ascending),
+        window_type=window_type,
+    )
+    assert pytest.approx(list(got)) == list(expected)
+
+
+@pytest.mark.parametrize("kwargs", [{"method": "dense"}, {"algorithm": "heaps"}])
+def test_rolling_rank_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        Rank([1, 2, 3], 2, **kwargs)
+
+
+def _trimmed_mean(seq, proportiontocut):
+    values = sorted(seq)
+    cut = int(proportiontocut * len(values))
+    return _mean(values[cut : len(values) - cut])
+
+
+def _winsorized_mean(seq, lower, upper):
+    values = sorted(seq)
+    n = len(values)
+    lo, hi = int(lower * n), n - int(upper * n)
+    return _mean([values[lo]] * lo + values[lo:hi] + [values[hi - 1]] * (n - hi))
+
+
+ROBUST_ARRAYS = [
+    [3, 0, 1, 7, 2],
+    [3, -8, 1, 7, -2, 8, 1, -7, -2, 9, 3, 100, -50, 4, 4, 4],
+    [0.5, -1.25, 0.5, 3.0, 2.75, -1.25, 0.0, 9.5],
+    [1],
+    [],
+]
+
+
+@pytest.mark.parametrize("array", ROBUST_ARRAYS)
+@pytest.mark.parametrize("window_size", [1, 2, 5, 10])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("proportiontocut", [0, 0.1, 0.25, 0.4])
+def test_rolling_trimmed_mean(array, window_size, window_type, proportiontocut):
+    got = TrimmedMean(
+        array, window_size, window_type=window_type, proportiontocut=proportiontocut
+    )
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda seq: _trimmed_mean(seq, proportiontocut),
+        window_type=window_type,
+    )
+    assert pytest.approx(list(got)) == list(expected)
+
+
+@pytest.mark.parametrize("array", ROBUST_ARRAYS)
+@pytest.mark.parametrize("window_size", [1, 2, 5, 10])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("limits", [0, 0.1, 0.3, (0.2, 0), (0, 0.45)])
+def test_rolling_winsorized_mean(array, window_size, window_type, limits):
+    lower, upper = limits if isinstance(limits, tuple) else (limits, limits)
+    got = WinsorizedMean(array, window_size, window_type=window_type, limits=limits)
+    expected = Apply(
+        array,
+        window_size,
+        operation=lambda seq: _winsorized_mean(seq, lower, upper),
+        window_type=window_type,
+    )
+    assert pytest.approx(list(got)) == list(expected)
+
+
+@pytest.mark.parametrize("proportiontocut", [-0.1, 0.5])
+def test_rolling_trimmed_mean_invalid_proportion(proportiontocut):
+    with pytest.raises(ValueError):
+        TrimmedMean([1, 2, 3], 2, proportiontocut=proportiontocut)
+
+
+@pytest.mark.parametrize("limits", [-0.1, 0.5, (0.6, 0.4)])
+def test_rolling_winsorized_mean_invalid_limits(limits):
+    with pytest.raises(ValueError):
+        WinsorizedMean([1, 2, 3], 2, limits=limits)
+
+
+def _mad(seq):
+    median = _median(seq)
+    return _median([abs(x - median) for x in seq])
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        [3, 0, 1, 7, 2],
+        [3, -8, 1, 7, -2, 8, 1, -7, -2, 9, 3, 100, -50, 4, 4, 4],
+        [5, 5, 1, 5, 1, 1, 5, 5, 5, 1, 1, 1, 5],
+        [0.5, -1.25, 0.5, 3.0, 2.75, -1.25, 0.0, 9.5],
+        [(i * 7919) % 113 - 50 for i in range(200)],
+        [1],
+        [],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 3, 4, 7, 50])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("algorithm", ["skiplist", "sortedblocks"])
+def test_rolling_mad(array, window_size, window_type, algorithm):
+    got = MAD(array, window_size, window_type=window_type, algorithm=algorithm)
+    expected = Apply(array, window_size, operation=_mad, window_type=window_type)
+    assert pytest.approx(list(got)) == list(expected)
+
+
+@pytest.mark.parametrize("cls", [TrimmedMean, WinsorizedMean])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize(
+    "option", [{"algorithm": "heaps"}, {"algorithm": "skiplist"}, {"domain": (0, 9)}]
+)
+def test_rolling_trimmed_means_algorithm_not_supported(cls, window_type, option):
+    with pytest.raises(ValueError):
+        cls([1, 2, 3], 2, window_type=window_type, **option)
+
+
+def test_rolling_mad_heaps_not_supported():
+    with pytest.raises(ValueError):
+        MAD([1, 2, 3], 2, algorithm="heaps")
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        [3, 0, 1, 7, 2],
+        [5, 5, 1, 5, 1, 1, 5, 5, 5, 1, 1, 1, 5],
+        [(i * 7919) % 23 - 10 for i in range(200)],
+        [1],
+        [],
+    ],
+)
+@pytest.mark.parametrize("window_size", [1, 2, 5, 50])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize(
+    "cls, kwargs",
+    [
+        (Median, {}),
+        (Quantile, {"q": [0, 0.1, 0.5, 1]}),
+        (Rank, {"pct": True}),
+        (MAD, {}),
+    ],
+)
+def test_rolling_order_statistics_with_domain(
+    array, window_size, window_type, cls, kwargs
+):
+    got = cls(array, window_size, window_type=window_type, domain=(-10, 12), **kwargs)
+    expected = cls(array, window_size, window_type=window_type, **kwargs)
+    assert list(got) == list(expected)
+
+
+def test_rolling_median_value_outside_domain():
+    with pytest.raises(ValueError):
+        list(Median([1, 2, 9], 2, domain=(0, 5)))
+
+
 @pytest.mark.parametrize("array", ["aasbbdasbfiuhf", "xxyxz", "x", ""])
 @pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5])
 @pytest.mark.parametrize("window_type", ["fixed", "variable"])
@@ -329,3 +688,148 @@ def test_rolling_kurtosis(array, window_size, window_type):
     got = Kurtosis(array, window_size, window_type=window_type)
     expected = Apply(array, window_size, operation=_kurtosis, window_type=window_type)
     assert pytest.approx(list(got), nan_ok=True) == list(expected)
+
+
+def _cov(pairs, ddof=1):
+    n = len(pairs)
+    if n <= ddof:
+        return float("nan")
+    mean_x = sum(x for x, _ in pairs) / n
+    mean_y = sum(y for _, y in pairs) / n
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / (n - ddof)
+
+
+def _corr(pairs):
+    sxx, syy = _cov([(x, x) for x, _ in pairs], 0), _cov([(y, y) for _, y in pairs], 0)
+    if len(pairs) < 2 or sxx * syy <= 1e-12:
+        return float("nan")
+    return _cov(pairs, 0) / sqrt(sxx * syy)
+
+
+def _pairs(size, seed):
+    rng = random.Random(seed)
+    return [(rng.randint(-20, 20), rng.uniform(-5, 5)) for _ in range(size)]
+
+
+@pytest.mark.parametrize("size", [0, 1, 5, 60])
+@pytest.mark.parametrize("window_size", [2, 3, 7, 20])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("ddof", [0, 1])
+def test_rolling_cov(size, window_size, window_type, ddof):
+    pairs = _pairs(size, window_size)
+    got = Cov(pairs, window_size, window_type=window_type, ddof=ddof)
+    expected = Apply(
+        pairs, window_size, operation=lambda w: _cov(w, ddof), window_type=window_type
+    )
+    assert pytest.approx(list(got), nan_ok=True) == list(expected)
+
+
+def test_rolling_cov_of_equal_values_is_var():
+    array = [3, 5, 1, 4, 1, 9, 2, 6]
+    got = Cov(zip(array, array), 4)
+    assert pytest.approx(list(got)) == list(Var(array, 4))
+
+
+def test_rolling_cov_ddof_must_be_less_than_window_size():
+    with pytest.raises(ValueError):
+        Cov([(1, 2)], 2, ddof=2)
+
+
+@pytest.mark.parametrize("size", [0, 5, 60])
+@pytest.mark.parametrize("window_size", [2, 3, 7, 20])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_corr(size, window_size, window_type):
+    pairs = _pairs(size, window_size)
+    got = Corr(pairs, window_size, window_type=window_type)
+    expected = Apply(pairs, window_size, operation=_corr, window_type=window_type)
+    assert pytest.approx(list(got), nan_ok=True) == list(expected)
+
+
+@pytest.mark.parametrize("window_size", [3, 7, 20])
+def test_rolling_linreg(window_size):
+    pairs = [(x + 0.5 * y, y) for x, y in _pairs(60, window_size)]
+    for result, window in zip(
+        LinReg(pairs, window_size), Apply(pairs, window_size, operation=list)
+    ):
+        slope = _cov(window) / _cov([(x, x) for x, _ in window])
+        mean_x = sum(x for x, _ in window) / window_size
+        mean_y = sum(y for _, y in window) / window_size
+        assert result.slope == pytest.approx(slope)
+        assert result.intercept == pytest.approx(mean_y - slope * mean_x)
+        assert result.rsquared == pytest.approx(_corr(window) ** 2)
+
+
+def test_rolling_linreg_of_line():
+    pairs = [(x, 2 * x + 1) for x in range(10)]
+    for result in LinReg(pairs, 4):
+        assert result == pytest.approx((2, 1, 1))
+
+
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+@pytest.mark.parametrize("c", [0, 2, 0.1, -3.7])
+def test_rolling_corr_constant_after_sliding(window_type, c):
+    # values leaving the window must not leave rounding errors behind
+    rng = random.Random(2)
+    ys = [rng.uniform(-10, 10) for _ in range(5)] + [c] * 4
+    pairs = [(rng.uniform(-5, 5), y) for y in ys]
+    windows = Apply(pairs, 3, operation=list, window_type=window_type)
+    corr = Corr(pairs, 3, window_type=window_type)
+    reg = LinReg(pairs, 3, window_type=window_type)
+    constant = 0
+    for window, r, result in zip(windows, corr, reg):
+        if len(window) > 1 and all(y == c for _, y in window):
+            constant += 1
+            assert isnan(r)
+            assert result.slope == 0
+            assert result.intercept == c
+            assert isnan(result.rsquared)
+    assert constant >= 2
+
+
+def test_rolling_linreg_constant_x_is_nan():
+    result = next(LinReg([(1, 2), (1, 3), (1, 4)], 3))
+    assert all(isnan(value) for value in result)
+
+
+def test_rolling_cov_expanding():
+    pairs = _pairs(30, 0)
+    got = Corr(pairs, window_type="expanding", min_periods=2)
+    expected = [_corr(pairs[:n]) for n in range(2, 31)]
+    assert pytest.approx(list(got), nan_ok=True) == expected
+
+
+def _weighted_mean(window):
+    total = sum(weight for _, weight in window)
+    if not total:
+        return float("nan")
+    return sum(value * weight for value, weight in window) / total
+
+
+@pytest.mark.parametrize("size", [0, 1, 5, 60])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 7, 20])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_weighted_mean(size, window_size, window_type):
+    rng = random.Random(window_size)
+    pairs = [(rng.uniform(-5, 5), rng.randint(0, 10)) for _ in range(size)]
+    got = WeightedMean(pairs, window_size, window_type=window_type)
+    expected = Apply(
+        pairs, window_size, operation=_weighted_mean, window_type=window_type
+    )
+    assert pytest.approx(list(got), nan_ok=True) == list(expected)
+
+
+def test_rolling_weighted_mean_zero_weights_is_nan():
+    got = list(WeightedMean([(1, 0), (2, 0), (3, 1)], 2))
+    assert isnan(got[0])
+    assert got[1] == 3
+
+
+def test_rolling_weighted_mean_expanding():
+    pairs = [(10.0, 100), (10.5, 300), (10.25, 200), (11.0, 100)]
+    got = WeightedMean(pairs, window_type="expanding", min_periods=2)
+    expected = [_weighted_mean(pairs[:n]) for n in range(2, 5)]
+    assert pytest.approx(list(got)) == expected
+
+
+def test_vwap_is_weighted_mean():
+    assert VWAP is WeightedMean
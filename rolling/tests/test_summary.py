@@ -0,0 +1,101 @@
+from functools import reduce
+
+import pytest
+
+from rolling.arithmetic import Sum, Nunique
+from rolling.logical import All, Any
+from rolling.minmax import Min, Max, MinHeap
+from rolling.stats import Mean, Var, Std
+from rolling.summary import (
+    SumSummary,
+    MeanSummary,
+    VarSummary,
+    StdSummary,
+    MinSummary,
+    MaxSummary,
+    AnySummary,
+    AllSummary,
+    NuniqueSummary,
+)
+
+ARRAY = [82, 80, 14, 73, 9, 19, 60, 31, 4, 87, 38, 36, 38, 58, 20, 97, 25]
+BOOLS = [0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1]
+
+SUMMARIES = [
+    (SumSummary, sum, ARRAY),
+    (MeanSummary, lambda x: sum(x) / len(x), ARRAY),
+    (VarSummary, lambda x: VarSummary.from_iterable(x).value, ARRAY),
+    (StdSummary, lambda x: StdSummary.from_iterable(x).value, ARRAY),
+    (MinSummary, min, ARRAY),
+    (MaxSummary, max, ARRAY),
+    (AnySummary, any, BOOLS),
+    (AllSummary, all, BOOLS),
+    (NuniqueSummary, lambda x: len(set(x)), [v % 7 for v in ARRAY]),
+]
+
+
+@pytest.mark.parametrize("summary_type,func,array", SUMMARIES)
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 17])
+def test_merge_blocks(summary_type, func, array, block_size):
+    blocks = [array[i : i + block_size] for i in range(0, len(array), block_size)]
+    parts = [summary_type.from_iterable(block) for block in blocks]
+    got = reduce(summary_type.merge, parts)
+    assert pytest.approx(got.value) == func(array)
+
+
+@pytest.mark.parametrize("summary_type,func,array", SUMMARIES)
+def test_merge_is_associative(summary_type, func, array):
+    a, b, c = (summary_type.from_iterable(array[i::3]) for i in range(3))
+    left = a.merge(b).merge(c)
+    right = a.merge(b.merge(c))
+    assert pytest.approx(left.value) == right.value
+
+
+@pytest.mark.parametrize("summary_type,func,array", SUMMARIES)
+def test_merge_with_empty(summary_type, func, array):
+    empty = summary_type.from_iterable([])
+    full = summary_type.from_iterable(array)
+    assert pytest.approx(empty.merge(full).value) == full.value
+    assert pytest.approx(full.merge(empty).value) == full.value
+
+
+def test_var_summary_merge():
+    left = VarSummary.from_iterable([3, 1, 4, 1])
+    right = VarSummary.from_iterable([5, 9, 2, 6])
+    merged = left.merge(right)
+    assert merged.obs == 8
+    assert pytest.approx(merged.mean) == 3.875
+    assert pytest.approx(merged.value) == 7.553571428571429
+
+
+@pytest.mark.parametrize(
+    "rolling_type,summary_type,array",
+    [
+        (Sum, SumSummary, ARRAY),
+        (Mean, MeanSummary, ARRAY),
+        (Var, VarSummary, ARRAY),
+        (Std, StdSummary, ARRAY),
+        (Min, MinSummary, ARRAY),
+        (MinHeap, MinSummary, ARRAY),
+        (Max, MaxSummary, ARRAY),
+        (Any, AnySummary, BOOLS),
+        (All, AllSummary, BOOLS),
+        (Nunique, NuniqueSummary, [v % 7 for v in ARRAY]),
+    ],
+)
+@pytest.mark.parametrize("window_size", [2, 3, 5])
+@pytest.mark.parametrize("window_type", ["fixed", "variable"])
+def test_rolling_summary(rolling_type, summary_type, array, window_size, window_type):
+    r = rolling_type(array, window_size, window_type=window_type)
+    summaries = []
+    for value in r:
+        summary = r.summary()
+        assert isinstance(summary, summary_type)
+        assert pytest.approx(summary.value, nan_ok=True) == value
+        summaries.append(summary)
+    # merging the summaries of two disjoint fixed windows
+    # gives the summary of the concatenated window
+    if window_type == "fixed" and len(summaries) > window_size:
+        merged = summaries[0].merge(summaries[window_size])
+        expected = summary_type.from_iterable(array[: 2 * window_size])
+        assert pytest.approx(merged.value, nan_ok=True) == expected.value
@@ -40,7 +40,8 @@ setup(
     python_requires='>=3.4.0',
     author='Alex Riley',
     license='MIT',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks']),
     tests_require=['pytest>=2.8.0'],
+    extras_require={'numpy': ['numpy']},
     zip_safe=False,
 )